@@ -0,0 +1,110 @@
+"""
+Kernels for the enhanced validation framework: Monte Carlo sampling and
+convergence, and the IQR outlier test for cross-validation.
+
+Kept apart from the calculation-method kernels because the simulation driver
+is compiled with ``parallel=True``, which only the enhanced validation
+framework should pay for. Compilation happens in ``warm_up``, on first use.
+"""
+import math
+
+import numpy as np
+
+from ._kernels import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True, nogil=True)
+def _pmi_kernel(avg_temp, sampled_add, sampled_base_temp, specimen_length, typical_length_mm):
+    """PMI in days for one set of sampled parameters (NaN marks a missing length)."""
+    # Apply specimen length adjustment if provided
+    if not math.isnan(specimen_length) and not math.isnan(typical_length_mm):
+        length_ratio = specimen_length / typical_length_mm
+        # Smaller specimens, less development; larger specimens, more development
+        if length_ratio < 0.8:
+            sampled_add *= 0.7
+        elif length_ratio > 1.2:
+            sampled_add *= 1.3
+
+    # Minimal effective temperature at or below the base temperature
+    if avg_temp <= sampled_base_temp:
+        effective_temp = 0.5
+    else:
+        effective_temp = avg_temp - sampled_base_temp
+
+    return sampled_add / effective_temp
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _mc_driver(n, avg_temp, temp_std, mid_add, add_std, base_temp, base_std,
+               length, length_std, typical_length_mm):
+    """Draw ``n`` parameter sets and return their PMI samples."""
+    out = np.empty(n)
+    for i in prange(n):
+        sampled_temp = np.random.normal(avg_temp, temp_std)
+        sampled_add = max(0.1, np.random.normal(mid_add, add_std))
+        sampled_base_temp = max(0.0, np.random.normal(base_temp, base_std))
+        if math.isnan(length):
+            sampled_length = math.nan
+        else:
+            sampled_length = max(0.1, np.random.normal(length, length_std))
+        out[i] = _pmi_kernel(sampled_temp, sampled_add, sampled_base_temp,
+                             sampled_length, typical_length_mm)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _converged_length(samples, window, threshold):
+    """
+    Number of samples to keep after the convergence check.
+
+    Replays the check as if samples were drawn one by one: every ``window``
+    samples (from ``2 * window + 1`` on) the mean of the latest window is
+    compared with the one before it, and the run stops at the first checkpoint
+    where the relative change is below ``threshold``. Returns ``len(samples)``
+    if it never converges.
+    """
+    n = len(samples)
+    used = 2 * window + 1
+    if n < used:
+        return n
+
+    # Equal-sized windows, so the relative change of their sums is that of their means
+    previous_sum = samples[used - 2 * window:used - window].sum()
+    recent_sum = samples[used - window:used].sum()
+    while True:
+        if previous_sum != 0 and abs(recent_sum - previous_sum) / previous_sum < threshold:
+            return used
+        if used + window > n:
+            return n
+        previous_sum = recent_sum
+        recent_sum = samples[used:used + window].sum()
+        used += window
+
+
+@njit(cache=True, nogil=True)
+def _outlier_mask(estimates, q1, q3):
+    """Flag estimates outside the 1.5 * IQR fences."""
+    iqr = q3 - q1
+    lower_bound = q1 - 1.5 * iqr
+    upper_bound = q3 + 1.5 * iqr
+
+    mask = np.empty(len(estimates), dtype=np.bool_)
+    for i in range(len(estimates)):
+        mask[i] = estimates[i] < lower_bound or estimates[i] > upper_bound
+    return mask
+
+
+def warm_up():
+    """
+    Compile the kernels (or load them from Numba's on-disk cache).
+
+    Called when the first EnhancedValidator is created rather than at import,
+    so importing the validation module for its data classes stays cheap.
+    Does nothing without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    _mc_driver(4, 25.0, 1.0, 70.0, 14.0, 10.0, 1.0, 15.0, 1.5, 17.0)
+    _mc_driver(4, 25.0, 1.0, 70.0, 14.0, 10.0, 1.0, math.nan, 0.0, math.nan)
+    _converged_length(np.ones(5), 2, 0.01)
+    _outlier_mask(np.array([1.0, 2.0, 3.0, 10.0]), 1.75, 4.75)
@@ -2,11 +2,18 @@
 Alternative PMI calculation methods for forensic entomology.
 """
 import math
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+import numpy as np
+
 from .models import ForensicSpecies, CalliphoridaeSpecies, DevelopmentStage, get_development_threshold
+from ._kernels import (
+    _estimate_add_kernel, _add_standard_kernel, _add_adjusted_kernel, _adh_kernel,
+    _isomegalen_kernel, _thermal_summation_kernel, _development_rate_kernel
+)
 
 
 class PMIMethod(Enum):
@@ -20,28 +27,261 @@ class PMIMethod(Enum):
     DEVELOPMENT_RATE = "development_rate"  # Development rate modeling
 
 
+# Method lookup by value, for parsing user-supplied method names
+PMI_METHODS_BY_NAME = {method.value: method for method in PMIMethod}
+
+
+# Fixed assumptions and limitations reported with each method's estimates
+_ASSUMPTIONS = {
+    PMIMethod.ADD_STANDARD: (
+        "Constant temperature during development",
+        "Linear relationship between temperature and development rate",
+        "Laboratory-derived development data applies to field conditions",
+    ),
+    PMIMethod.ADD_OPTIMISTIC: (
+        "Optimal development conditions",
+        "Fastest possible development rate",
+        "No environmental delays",
+    ),
+    PMIMethod.ADD_CONSERVATIVE: (
+        "Suboptimal development conditions",
+        "Environmental factors slow development",
+        "Conservative temperature estimates",
+    ),
+    PMIMethod.ADH_METHOD: (
+        "Hourly temperature precision is meaningful",
+        "Linear development rate within temperature range",
+        "Short-term temperature fluctuations matter",
+    ),
+    PMIMethod.ISOMEGALEN_METHOD: (
+        "Specimen length accurately reflects development stage",
+        "Length-development relationship is linear",
+        "Individual variation is minimal",
+    ),
+    PMIMethod.THERMAL_SUMMATION: (
+        "Non-linear temperature-development relationship",
+        "Temperature stress affects development rate",
+        "Optimal temperature exists for each species",
+    ),
+    PMIMethod.DEVELOPMENT_RATE: (
+        "Linear relationship between temperature and development rate",
+        "Development rate constant is species-specific",
+        "Reference temperature data is accurate",
+    ),
+}
+
+_LIMITATIONS = {
+    PMIMethod.ADD_STANDARD: (
+        "Does not account for temperature fluctuations",
+        "Assumes optimal development conditions",
+        "Species-specific data may be limited",
+    ),
+    PMIMethod.ADD_OPTIMISTIC: (
+        "Represents absolute minimum PMI",
+        "Rarely achieved in field conditions",
+        "Does not account for realistic delays",
+    ),
+    PMIMethod.ADD_CONSERVATIVE: (
+        "May overestimate PMI",
+        "Accounts for worst-case scenarios",
+        "Less precise than standard methods",
+    ),
+    PMIMethod.ADH_METHOD: (
+        "Requires more precise temperature data",
+        "May be over-precise for long PMI periods",
+        "Computation complexity vs. benefit trade-off",
+    ),
+    PMIMethod.ISOMEGALEN_METHOD: (
+        "Requires accurate length measurements",
+        "High individual variation in length",
+        "Limited validation data for all species",
+    ),
+    PMIMethod.THERMAL_SUMMATION: (
+        "Optimal temperature estimates may be imprecise",
+        "Stress factors are species-dependent",
+        "Limited validation in extreme temperatures",
+    ),
+    PMIMethod.DEVELOPMENT_RATE: (
+        "Simplified model may not capture complex biology",
+        "Rate constant estimates may be imprecise",
+        "Does not account for developmental non-linearities",
+    ),
+}
+
+
+@dataclass
+class AddStandardDetails:
+    """Calculation details for the standard ADD method."""
+    __slots__ = ('add_required', 'effective_temperature', 'base_temperature')
+    method: ClassVar[str] = 'Accumulated Degree Days'
+    
+    add_required: float
+    effective_temperature: float
+    base_temperature: float
+
+
+@dataclass
+class OptimisticAddDetails:
+    """Calculation details for the optimistic ADD method."""
+    __slots__ = ('add_required', 'effective_temperature', 'temperature_adjustment')
+    method: ClassVar[str] = 'Optimistic ADD (Minimum PMI)'
+    
+    add_required: float
+    effective_temperature: float
+    temperature_adjustment: float
+
+
+@dataclass
+class ConservativeAddDetails(OptimisticAddDetails):
+    """Calculation details for the conservative ADD method."""
+    __slots__ = ()
+    method: ClassVar[str] = 'Conservative ADD (Maximum PMI)'
+
+
+@dataclass
+class AdhDetails:
+    """Calculation details for the accumulated degree hours method."""
+    __slots__ = ('adh_required', 'effective_temperature')
+    method: ClassVar[str] = 'Accumulated Degree Hours'
+    hourly_precision: ClassVar[bool] = True
+    
+    adh_required: float
+    effective_temperature: float
+
+
+@dataclass
+class IsomegalenDetails:
+    """Calculation details for the length-based isomegalen method."""
+    __slots__ = ('specimen_length', 'typical_length', 'length_ratio', 'adjusted_add')
+    method: ClassVar[str] = 'Isomegalen Diagram (Length-based)'
+    
+    specimen_length: float
+    typical_length: float
+    length_ratio: float
+    adjusted_add: float
+
+
+@dataclass
+class ThermalSummationDetails:
+    """Calculation details for the non-linear thermal summation method."""
+    __slots__ = ('optimal_temperature', 'temperature_efficiency', 'stress_adjusted')
+    method: ClassVar[str] = 'Non-linear Thermal Summation'
+    
+    optimal_temperature: float
+    temperature_efficiency: float
+    stress_adjusted: bool
+
+
+@dataclass
+class DevelopmentRateDetails:
+    """Calculation details for the development rate model."""
+    __slots__ = ('development_rate', 'rate_constant', 'reference_temperature')
+    method: ClassVar[str] = 'Development Rate Modeling'
+    
+    development_rate: float
+    rate_constant: float
+    reference_temperature: float
+
+
 @dataclass
 class PMIEstimate:
     """PMI estimate from a specific method."""
+    __slots__ = ('method', 'pmi_days', 'pmi_hours', 'confidence_low', 'confidence_high',
+                 'reliability_score', 'assumptions', 'limitations', 'calculation_details')
+    
     method: PMIMethod
     pmi_days: float
     pmi_hours: float
     confidence_low: float
     confidence_high: float
     reliability_score: float  # 0-100 score for method reliability
-    assumptions: List[str]
-    limitations: List[str]
-    calculation_details: Dict
+    assumptions: Tuple[str, ...]
+    limitations: Tuple[str, ...]
+    calculation_details: Any  # one of the *Details records above
 
 
 @dataclass
 class ComparativeResult:
     """Results from multiple PMI methods."""
+    __slots__ = ('estimates', 'consensus_estimate', 'method_agreement',
+                 'reliability_assessment', 'recommendations')
+    
     estimates: List[PMIEstimate]
     consensus_estimate: Dict
     method_agreement: Dict
     reliability_assessment: Dict
     recommendations: List[str]
+    
+    @property
+    def reliability_factors(self) -> List[str]:
+        """Human-readable reliability factors, formatted on access."""
+        reliability = self.reliability_assessment
+        return [
+            f"Average method reliability: {reliability['average_method_reliability']:.1f}/100",
+            f"Temperature suitability: {reliability['temperature_suitability']:.1f}/100",
+            f"Method diversity: {reliability['method_diversity']} methods"
+        ]
+
+
+def _copy_result(result: ComparativeResult) -> ComparativeResult:
+    """Copy a cached comparative result down to its mutable parts."""
+    consensus = dict(result.consensus_estimate)
+    if 'methods_used' in consensus:
+        consensus['methods_used'] = list(consensus['methods_used'])
+    return ComparativeResult(
+        estimates=[replace(estimate, calculation_details=replace(estimate.calculation_details))
+                   for estimate in result.estimates],
+        consensus_estimate=consensus,
+        method_agreement=dict(result.method_agreement),
+        reliability_assessment=dict(result.reliability_assessment),
+        recommendations=list(result.recommendations)
+    )
+
+
+class _ThresholdValues(NamedTuple):
+    """Development threshold fields used by the method kernels."""
+    base_temp: float
+    min_add: float
+    max_add: float
+    typical_length: float  # NaN when the stage has no typical length
+
+
+def _as_float(value: Optional[float]) -> float:
+    """Convert an optional measurement to a kernel argument (NaN when missing)."""
+    return math.nan if value is None else float(value)
+
+
+def _threshold_values(species: ForensicSpecies, stage: DevelopmentStage) -> _ThresholdValues:
+    """Look up the development threshold for a species and stage as plain floats."""
+    threshold = get_development_threshold(species, stage)
+    return _ThresholdValues(
+        threshold.base_temp, threshold.min_add, threshold.max_add,
+        _as_float(threshold.typical_length_mm)
+    )
+
+
+def _thermal_effective_temp(avg_temp, base_temp: float, optimal_temp: float,
+                            max_temp: float) -> np.ndarray:
+    """
+    Non-linear effective temperature used by the thermal summation method.
+
+    Accepts a scalar or an array of average temperatures (e.g. an hourly
+    trace). Temperatures at or below base_temp contribute nothing; up to
+    optimal_temp efficiency rises linearly; above it heat stress reduces the
+    effective temperature by up to 30% at max_temp.
+    """
+    avg_temp = np.asarray(avg_temp, dtype=np.float64)
+    optimal_offset = optimal_temp - base_temp
+
+    return np.piecewise(
+        avg_temp,
+        [avg_temp <= base_temp,
+         (avg_temp > base_temp) & (avg_temp <= optimal_temp),
+         avg_temp > optimal_temp],
+        [0.0,
+         lambda t: (t - base_temp) ** 2 / optimal_offset,
+         lambda t: optimal_offset * (1.0 - 0.3 * np.clip((t - optimal_temp) / (max_temp - optimal_temp), 0.0, 1.0))]
+    )
 
 
 class AlternativePMICalculator:
@@ -49,6 +289,9 @@ class AlternativePMICalculator:
     Calculator implementing multiple PMI estimation methods.
     """
     
+    # Comparative results kept per calculator by calculate_all_methods
+    RESULTS_CACHE_SIZE = 1024
+    
     def __init__(self):
         # Method reliability weights (0-1)
         self.method_weights = {
@@ -66,12 +309,30 @@ class AlternativePMICalculator:
             PMIMethod.ADD_OPTIMISTIC: 1.15,  # Assume 15% faster development
             PMIMethod.ADD_CONSERVATIVE: 0.85,  # Assume 15% slower development
         }
+        self._opt_factor = self.temp_adjustments[PMIMethod.ADD_OPTIMISTIC]
+        self._cons_factor = self.temp_adjustments[PMIMethod.ADD_CONSERVATIVE]
+        
+        # Method calculators, keyed by method
+        self._dispatch = {
+            PMIMethod.ADD_STANDARD: self._calculate_add_standard,
+            PMIMethod.ADD_OPTIMISTIC: self._calculate_add_optimistic,
+            PMIMethod.ADD_CONSERVATIVE: self._calculate_add_conservative,
+            PMIMethod.ADH_METHOD: self._calculate_adh_method,
+            PMIMethod.ISOMEGALEN_METHOD: self._calculate_isomegalen_method,
+            PMIMethod.THERMAL_SUMMATION: self._calculate_thermal_summation,
+            PMIMethod.DEVELOPMENT_RATE: self._calculate_development_rate
+        }
+        
+        # Comparative results are deterministic in their inputs; memoize them
+        # per calculator for repeated scenario/bootstrap evaluations
+        self._results_cache: Dict[tuple, ComparativeResult] = {}
     
     def calculate_all_methods(self, species: ForensicSpecies, 
                             stage: DevelopmentStage,
                             temperature_data: Dict,
                             specimen_length: Optional[float] = None,
-                            methods: Optional[List[PMIMethod]] = None) -> ComparativeResult:
+                            methods: Optional[List[PMIMethod]] = None,
+                            parallel: bool = False) -> ComparativeResult:
         """
         Calculate PMI using multiple methods and compare results.
         
@@ -81,24 +342,60 @@ class AlternativePMICalculator:
             temperature_data: Temperature data
             specimen_length: Optional specimen length
             methods: List of methods to use (all if None)
+            parallel: Evaluate the methods on a thread pool. Only worth it
+                when the Numba kernels are compiled (they release the GIL);
+                in pure-Python mode the pool overhead makes it slower.
             
         Returns:
             ComparativeResult with all method estimates
+            
+        Results are cached per calculator on (species, stage, avg_temp,
+        specimen_length, methods), with avg_temp rounded to 6 decimals, so
+        reuse one calculator wherever inputs repeat. Only
+        temperature_data['avg_temp'] is part of the key, so any other field
+        a method starts reading must be added to it. Each call returns its
+        own copy of the result, which callers are free to modify.
         """
-        if methods is None:
-            methods = list(PMIMethod)
+        methods_key = tuple(PMIMethod) if methods is None else tuple(methods)
+        avg_temp = round(float(temperature_data['avg_temp']), 6)
+        key = (species, stage, avg_temp, specimen_length, methods_key)
+        
+        result = self._results_cache.get(key)
+        if result is None:
+            result = self._calculate_all(species, stage, avg_temp, specimen_length,
+                                         methods_key, parallel)
+            if len(self._results_cache) >= self.RESULTS_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._results_cache[next(iter(self._results_cache))]
+            self._results_cache[key] = result
+        
+        return _copy_result(result)
+    
+    def _calculate_all(self, species: ForensicSpecies, stage: DevelopmentStage,
+                       avg_temp: float, specimen_length: Optional[float],
+                       methods: Tuple[PMIMethod, ...], parallel: bool = False) -> ComparativeResult:
+        """Uncached body of calculate_all_methods."""
+        temperature_data = {'avg_temp': avg_temp}
         
-        estimates = []
+        # Look the thresholds up once and share them with every method
+        tvals = _threshold_values(species, stage)
         
-        for method in methods:
+        def calculate(method):
             try:
-                estimate = self._calculate_method(
-                    method, species, stage, temperature_data, specimen_length
+                return self._calculate_method(
+                    method, species, stage, temperature_data, specimen_length, tvals
                 )
-                estimates.append(estimate)
-            except Exception as e:
+            except Exception:
                 # Skip methods that fail
-                continue
+                return None
+        
+        if parallel and len(methods) >= 4:
+            with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+                results = list(executor.map(calculate, methods))
+        else:
+            results = [calculate(method) for method in methods]
+        
+        estimates = [estimate for estimate in results if estimate is not None]
         
         if not estimates:
             raise ValueError("No PMI methods could be calculated successfully")
@@ -106,7 +403,7 @@ class AlternativePMICalculator:
         # Generate comparative analysis
         consensus = self._generate_consensus(estimates)
         agreement = self._assess_method_agreement(estimates)
-        reliability = self._assess_reliability(estimates, species, stage, temperature_data)
+        reliability = self._assess_reliability(estimates, species, stage, temperature_data, tvals)
         recommendations = self._generate_recommendations(estimates, agreement, reliability)
         
         return ComparativeResult(
@@ -116,42 +413,117 @@ class AlternativePMICalculator:
             reliability_assessment=reliability,
             recommendations=recommendations
         )
-    
+
+    def calculate_all_methods_batch(self, species: ForensicSpecies,
+                                    stage: DevelopmentStage,
+                                    temps: np.ndarray,
+                                    lengths: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate PMI with every method for a batch of specimens at once.
+
+        Vectorized counterpart of calculate_all_methods for case loads and
+        Monte Carlo sampling. Only PMI days are computed; methods that cannot
+        be applied to a specimen (temperature too low, missing length for the
+        isomegalen method) yield NaN instead of raising.
+
+        Args:
+            species: Calliphoridae species
+            stage: Development stage
+            temps: Average temperatures (°C), one per specimen
+            lengths: Optional specimen lengths (mm); NaN marks a missing length
+
+        Returns:
+            Array of shape (n_specimens, n_methods) of PMI days, with columns
+            ordered as list(PMIMethod)
+        """
+        threshold = get_development_threshold(species, stage)
+        base_temp = threshold.base_temp
+        min_add = threshold.min_add
+        max_add = threshold.max_add
+        typical_length_mm = threshold.typical_length_mm
+
+        temps = np.asarray(temps, dtype=np.float64)
+        if lengths is None:
+            lengths = np.full(temps.shape, np.nan)
+        else:
+            lengths = np.asarray(lengths, dtype=np.float64)
+
+        span = max_add - min_add
+        mid_add = (min_add + max_add) / 2
+
+        # Stage ADD estimate (vectorized _estimate_add_for_stage); NaN lengths
+        # fail both comparisons and fall through to the midpoint
+        if typical_length_mm is None:
+            estimated_add = np.full(temps.shape, mid_add)
+        else:
+            ratio = lengths / typical_length_mm
+            estimated_add = np.select(
+                [ratio < 0.8, ratio > 1.2],
+                [min_add + 0.3 * span, min_add + 0.8 * span],
+                default=mid_add
+            )
+
+        effective_temp = temps - base_temp
+        valid = effective_temp > 0
+        safe_effective = np.where(valid, effective_temp, 1.0)
+
+        results = np.empty((temps.shape[0], len(PMIMethod)))
+
+        for column, method in enumerate(PMIMethod):
+            if method in (PMIMethod.ADD_STANDARD, PMIMethod.ADH_METHOD):
+                pmi = np.where(valid, estimated_add / safe_effective, np.nan)
+            elif method in (PMIMethod.ADD_OPTIMISTIC, PMIMethod.ADD_CONSERVATIVE):
+                adjusted = temps * self.temp_adjustments[method] - base_temp
+                required_add = min_add if method == PMIMethod.ADD_OPTIMISTIC else max_add
+                pmi = np.where(adjusted > 0, required_add / np.where(adjusted > 0, adjusted, 1.0), np.nan)
+            elif method == PMIMethod.ISOMEGALEN_METHOD:
+                typical_length = typical_length_mm or 15.0
+                length_ratio = lengths / typical_length
+                add_low, add_high = ((min_add + 0.3 * span, min_add + 0.8 * span)
+                                     if typical_length_mm is not None else (mid_add, mid_add))
+                adjusted_add = np.piecewise(
+                    length_ratio,
+                    [length_ratio > 1.2, length_ratio < 0.8],
+                    [lambda r: add_high * (0.8 + 0.4 * r),
+                     lambda r: add_low * (0.6 + 0.5 * r),
+                     mid_add]
+                )
+                pmi = np.where(valid & ~np.isnan(lengths), adjusted_add / safe_effective, np.nan)
+            elif method == PMIMethod.THERMAL_SUMMATION:
+                thermal_effective = _thermal_effective_temp(temps, base_temp, base_temp + 15, base_temp + 25)
+                pmi = np.where(valid, estimated_add / np.where(valid, thermal_effective, 1.0), np.nan)
+            else:  # PMIMethod.DEVELOPMENT_RATE
+                reference_offset = 20.0
+                pmi = np.where(valid, mid_add * reference_offset / safe_effective, np.nan)
+
+            results[:, column] = pmi
+
+        return results
+
     def _calculate_method(self, method: PMIMethod, species: ForensicSpecies,
                          stage: DevelopmentStage, temperature_data: Dict,
-                         specimen_length: Optional[float]) -> PMIEstimate:
+                         specimen_length: Optional[float],
+                         tvals: Optional[_ThresholdValues] = None) -> PMIEstimate:
         """Calculate PMI using a specific method."""
-        
-        if method == PMIMethod.ADD_STANDARD:
-            return self._calculate_add_standard(species, stage, temperature_data, specimen_length)
-        elif method == PMIMethod.ADD_OPTIMISTIC:
-            return self._calculate_add_optimistic(species, stage, temperature_data, specimen_length)
-        elif method == PMIMethod.ADD_CONSERVATIVE:
-            return self._calculate_add_conservative(species, stage, temperature_data, specimen_length)
-        elif method == PMIMethod.ADH_METHOD:
-            return self._calculate_adh_method(species, stage, temperature_data, specimen_length)
-        elif method == PMIMethod.ISOMEGALEN_METHOD:
-            return self._calculate_isomegalen_method(species, stage, temperature_data, specimen_length)
-        elif method == PMIMethod.THERMAL_SUMMATION:
-            return self._calculate_thermal_summation(species, stage, temperature_data, specimen_length)
-        elif method == PMIMethod.DEVELOPMENT_RATE:
-            return self._calculate_development_rate(species, stage, temperature_data, specimen_length)
-        else:
+        try:
+            calculate = self._dispatch[method]
+        except KeyError:
             raise ValueError(f"Unknown method: {method}")
+        
+        if tvals is None:
+            tvals = _threshold_values(species, stage)
+        
+        return calculate(species, stage, temperature_data, specimen_length, tvals)
     
     def _calculate_add_standard(self, species: ForensicSpecies, stage: DevelopmentStage,
-                               temperature_data: Dict, specimen_length: Optional[float]) -> PMIEstimate:
+                               temperature_data: Dict, specimen_length: Optional[float],
+                               tvals: _ThresholdValues) -> PMIEstimate:
         """Standard ADD method (existing implementation)."""
-        threshold = get_development_threshold(species, stage)
-        avg_temp = temperature_data['avg_temp']
-        effective_temp = avg_temp - threshold.base_temp
-        
-        if effective_temp <= 0:
-            raise ValueError(f"Temperature too low for development")
-        
         # Estimate ADD based on stage and specimen length
-        estimated_add = self._estimate_add_for_stage(threshold, specimen_length)
-        pmi_days = estimated_add / effective_temp
+        pmi_days, effective_temp, estimated_add = _add_standard_kernel(
+            tvals.base_temp, tvals.min_add, tvals.max_add,
+            temperature_data['avg_temp'], _as_float(specimen_length), tvals.typical_length
+        )
         pmi_hours = pmi_days * 24
         
         # Standard confidence interval (±20%)
@@ -164,40 +536,24 @@ class AlternativePMICalculator:
             confidence_low=max(0, pmi_days - confidence_range),
             confidence_high=pmi_days + confidence_range,
             reliability_score=85.0,
-            assumptions=[
-                "Constant temperature during development",
-                "Linear relationship between temperature and development rate",
-                "Laboratory-derived development data applies to field conditions"
-            ],
-            limitations=[
-                "Does not account for temperature fluctuations",
-                "Assumes optimal development conditions",
-                "Species-specific data may be limited"
-            ],
-            calculation_details={
-                'method': 'Accumulated Degree Days',
-                'add_required': estimated_add,
-                'effective_temperature': effective_temp,
-                'base_temperature': threshold.base_temp
-            }
+            assumptions=_ASSUMPTIONS[PMIMethod.ADD_STANDARD],
+            limitations=_LIMITATIONS[PMIMethod.ADD_STANDARD],
+            calculation_details=AddStandardDetails(
+                add_required=estimated_add,
+                effective_temperature=effective_temp,
+                base_temperature=tvals.base_temp
+            )
         )
     
     def _calculate_add_optimistic(self, species: ForensicSpecies, stage: DevelopmentStage,
-                                 temperature_data: Dict, specimen_length: Optional[float]) -> PMIEstimate:
+                                 temperature_data: Dict, specimen_length: Optional[float],
+                                 tvals: _ThresholdValues) -> PMIEstimate:
         """Optimistic ADD method (minimum PMI estimate)."""
-        threshold = get_development_threshold(species, stage)
-        avg_temp = temperature_data['avg_temp']
-        
-        # Apply optimistic temperature adjustment
-        adjusted_temp = avg_temp * self.temp_adjustments[PMIMethod.ADD_OPTIMISTIC]
-        effective_temp = adjusted_temp - threshold.base_temp
-        
-        if effective_temp <= 0:
-            raise ValueError(f"Temperature too low for development")
-        
-        # Use minimum ADD for stage
-        min_add = threshold.min_add
-        pmi_days = min_add / effective_temp
+        # Use minimum ADD for stage with optimistic temperature adjustment
+        min_add = tvals.min_add
+        pmi_days, effective_temp = _add_adjusted_kernel(
+            tvals.base_temp, min_add, temperature_data['avg_temp'], self._opt_factor
+        )
         pmi_hours = pmi_days * 24
         
         # Tighter confidence interval for minimum estimate
@@ -210,40 +566,24 @@ class AlternativePMICalculator:
             confidence_low=max(0, pmi_days - confidence_range),
             confidence_high=pmi_days + confidence_range,
             reliability_score=70.0,
-            assumptions=[
-                "Optimal development conditions",
-                "Fastest possible development rate",
-                "No environmental delays"
-            ],
-            limitations=[
-                "Represents absolute minimum PMI",
-                "Rarely achieved in field conditions",
-                "Does not account for realistic delays"
-            ],
-            calculation_details={
-                'method': 'Optimistic ADD (Minimum PMI)',
-                'add_required': min_add,
-                'effective_temperature': effective_temp,
-                'temperature_adjustment': self.temp_adjustments[PMIMethod.ADD_OPTIMISTIC]
-            }
+            assumptions=_ASSUMPTIONS[PMIMethod.ADD_OPTIMISTIC],
+            limitations=_LIMITATIONS[PMIMethod.ADD_OPTIMISTIC],
+            calculation_details=OptimisticAddDetails(
+                add_required=min_add,
+                effective_temperature=effective_temp,
+                temperature_adjustment=self._opt_factor
+            )
         )
     
     def _calculate_add_conservative(self, species: ForensicSpecies, stage: DevelopmentStage,
-                                   temperature_data: Dict, specimen_length: Optional[float]) -> PMIEstimate:
+                                   temperature_data: Dict, specimen_length: Optional[float],
+                                   tvals: _ThresholdValues) -> PMIEstimate:
         """Conservative ADD method (maximum PMI estimate)."""
-        threshold = get_development_threshold(species, stage)
-        avg_temp = temperature_data['avg_temp']
-        
-        # Apply conservative temperature adjustment
-        adjusted_temp = avg_temp * self.temp_adjustments[PMIMethod.ADD_CONSERVATIVE]
-        effective_temp = adjusted_temp - threshold.base_temp
-        
-        if effective_temp <= 0:
-            raise ValueError(f"Temperature too low for development")
-        
-        # Use maximum ADD for stage
-        max_add = threshold.max_add
-        pmi_days = max_add / effective_temp
+        # Use maximum ADD for stage with conservative temperature adjustment
+        max_add = tvals.max_add
+        pmi_days, effective_temp = _add_adjusted_kernel(
+            tvals.base_temp, max_add, temperature_data['avg_temp'], self._cons_factor
+        )
         pmi_hours = pmi_days * 24
         
         # Wider confidence interval for maximum estimate
@@ -256,39 +596,24 @@ class AlternativePMICalculator:
             confidence_low=max(0, pmi_days - confidence_range),
             confidence_high=pmi_days + confidence_range,
             reliability_score=75.0,
-            assumptions=[
-                "Suboptimal development conditions",
-                "Environmental factors slow development",
-                "Conservative temperature estimates"
-            ],
-            limitations=[
-                "May overestimate PMI",
-                "Accounts for worst-case scenarios",
-                "Less precise than standard methods"
-            ],
-            calculation_details={
-                'method': 'Conservative ADD (Maximum PMI)',
-                'add_required': max_add,
-                'effective_temperature': effective_temp,
-                'temperature_adjustment': self.temp_adjustments[PMIMethod.ADD_CONSERVATIVE]
-            }
+            assumptions=_ASSUMPTIONS[PMIMethod.ADD_CONSERVATIVE],
+            limitations=_LIMITATIONS[PMIMethod.ADD_CONSERVATIVE],
+            calculation_details=ConservativeAddDetails(
+                add_required=max_add,
+                effective_temperature=effective_temp,
+                temperature_adjustment=self._cons_factor
+            )
         )
     
     def _calculate_adh_method(self, species: ForensicSpecies, stage: DevelopmentStage,
-                             temperature_data: Dict, specimen_length: Optional[float]) -> PMIEstimate:
+                             temperature_data: Dict, specimen_length: Optional[float],
+                             tvals: _ThresholdValues) -> PMIEstimate:
         """Accumulated Degree Hours method."""
-        threshold = get_development_threshold(species, stage)
-        avg_temp = temperature_data['avg_temp']
-        effective_temp = avg_temp - threshold.base_temp
-        
-        if effective_temp <= 0:
-            raise ValueError(f"Temperature too low for development")
-        
         # Convert ADD to ADH (more precise for short time periods)
-        estimated_add = self._estimate_add_for_stage(threshold, specimen_length)
-        required_adh = estimated_add * 24  # Convert days to hours
-        
-        pmi_hours = required_adh / effective_temp
+        pmi_hours, effective_temp, required_adh = _adh_kernel(
+            tvals.base_temp, tvals.min_add, tvals.max_add,
+            temperature_data['avg_temp'], _as_float(specimen_length), tvals.typical_length
+        )
         pmi_days = pmi_hours / 24
         
         # More precise confidence interval
@@ -301,54 +626,27 @@ class AlternativePMICalculator:
             confidence_low=max(0, pmi_days - confidence_range),
             confidence_high=pmi_days + confidence_range,
             reliability_score=90.0,
-            assumptions=[
-                "Hourly temperature precision is meaningful",
-                "Linear development rate within temperature range",
-                "Short-term temperature fluctuations matter"
-            ],
-            limitations=[
-                "Requires more precise temperature data",
-                "May be over-precise for long PMI periods",
-                "Computation complexity vs. benefit trade-off"
-            ],
-            calculation_details={
-                'method': 'Accumulated Degree Hours',
-                'adh_required': required_adh,
-                'effective_temperature': effective_temp,
-                'hourly_precision': True
-            }
+            assumptions=_ASSUMPTIONS[PMIMethod.ADH_METHOD],
+            limitations=_LIMITATIONS[PMIMethod.ADH_METHOD],
+            calculation_details=AdhDetails(
+                adh_required=required_adh,
+                effective_temperature=effective_temp
+            )
         )
     
     def _calculate_isomegalen_method(self, species: ForensicSpecies, stage: DevelopmentStage,
-                                    temperature_data: Dict, specimen_length: Optional[float]) -> PMIEstimate:
+                                    temperature_data: Dict, specimen_length: Optional[float],
+                                    tvals: _ThresholdValues) -> PMIEstimate:
         """Isomegalen diagram method (length-based development)."""
         if specimen_length is None:
             raise ValueError("Specimen length required for Isomegalen method")
         
-        threshold = get_development_threshold(species, stage)
-        avg_temp = temperature_data['avg_temp']
-        
         # Use length-based development curves
         # This is a simplified implementation - real isomegalen diagrams are more complex
-        typical_length = threshold.typical_length_mm or 15.0
-        length_ratio = specimen_length / typical_length
-        
-        # Adjust development time based on specimen size
-        base_add = self._estimate_add_for_stage(threshold, specimen_length)
-        
-        # Length-based adjustment (larger specimens = more development time)
-        if length_ratio > 1.2:
-            adjusted_add = base_add * (0.8 + 0.4 * length_ratio)
-        elif length_ratio < 0.8:
-            adjusted_add = base_add * (0.6 + 0.5 * length_ratio)
-        else:
-            adjusted_add = base_add
-        
-        effective_temp = avg_temp - threshold.base_temp
-        if effective_temp <= 0:
-            raise ValueError(f"Temperature too low for development")
-        
-        pmi_days = adjusted_add / effective_temp
+        pmi_days, typical_length, length_ratio, adjusted_add = _isomegalen_kernel(
+            tvals.base_temp, tvals.min_add, tvals.max_add,
+            temperature_data['avg_temp'], float(specimen_length), tvals.typical_length
+        )
         pmi_hours = pmi_days * 24
         
         # Confidence interval based on length measurement precision
@@ -361,51 +659,28 @@ class AlternativePMICalculator:
             confidence_low=max(0, pmi_days - confidence_range),
             confidence_high=pmi_days + confidence_range,
             reliability_score=65.0,
-            assumptions=[
-                "Specimen length accurately reflects development stage",
-                "Length-development relationship is linear",
-                "Individual variation is minimal"
-            ],
-            limitations=[
-                "Requires accurate length measurements",
-                "High individual variation in length",
-                "Limited validation data for all species"
-            ],
-            calculation_details={
-                'method': 'Isomegalen Diagram (Length-based)',
-                'specimen_length': specimen_length,
-                'typical_length': typical_length,
-                'length_ratio': length_ratio,
-                'adjusted_add': adjusted_add
-            }
+            assumptions=_ASSUMPTIONS[PMIMethod.ISOMEGALEN_METHOD],
+            limitations=_LIMITATIONS[PMIMethod.ISOMEGALEN_METHOD],
+            calculation_details=IsomegalenDetails(
+                specimen_length=specimen_length,
+                typical_length=typical_length,
+                length_ratio=length_ratio,
+                adjusted_add=adjusted_add
+            )
         )
     
     def _calculate_thermal_summation(self, species: ForensicSpecies, stage: DevelopmentStage,
-                                    temperature_data: Dict, specimen_length: Optional[float]) -> PMIEstimate:
+                                    temperature_data: Dict, specimen_length: Optional[float],
+                                    tvals: _ThresholdValues) -> PMIEstimate:
         """Alternative thermal summation method."""
-        threshold = get_development_threshold(species, stage)
         avg_temp = temperature_data['avg_temp']
+        base_temp = tvals.base_temp
         
         # Use non-linear thermal summation (accounts for temperature stress)
-        base_temp = threshold.base_temp
-        optimal_temp = base_temp + 15  # Assume optimal is 15°C above base
-        max_temp = base_temp + 25      # Assume stress above this
-        
-        # Calculate effective temperature with non-linear adjustment
-        if avg_temp <= base_temp:
-            raise ValueError(f"Temperature too low for development")
-        elif avg_temp <= optimal_temp:
-            # Linear increase up to optimal
-            temp_efficiency = (avg_temp - base_temp) / (optimal_temp - base_temp)
-            effective_temp = (avg_temp - base_temp) * temp_efficiency
-        else:
-            # Decreased efficiency above optimal
-            temp_stress = min(1.0, (avg_temp - optimal_temp) / (max_temp - optimal_temp))
-            stress_factor = 1.0 - (temp_stress * 0.3)  # Up to 30% reduction
-            effective_temp = (optimal_temp - base_temp) * stress_factor
-        
-        estimated_add = self._estimate_add_for_stage(threshold, specimen_length)
-        pmi_days = estimated_add / effective_temp if effective_temp > 0 else float('inf')
+        pmi_days, effective_temp, optimal_temp = _thermal_summation_kernel(
+            base_temp, tvals.min_add, tvals.max_add, avg_temp,
+            _as_float(specimen_length), tvals.typical_length
+        )
         pmi_hours = pmi_days * 24
         
         confidence_range = pmi_days * 0.25
@@ -417,47 +692,23 @@ class AlternativePMICalculator:
             confidence_low=max(0, pmi_days - confidence_range),
             confidence_high=pmi_days + confidence_range,
             reliability_score=80.0,
-            assumptions=[
-                "Non-linear temperature-development relationship",
-                "Temperature stress affects development rate",
-                "Optimal temperature exists for each species"
-            ],
-            limitations=[
-                "Optimal temperature estimates may be imprecise",
-                "Stress factors are species-dependent",
-                "Limited validation in extreme temperatures"
-            ],
-            calculation_details={
-                'method': 'Non-linear Thermal Summation',
-                'optimal_temperature': optimal_temp,
-                'temperature_efficiency': effective_temp / (avg_temp - base_temp) if avg_temp > base_temp else 0,
-                'stress_adjusted': avg_temp > optimal_temp
-            }
+            assumptions=_ASSUMPTIONS[PMIMethod.THERMAL_SUMMATION],
+            limitations=_LIMITATIONS[PMIMethod.THERMAL_SUMMATION],
+            calculation_details=ThermalSummationDetails(
+                optimal_temperature=optimal_temp,
+                temperature_efficiency=effective_temp / (avg_temp - base_temp) if avg_temp > base_temp else 0,
+                stress_adjusted=avg_temp > optimal_temp
+            )
         )
     
     def _calculate_development_rate(self, species: ForensicSpecies, stage: DevelopmentStage,
-                                   temperature_data: Dict, specimen_length: Optional[float]) -> PMIEstimate:
+                                   temperature_data: Dict, specimen_length: Optional[float],
+                                   tvals: _ThresholdValues) -> PMIEstimate:
         """Development rate modeling method."""
-        threshold = get_development_threshold(species, stage)
-        avg_temp = temperature_data['avg_temp']
-        
-        # Use Ikemoto-Takai model for development rate
-        base_temp = threshold.base_temp
-        
-        if avg_temp <= base_temp:
-            raise ValueError(f"Temperature too low for development")
-        
-        # Development rate = a * (T - T0) where a is development rate constant
-        # Estimate 'a' from known ADD data
-        mid_add = (threshold.min_add + threshold.max_add) / 2
-        reference_temp = base_temp + 20  # Reference temperature
-        development_rate_constant = 1 / (mid_add * (reference_temp - base_temp))
-        
-        # Calculate development rate at current temperature
-        development_rate = development_rate_constant * (avg_temp - base_temp)
-        
-        # PMI is inverse of development rate
-        pmi_days = 1 / development_rate if development_rate > 0 else float('inf')
+        # Use Ikemoto-Takai model for development rate; PMI is its inverse
+        pmi_days, development_rate, development_rate_constant, reference_temp = _development_rate_kernel(
+            tvals.base_temp, tvals.min_add, tvals.max_add, temperature_data['avg_temp']
+        )
         pmi_hours = pmi_days * 24
         
         confidence_range = pmi_days * 0.20
@@ -469,38 +720,21 @@ class AlternativePMICalculator:
             confidence_low=max(0, pmi_days - confidence_range),
             confidence_high=pmi_days + confidence_range,
             reliability_score=82.0,
-            assumptions=[
-                "Linear relationship between temperature and development rate",
-                "Development rate constant is species-specific",
-                "Reference temperature data is accurate"
-            ],
-            limitations=[
-                "Simplified model may not capture complex biology",
-                "Rate constant estimates may be imprecise",
-                "Does not account for developmental non-linearities"
-            ],
-            calculation_details={
-                'method': 'Development Rate Modeling',
-                'development_rate': development_rate,
-                'rate_constant': development_rate_constant,
-                'reference_temperature': reference_temp
-            }
+            assumptions=_ASSUMPTIONS[PMIMethod.DEVELOPMENT_RATE],
+            limitations=_LIMITATIONS[PMIMethod.DEVELOPMENT_RATE],
+            calculation_details=DevelopmentRateDetails(
+                development_rate=development_rate,
+                rate_constant=development_rate_constant,
+                reference_temperature=reference_temp
+            )
         )
     
     def _estimate_add_for_stage(self, threshold, specimen_length: Optional[float]) -> float:
         """Estimate ADD needed for stage (shared helper method)."""
-        if specimen_length is None or threshold.typical_length_mm is None:
-            return (threshold.min_add + threshold.max_add) / 2
-        
-        # Adjust based on specimen length
-        length_ratio = specimen_length / threshold.typical_length_mm
-        
-        if length_ratio < 0.8:
-            return threshold.min_add + (threshold.max_add - threshold.min_add) * 0.3
-        elif length_ratio > 1.2:
-            return threshold.min_add + (threshold.max_add - threshold.min_add) * 0.8
-        else:
-            return (threshold.min_add + threshold.max_add) / 2
+        return _estimate_add_kernel(
+            threshold.min_add, threshold.max_add,
+            _as_float(specimen_length), _as_float(threshold.typical_length_mm)
+        )
     
     def _generate_consensus(self, estimates: List[PMIEstimate]) -> Dict:
         """Generate consensus estimate from multiple methods."""
@@ -514,28 +748,36 @@ class AlternativePMICalculator:
                 'confidence_high': est.confidence_high
             }
         
-        # Weight estimates by reliability scores
-        total_weight = sum(est.reliability_score for est in estimates)
+        # Single pass: reliability-weighted PMI, plain PMI sum (equal-weight
+        # fallback), combined confidence bounds and the methods used
+        total_weight = 0.0
+        weighted_sum = 0.0
+        pmi_sum = 0.0
+        conf_low = math.inf
+        conf_high = -math.inf
+        methods_used = [None] * len(estimates)
+        
+        for i, est in enumerate(estimates):
+            total_weight += est.reliability_score
+            weighted_sum += est.pmi_days * est.reliability_score
+            pmi_sum += est.pmi_days
+            conf_low = min(conf_low, est.confidence_low)
+            conf_high = max(conf_high, est.confidence_high)
+            methods_used[i] = est.method.value
         
         if total_weight == 0:
             # Fallback to equal weights
-            weights = [1.0] * len(estimates)
-            total_weight = len(estimates)
+            weighted_pmi = pmi_sum / len(estimates)
         else:
-            weights = [est.reliability_score for est in estimates]
-        
-        # Calculate weighted averages
-        weighted_pmi = sum(est.pmi_days * w for est, w in zip(estimates, weights)) / total_weight
-        weighted_conf_low = min(est.confidence_low for est in estimates)
-        weighted_conf_high = max(est.confidence_high for est in estimates)
+            weighted_pmi = weighted_sum / total_weight
         
         return {
             'method': 'multi_method_consensus',
             'pmi_days': weighted_pmi,
             'pmi_hours': weighted_pmi * 24,
-            'confidence_low': weighted_conf_low,
-            'confidence_high': weighted_conf_high,
-            'methods_used': [est.method.value for est in estimates],
+            'confidence_low': conf_low,
+            'confidence_high': conf_high,
+            'methods_used': methods_used,
             'reliability_weighted': True
         }
     
@@ -553,12 +795,13 @@ class AlternativePMICalculator:
                 'range': 0.0
             }
         
-        pmi_values = [est.pmi_days for est in estimates]
-        mean_pmi = sum(pmi_values) / len(pmi_values)
+        pmi = np.fromiter((est.pmi_days for est in estimates), dtype=np.float64, count=len(estimates))
+        mean_pmi = float(pmi.mean())
+        min_pmi = float(pmi.min())
+        max_pmi = float(pmi.max())
         
         # Calculate coefficient of variation
-        variance = sum((x - mean_pmi) ** 2 for x in pmi_values) / len(pmi_values)
-        std_dev = math.sqrt(variance)
+        std_dev = float(pmi.std(ddof=0))
         cv = (std_dev / mean_pmi) * 100 if mean_pmi > 0 else 0
         
         # Determine agreement level
@@ -576,28 +819,33 @@ class AlternativePMICalculator:
             'coefficient_of_variation': cv,
             'mean_pmi': mean_pmi,
             'std_deviation': std_dev,
-            'min_pmi': min(pmi_values),
-            'max_pmi': max(pmi_values),
-            'range': max(pmi_values) - min(pmi_values)
+            'min_pmi': min_pmi,
+            'max_pmi': max_pmi,
+            'range': float(np.ptp(pmi))
         }
     
     def _assess_reliability(self, estimates: List[PMIEstimate], species: ForensicSpecies,
-                           stage: DevelopmentStage, temperature_data: Dict) -> Dict:
+                           stage: DevelopmentStage, temperature_data: Dict,
+                           tvals: _ThresholdValues) -> Dict:
         """Assess overall reliability of estimates."""
-        # Calculate average reliability score
-        avg_reliability = sum(est.reliability_score for est in estimates) / len(estimates)
+        # Average reliability score and method diversity in one pass
+        total_reliability = 0.0
+        seen_methods = set()
+        for est in estimates:
+            total_reliability += est.reliability_score
+            seen_methods.add(est.method)
+        avg_reliability = total_reliability / len(estimates)
+        method_diversity = len(seen_methods)
         
         # Assess conditions
         temp = temperature_data['avg_temp']
-        threshold = get_development_threshold(species, stage)
         
         # Temperature suitability
-        temp_optimal = threshold.base_temp + 15
+        temp_optimal = tvals.base_temp + 15
         temp_suitability = 100 - abs(temp - temp_optimal) * 2  # Penalty for deviation
         temp_suitability = max(0, min(100, temp_suitability))
         
         # Method diversity bonus
-        method_diversity = len(set(est.method for est in estimates))
         diversity_bonus = min(20, method_diversity * 5)
         
         # Overall reliability
@@ -608,12 +856,8 @@ class AlternativePMICalculator:
             'average_method_reliability': avg_reliability,
             'temperature_suitability': temp_suitability,
             'method_diversity_score': diversity_bonus,
-            'method_count': len(estimates),
-            'reliability_factors': [
-                f"Average method reliability: {avg_reliability:.1f}/100",
-                f"Temperature suitability: {temp_suitability:.1f}/100",
-                f"Method diversity: {method_diversity} methods"
-            ]
+            'method_diversity': method_diversity,
+            'method_count': len(estimates)
         }
     
     def _generate_recommendations(self, estimates: List[PMIEstimate], 
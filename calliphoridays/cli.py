@@ -1,30 +1,172 @@
 import click
+import dbm
+import hashlib
+import json
+import os
+import shelve
 import sys
-from typing import Optional, Dict
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional
 
 from .models import DevelopmentStage, ForensicSpecies, CalliphoridaeSpecies
 from .pmi_calculator import PMICalculator
-from .weather import WeatherService
-from .visualization import TerminalVisualizer
-from .export import DataExporter
 from .validation import PMIValidator
-from .alternative_methods import AlternativePMICalculator, PMIMethod
+
+
+WEATHER_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'calliphoridays', 'weather'
+)
+WEATHER_CACHE_EXPIRY = 7 * 24 * 3600  # seconds
+# Source prefixes of WeatherService's offline fallbacks, which are never cached
+FALLBACK_TEMPERATURE_SOURCES = ('Estimated', 'Default')
+
+# Section separators for the terminal report
+RULE_50 = "=" * 50
+RULE_60 = "=" * 60
+RULE_70 = "=" * 70
+DIVIDER = "-" * 40
+
+# Reliability score cut-offs and the chart icon for each band
+RELIABILITY_THRESHOLDS = (55, 70, 85)
+RELIABILITY_ICONS = ("🔴", "🟠", "🟡", "🟢")
+
+RESULT_TEMPLATE = (
+    "\n" + RULE_50 + "\n"
+    "POSTMORTEM INTERVAL ESTIMATE\n"
+    + RULE_50 + "\n"
+    "Species: {species}\n"
+    "Development Stage: {stage}\n"
+    "Location: {location}\n"
+    "Discovery Date: {discovery}\n"
+    "Estimated PMI: {pmi_days:.1f} days ({pmi_hours:.1f} hours)\n"
+    "Confidence Interval: {confidence_low:.1f} - {confidence_high:.1f} days\n"
+    "Temperature Used: {temperature:.1f}°C"
+)
+
+BANNER = r"""
+┏┓┏┓┓ ┓ ┳┓┏┏┓┓┏┏┓┳┓┳┳┓┏┓┓┏┏┓
+┃ ┣┫┃ ┃ ┃┣┫┃┃┣┫┃┃┣┫┃┃┃┣┫┗┫┗┓
+┗┛┛┗┗┛┗┛┻┛┗┣┛┛┗┗┛┛┗┻┻┛┛┗┗┛┗┛
+                            
+            """ + (
+    "\n"
+    "Forensic Entomology PMI Estimation Tool\n"
+    "Using Calliphoridae & Sarcophagidae Evidence and Temperature Data\n"
+    + RULE_70 + "\n"
+)
+BANNER_BYTES = BANNER.encode('utf-8')
+
+
+def get_cached_temperature_data(weather_service, location: str, discovery_date: str,
+                                discovery_time: Optional[str] = None) -> Dict:
+    """
+    Get temperature data, reusing responses stored on disk by earlier runs.
+    
+    Entries are keyed by location, date and time and expire after a week.
+    Only API responses are stored: the service's estimated/default fallbacks
+    are returned but not cached, so the next run tries the API again. If the
+    cache can't be opened the weather service is called directly.
+    """
+    key = hashlib.blake2b(f"{location}|{discovery_date}|{discovery_time}".encode()).hexdigest()
+    
+    try:
+        os.makedirs(os.path.dirname(WEATHER_CACHE_PATH), exist_ok=True)
+        with shelve.open(WEATHER_CACHE_PATH) as cache:
+            entry = cache.get(key)
+    except dbm.error:
+        entry = None
+    
+    if entry is not None and time.time() - entry[0] < WEATHER_CACHE_EXPIRY:
+        return entry[1]
+    
+    temperature_data = weather_service.get_temperature_data(location, discovery_date, discovery_time)
+    if temperature_data.get('source', '').startswith(FALLBACK_TEMPERATURE_SOURCES):
+        return temperature_data
+    
+    try:
+        with shelve.open(WEATHER_CACHE_PATH) as cache:
+            cache[key] = (time.time(), temperature_data)
+    except dbm.error:
+        pass
+    
+    return temperature_data
+
+
+def write_banner():
+    """Write the startup banner, as pre-encoded bytes when stdout is UTF-8."""
+    stream = sys.stdout
+    encoding = (getattr(stream, 'encoding', None) or '').lower().replace('-', '')
+    if encoding == 'utf8' and hasattr(stream, 'buffer'):
+        stream.flush()
+        stream.buffer.write(BANNER_BYTES)
+        stream.buffer.flush()
+    else:
+        click.echo(BANNER, nl=False)
+
+
+def write_lines(lines: List[str]):
+    """
+    Write a rendered report section to stdout in one call.
+    
+    The report text is plain, so this skips click.echo's per-call stream
+    and colour handling. stdout is looked up on each call so redirection
+    (and click's test runner) still see the output.
+    """
+    stream = sys.stdout
+    stream.write("\n".join(lines))
+    stream.write("\n")
+    stream.flush()
+
+
+@lru_cache(maxsize=None)
+def pretty_name(value: str) -> str:
+    """Title-cased label for an enum value or metric key (e.g. 'add_standard' -> 'Add Standard')."""
+    return value.replace('_', ' ').title()
+
+
+class EnumChoice(click.ParamType):
+    """
+    Click parameter type accepting the values of an Enum.
+    
+    Values are resolved through a prebuilt value -> member dict, so the
+    command receives the enum member directly and nothing is re-parsed.
+    """
+    
+    def __init__(self, enum_cls):
+        self.enum_cls = enum_cls
+        self.name = enum_cls.__name__
+        self.values = tuple(member.value for member in enum_cls)
+        self.members = {member.value: member for member in enum_cls}
+    
+    def get_metavar(self, param, ctx=None):
+        return f"[{'|'.join(self.values)}]"
+    
+    def convert(self, value, param, ctx):
+        if isinstance(value, self.enum_cls):
+            return value
+        member = self.members.get(value)
+        if member is None:
+            choices = ', '.join(repr(v) for v in self.values)
+            self.fail(f"{value!r} is not one of {choices}.", param, ctx)
+        return member
+    
+    def shell_complete(self, ctx, param, incomplete):
+        from click.shell_completion import CompletionItem
+        return [CompletionItem(v) for v in self.values if v.startswith(incomplete)]
+
+
+SPECIES_CHOICE = EnumChoice(ForensicSpecies)
+STAGE_CHOICE = EnumChoice(DevelopmentStage)
 
 
 @click.command()
-@click.option('--species', '-s', required=True, 
-              type=click.Choice([
-                  # Calliphoridae (Blow flies)
-                  'chrysomya_rufifacies', 'lucilia_sericata', 'calliphora_vicina', 
-                  'cochliomyia_macellaria', 'phormia_regina', 'chrysomya_megacephala',
-                  'lucilia_cuprina', 'calliphora_vomitoria', 'protophormia_terraenovae',
-                  # Sarcophagidae (Flesh flies)
-                  'sarcophaga_bullata', 'sarcophaga_crassipalpis', 
-                  'sarcophaga_haemorrhoidalis', 'boettcherisca_peregrina'
-              ]),
+@click.option('--species', '-s', required=True, type=SPECIES_CHOICE,
               help='Forensically important species found on the cadaver (9 Calliphoridae + 4 Sarcophagidae)')
-@click.option('--stage', '-t', required=True,
-              type=click.Choice(['1st_instar', '2nd_instar', '3rd_instar', 'pupa']),
+@click.option('--stage', '-t', required=True, type=STAGE_CHOICE,
               help='Development stage of the specimen')
 @click.option('--location', '-l', required=True,
               help='Location where body was found (city, state/country)')
@@ -62,7 +204,7 @@ from .alternative_methods import AlternativePMICalculator, PMIMethod
               help='Calculate PMI using multiple methods and show comparison')
 @click.option('--method-list', type=str,
               help='Comma-separated list of specific methods to use (e.g., add_standard,adh_method)')
-def main(species: str, stage: str, location: str, discovery_date: str,
+def main(species: ForensicSpecies, stage: DevelopmentStage, location: str, discovery_date: str,
          discovery_time: Optional[str], specimen_length: Optional[float], 
          ambient_temp: Optional[float], verbose: bool, plot: bool, no_banner: bool,
          export: Optional[str], output: Optional[str], case_id: Optional[str], 
@@ -75,143 +217,206 @@ def main(species: str, stage: str, location: str, discovery_date: str,
     to estimate the postmortem interval of a cadaver.
     """
     try:
-        # Display banner unless suppressed
-        if not no_banner:
-            banner = r"""
-┏┓┏┓┓ ┓ ┳┓┏┏┓┓┏┏┓┳┓┳┳┓┏┓┓┏┏┓
-┃ ┣┫┃ ┃ ┃┣┫┃┃┣┫┃┃┣┫┃┃┃┣┫┗┫┗┓
-┗┛┛┗┗┛┗┛┻┛┗┣┛┛┗┗┛┛┗┻┻┛┛┗┗┛┗┛
-                            
-            """
-            click.echo(banner)
-            click.echo("Forensic Entomology PMI Estimation Tool")
-            click.echo("Using Calliphoridae & Sarcophagidae Evidence and Temperature Data")
-            click.echo("=" * 70)
-        
-        # Parse inputs
-        forensic_species = ForensicSpecies(species)
-        development_stage = DevelopmentStage(stage)
-        
-        # Initialize validator and validate inputs
-        validator = PMIValidator()
-        validation_result = validator.validate_inputs(
-            forensic_species, development_stage, location, discovery_date,
-            discovery_time, specimen_length, ambient_temp
+        run_case(
+            species, stage, location, discovery_date, discovery_time, specimen_length,
+            ambient_temp, verbose, plot, no_banner, export, output, case_id, investigator,
+            validate, enhanced_validation, monte_carlo, known_cases, methods, method_list
         )
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@click.command()
+@click.argument('cases_file', type=click.Path(exists=True))
+def main_batch(cases_file: str):
+    """
+    Run several single-specimen analyses from a JSON file.
+    
+    CASES_FILE holds a list of cases whose keys are the single-specimen
+    option names, e.g. {"species": "lucilia_sericata", "stage": "3rd_instar",
+    "location": "Miami, FL", "discovery_date": "2024-07-01"}. All cases run
+    in one process, so imports and compiled kernels are shared between them.
+    """
+    with open(cases_file, 'r') as f:
+        cases = json.load(f)
+    
+    failures = 0
+    for number, case in enumerate(cases, 1):
+        case = {key.replace('-', '_'): value for key, value in case.items()}
+        try:
+            case['species'] = SPECIES_CHOICE.convert(case['species'], None, None)
+            case['stage'] = STAGE_CHOICE.convert(case['stage'], None, None)
+            run_case(**case)
+        except Exception as e:
+            failures += 1
+            click.echo(f"Error in case {number}: {str(e)}", err=True)
+    
+    if failures:
+        sys.exit(1)
+
+
+@lru_cache(maxsize=1)
+def _load_enhanced():
+    """Import the enhanced validation module once per process."""
+    from . import enhanced_validation
+    return enhanced_validation
+
+
+@lru_cache(maxsize=1)
+def _alternative_calculator():
+    """One alternative-methods calculator per process, so its result cache is shared between cases."""
+    from .alternative_methods import AlternativePMICalculator
+    return AlternativePMICalculator()
+
+
+def run_case(species: ForensicSpecies, stage: DevelopmentStage, location: str,
+             discovery_date: str, discovery_time: Optional[str] = None,
+             specimen_length: Optional[float] = None, ambient_temp: Optional[float] = None,
+             verbose: bool = False, plot: bool = False, no_banner: bool = False,
+             export: Optional[str] = None, output: Optional[str] = None,
+             case_id: Optional[str] = None, investigator: Optional[str] = None,
+             validate: bool = False, enhanced_validation: bool = False,
+             monte_carlo: bool = False, known_cases: bool = False,
+             methods: bool = False, method_list: Optional[str] = None):
+    """
+    Run a single-specimen PMI analysis and print the report.
+    
+    Takes the same arguments as the command-line options. Errors are raised
+    rather than exiting, so several cases can be run in one process.
+    """
+    # Display banner unless suppressed
+    if not no_banner:
+        write_banner()
+    
+    forensic_species = species
+    development_stage = stage
+    
+    pmi_calculator = PMICalculator()
+    
+    # Get temperature data
+    if ambient_temp is not None:
+        temperature_data = {'avg_temp': ambient_temp}
+        if verbose:
+            click.echo(f"Using provided ambient temperature: {ambient_temp}°C")
+    else:
+        from .weather import WeatherService
         
-        # Initialize services
-        weather_service = WeatherService()
-        pmi_calculator = PMICalculator()
-        visualizer = TerminalVisualizer()
-        exporter = DataExporter()
-        
-        # Get temperature data
-        if ambient_temp is not None:
-            temperature_data = {'avg_temp': ambient_temp}
-            if verbose:
-                click.echo(f"Using provided ambient temperature: {ambient_temp}°C")
-        else:
-            if verbose:
-                time_info = f" at {discovery_time}" if discovery_time else ""
-                click.echo(f"Fetching weather data for {location}{time_info}...")
-            temperature_data = weather_service.get_temperature_data(location, discovery_date, discovery_time)
-        
-        # Calculate PMI
         if verbose:
-            click.echo("Calculating postmortem interval...")
-            
-        pmi_estimate = pmi_calculator.calculate_pmi(
-            species=forensic_species,
-            stage=development_stage,
-            temperature_data=temperature_data,
-            specimen_length=specimen_length,
-            verbose=verbose
+            time_info = f" at {discovery_time}" if discovery_time else ""
+            click.echo(f"Fetching weather data for {location}{time_info}...")
+        temperature_data = get_cached_temperature_data(
+            WeatherService(), location, discovery_date, discovery_time
         )
+    
+    # Calculate PMI
+    if verbose:
+        click.echo("Calculating postmortem interval...")
         
-        # Validate calculation results
-        validation_result = validator.validate_calculation_results(
-            pmi_estimate, temperature_data, forensic_species, development_stage
-        )
+    pmi_estimate = pmi_calculator.calculate_pmi(
+        species=forensic_species,
+        stage=development_stage,
+        temperature_data=temperature_data,
+        specimen_length=specimen_length,
+        verbose=verbose
+    )
+    
+    # Validate inputs and calculation results
+    validator = PMIValidator()
+    validation_result = validator.validate_all(
+        forensic_species, development_stage, location, discovery_date,
+        discovery_time, specimen_length, ambient_temp,
+        pmi_estimate, temperature_data
+    )
+    
+    # Calculate alternative methods if requested
+    alternative_results = None
+    if methods or method_list:
+        from .alternative_methods import PMI_METHODS_BY_NAME
         
-        # Calculate alternative methods if requested
-        alternative_results = None
-        if methods or method_list:
-            try:
-                alt_calculator = AlternativePMICalculator()
-                
-                # Parse method list if provided
+        # Parse method list if provided
+        selected_methods = None
+        if method_list:
+            method_names = [name.strip() for name in method_list.split(',')]
+            selected_methods = []
+            for name in method_names:
+                method = PMI_METHODS_BY_NAME.get(name)
+                if method is not None:
+                    selected_methods.append(method)
+                else:
+                    click.echo(f"Warning: Unknown method '{name}' ignored", err=True)
+            
+            if not selected_methods:
+                click.echo("Error: No valid methods specified", err=True)
                 selected_methods = None
-                if method_list:
-                    method_names = [name.strip() for name in method_list.split(',')]
-                    selected_methods = []
-                    for name in method_names:
-                        try:
-                            method = PMIMethod(name)
-                            selected_methods.append(method)
-                        except ValueError:
-                            click.echo(f"Warning: Unknown method '{name}' ignored", err=True)
-                    
-                    if not selected_methods:
-                        click.echo("Error: No valid methods specified", err=True)
-                        selected_methods = None
-                
-                if verbose:
-                    click.echo("Calculating alternative PMI methods...")
-                
-                alternative_results = alt_calculator.calculate_all_methods(
-                    forensic_species, development_stage, temperature_data,
-                    specimen_length, selected_methods
-                )
-                
-            except Exception as e:
-                click.echo(f"Warning: Alternative methods calculation failed: {str(e)}", err=True)
-        
-        # Output results
-        click.echo(f"\n{'='*50}")
-        click.echo(f"POSTMORTEM INTERVAL ESTIMATE")
-        click.echo(f"{'='*50}")
-        click.echo(f"Species: {species.replace('_', ' ').title()}")
-        click.echo(f"Development Stage: {stage.replace('_', ' ').title()}")
-        click.echo(f"Location: {location}")
-        discovery_datetime = f"{discovery_date}" + (f" {discovery_time}" if discovery_time else "")
-        click.echo(f"Discovery Date: {discovery_datetime}")
-        click.echo(f"Estimated PMI: {pmi_estimate['pmi_days']:.1f} days ({pmi_estimate['pmi_hours']:.1f} hours)")
-        click.echo(f"Confidence Interval: {pmi_estimate['confidence_low']:.1f} - {pmi_estimate['confidence_high']:.1f} days")
-        click.echo(f"Temperature Used: {temperature_data['avg_temp']:.1f}°C")
-        
-        # Show data quality assessment
-        click.echo(f"\nData Quality: {validation_result.data_quality.value.upper()} ({validation_result.quality_score:.0f}/100)")
-        
-        # Show validation warnings if any
-        if validation_result.warnings:
-            click.echo(f"\nValidation Alerts:")
-            for warning in validation_result.warnings[:3]:  # Show max 3 warnings
-                click.echo(f"  {warning}")
-            if len(validation_result.warnings) > 3:
-                click.echo(f"  ... and {len(validation_result.warnings) - 3} more (use --validate for full report)")
         
         if verbose:
-            click.echo(f"\nDetailed Calculations:")
-            click.echo(f"Accumulated Degree Days: {pmi_estimate['accumulated_dd']:.1f} ADD")
-            click.echo(f"Base Temperature: {pmi_estimate['base_temp']:.1f}°C")
-            click.echo(f"Development Threshold: {pmi_estimate['dev_threshold']:.1f} ADD")
+            click.echo("Calculating alternative PMI methods...")
         
-        # Show visualization if requested
-        if plot:
-            click.echo("\n" + visualizer.create_pmi_with_temperature_timeline(pmi_estimate, temperature_data))
-        
-        # Show full validation report if requested
-        if validate:
-            click.echo("\n" + validator.generate_validation_report())
+        try:
+            alternative_results = _alternative_calculator().calculate_all_methods(
+                forensic_species, development_stage, temperature_data,
+                specimen_length, selected_methods
+            )
+        except Exception as e:
+            click.echo(f"Warning: Alternative methods calculation failed: {str(e)}", err=True)
+    
+    # Output results, written as a single block
+    discovery_datetime = f"{discovery_date}" + (f" {discovery_time}" if discovery_time else "")
+    lines = [RESULT_TEMPLATE.format(
+        species=pretty_name(species.value),
+        stage=pretty_name(stage.value),
+        location=location,
+        discovery=discovery_datetime,
+        pmi_days=pmi_estimate['pmi_days'],
+        pmi_hours=pmi_estimate['pmi_hours'],
+        confidence_low=pmi_estimate['confidence_low'],
+        confidence_high=pmi_estimate['confidence_high'],
+        temperature=temperature_data['avg_temp']
+    )]
+    
+    # Show data quality assessment
+    lines.append(f"\nData Quality: {validation_result.data_quality.value.upper()} ({validation_result.quality_score:.0f}/100)")
+    
+    # Show validation warnings if any
+    if validation_result.warnings:
+        lines.append(f"\nValidation Alerts:")
+        for warning in islice(validation_result.warnings, 3):  # Show max 3 warnings
+            lines.append(f"  {warning}")
+        if len(validation_result.warnings) > 3:
+            lines.append(f"  ... and {len(validation_result.warnings) - 3} more (use --validate for full report)")
+    
+    if verbose:
+        lines.append(f"\nDetailed Calculations:")
+        lines.append(f"Accumulated Degree Days: {pmi_estimate['accumulated_dd']:.1f} ADD")
+        lines.append(f"Base Temperature: {pmi_estimate['base_temp']:.1f}°C")
+        lines.append(f"Development Threshold: {pmi_estimate['dev_threshold']:.1f} ADD")
+    
+    write_lines(lines)
+    
+    # Show visualization if requested
+    if plot:
+        from .visualization import TerminalVisualizer
         
-        # Perform enhanced validation if requested
-        enhanced_results = None
-        if enhanced_validation or monte_carlo or known_cases:
+        visualizer = TerminalVisualizer()
+        click.echo("\n" + visualizer.create_pmi_with_temperature_timeline(pmi_estimate, temperature_data))
+    
+    # Show full validation report if requested
+    if validate:
+        click.echo("\n" + validator.generate_validation_report())
+    
+    # Perform enhanced validation if requested
+    enhanced_results = None
+    if enhanced_validation or monte_carlo or known_cases:
+        try:
+            create_enhanced_validation_report = _load_enhanced().create_enhanced_validation_report
+        except ImportError as e:
+            click.echo(f"Enhanced validation requires additional dependencies: {str(e)}", err=True)
+            click.echo("Install with: pip install numpy", err=True)
+        else:
+            click.echo("\nPerforming enhanced validation analysis...")
+            
             try:
-                from .enhanced_validation import create_enhanced_validation_report
-                
-                click.echo("\nPerforming enhanced validation analysis...")
-                
                 enhanced_results = create_enhanced_validation_report(
                     species=forensic_species,
                     stage=development_stage,
@@ -220,266 +425,268 @@ def main(species: str, stage: str, location: str, discovery_date: str,
                     include_monte_carlo=monte_carlo,
                     verbose=verbose
                 )
-                
-                display_enhanced_validation_results(enhanced_results, monte_carlo, known_cases)
-                
-            except ImportError as e:
-                click.echo(f"Enhanced validation requires additional dependencies: {str(e)}", err=True)
-                click.echo("Install with: pip install numpy", err=True)
             except Exception as e:
                 click.echo(f"Enhanced validation failed: {str(e)}", err=True)
+            else:
+                display_enhanced_validation_results(enhanced_results, monte_carlo, known_cases)
+    
+    # Show alternative methods results if calculated
+    if alternative_results:
+        display_alternative_methods_results(alternative_results, verbose)
+    
+    click.echo(f"\nWARNING: This is an estimate based on available data.")
+    click.echo(f"Results should be interpreted by qualified forensic entomologists.")
+    
+    # Export data if requested
+    if export:
+        from .export import DataExporter
+        
+        exporter = DataExporter()
         
-        # Show alternative methods results if calculated
-        if alternative_results:
-            display_alternative_methods_results(alternative_results, verbose)
+        # Prepare case information
+        case_info = {
+            'case_id': case_id or exporter.generate_case_id(location, discovery_date),
+            'investigator': investigator or 'Unknown',
+            'location': location,
+            'discovery_date': discovery_date,
+            'discovery_time': discovery_time,
+            'specimen_length': specimen_length,
+            'collection_method': 'Not specified',
+            'preservation_method': 'Not specified'
+        }
         
-        click.echo(f"\nWARNING: This is an estimate based on available data.")
-        click.echo(f"Results should be interpreted by qualified forensic entomologists.")
+        # Generate output path if not provided
+        if not output:
+            output = f"PMI_case_{case_info['case_id']}"
         
-        # Export data if requested
-        if export:
+        if export == 'pdf':
+            # Generate professional PDF report
             try:
-                # Prepare case information
-                case_info = {
-                    'case_id': case_id or exporter.generate_case_id(location, discovery_date),
-                    'investigator': investigator or 'Unknown',
-                    'location': location,
-                    'discovery_date': discovery_date,
-                    'discovery_time': discovery_time,
-                    'specimen_length': specimen_length,
-                    'collection_method': 'Not specified',
-                    'preservation_method': 'Not specified'
-                }
-                
-                # Generate output path if not provided
-                if not output:
-                    output = f"PMI_case_{case_info['case_id']}"
-                
-                if export == 'pdf':
-                    # Generate professional PDF report
-                    try:
-                        from .report_generator import create_forensic_report
-                        
-                        pdf_path = create_forensic_report(
-                            pmi_estimate=pmi_estimate,
-                            validation_result=validation_result,
-                            case_info=case_info,
-                            temperature_data=temperature_data,
-                            species=forensic_species,
-                            stage=development_stage,
-                            alternative_results=alternative_results,
-                            output_path=output + '.pdf'
-                        )
-                        
-                        click.echo(f"\nProfessional PDF report generated: {pdf_path}")
-                        
-                    except ImportError as e:
-                        click.echo(f"PDF generation requires additional dependencies: {str(e)}", err=True)
-                        click.echo("Install with: pip install reportlab matplotlib pillow", err=True)
-                    except Exception as pdf_error:
-                        click.echo(f"PDF generation failed: {str(pdf_error)}", err=True)
-                else:
-                    # Export using existing data exporter
-                    exported_file = exporter.export_case_data(
-                        pmi_estimate, temperature_data, case_info, output, export
-                    )
-                    
-                    click.echo(f"\nData exported to: {exported_file}")
+                from .report_generator import create_forensic_report
                 
+                pdf_path = create_forensic_report(
+                    pmi_estimate=pmi_estimate,
+                    validation_result=validation_result,
+                    case_info=case_info,
+                    temperature_data=temperature_data,
+                    species=forensic_species,
+                    stage=development_stage,
+                    alternative_results=alternative_results,
+                    output_path=output + '.pdf'
+                )
+            except ImportError as e:
+                click.echo(f"PDF generation requires additional dependencies: {str(e)}", err=True)
+                click.echo("Install with: pip install reportlab matplotlib pillow", err=True)
+            except Exception as pdf_error:
+                click.echo(f"PDF generation failed: {str(pdf_error)}", err=True)
+            else:
+                click.echo(f"\nProfessional PDF report generated: {pdf_path}")
+        else:
+            # Export using existing data exporter
+            try:
+                exported_file = exporter.export_case_data(
+                    pmi_estimate, temperature_data, case_info, output, export
+                )
             except Exception as export_error:
                 click.echo(f"Export failed: {str(export_error)}", err=True)
-        
-    except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
-        sys.exit(1)
+            else:
+                click.echo(f"\nData exported to: {exported_file}")
+    
 
 
 def display_alternative_methods_results(results, verbose: bool = False):
     """Display results from alternative PMI methods."""
-    click.echo(f"\n{'='*60}")
-    click.echo(f"ALTERNATIVE PMI METHODS COMPARISON")
-    click.echo(f"{'='*60}")
+    lines = []
+    
+    lines.append("\n" + RULE_60)
+    lines.append(f"ALTERNATIVE PMI METHODS COMPARISON")
+    lines.append(RULE_60)
     
     # Individual method results
-    click.echo(f"\nINDIVIDUAL METHOD RESULTS:")
-    click.echo("-" * 40)
+    lines.append(f"\nINDIVIDUAL METHOD RESULTS:")
+    lines.append(DIVIDER)
     
     for i, estimate in enumerate(results.estimates, 1):
-        method_name = estimate.method.value.replace('_', ' ').title()
-        click.echo(f"\n{i}. {method_name}")
-        click.echo(f"   PMI Estimate: {estimate.pmi_days:.1f} days ({estimate.pmi_hours:.1f} hours)")
-        click.echo(f"   Confidence: {estimate.confidence_low:.1f} - {estimate.confidence_high:.1f} days")
-        click.echo(f"   Reliability: {estimate.reliability_score:.0f}/100")
+        lines.append(
+            f"\n{i}. {pretty_name(estimate.method.value)}\n"
+            f"   PMI Estimate: {estimate.pmi_days:.1f} days ({estimate.pmi_hours:.1f} hours)\n"
+            f"   Confidence: {estimate.confidence_low:.1f} - {estimate.confidence_high:.1f} days\n"
+            f"   Reliability: {estimate.reliability_score:.0f}/100"
+        )
         
         if verbose:
-            click.echo(f"   Key Assumptions:")
-            for assumption in estimate.assumptions[:2]:  # Show first 2 assumptions
-                click.echo(f"     • {assumption}")
+            # Show first 2 assumptions
+            lines.append("   Key Assumptions:\n" + "\n".join(
+                f"     • {assumption}" for assumption in islice(estimate.assumptions, 2)
+            ))
             if len(estimate.assumptions) > 2:
-                click.echo(f"     ... and {len(estimate.assumptions) - 2} more")
+                lines.append(f"     ... and {len(estimate.assumptions) - 2} more")
     
     # Method agreement analysis
     agreement = results.method_agreement
-    click.echo(f"\nMETHOD AGREEMENT ANALYSIS:")
-    click.echo("-" * 40)
-    click.echo(f"Agreement Level: {agreement['agreement_level'].upper()}")
-    click.echo(f"Coefficient of Variation: {agreement['coefficient_of_variation']:.1f}%")
-    click.echo(f"PMI Range: {agreement['min_pmi']:.1f} - {agreement['max_pmi']:.1f} days")
-    click.echo(f"Mean PMI: {agreement['mean_pmi']:.1f} days")
-    click.echo(f"Standard Deviation: {agreement['std_deviation']:.1f} days")
+    lines.append(f"\nMETHOD AGREEMENT ANALYSIS:")
+    lines.append(DIVIDER)
+    lines.append(f"Agreement Level: {agreement['agreement_level'].upper()}")
+    lines.append(f"Coefficient of Variation: {agreement['coefficient_of_variation']:.1f}%")
+    lines.append(f"PMI Range: {agreement['min_pmi']:.1f} - {agreement['max_pmi']:.1f} days")
+    lines.append(f"Mean PMI: {agreement['mean_pmi']:.1f} days")
+    lines.append(f"Standard Deviation: {agreement['std_deviation']:.1f} days")
     
     # Consensus estimate
     consensus = results.consensus_estimate
-    click.echo(f"\nCONSENSUS ESTIMATE:")
-    click.echo("-" * 40)
-    click.echo(f"Method: {consensus['method'].replace('_', ' ').title()}")
-    click.echo(f"Consensus PMI: {consensus['pmi_days']:.1f} days ({consensus['pmi_hours']:.1f} hours)")
-    click.echo(f"Combined Confidence: {consensus['confidence_low']:.1f} - {consensus['confidence_high']:.1f} days")
+    lines.append(f"\nCONSENSUS ESTIMATE:")
+    lines.append(DIVIDER)
+    lines.append(f"Method: {pretty_name(consensus['method'])}")
+    lines.append(f"Consensus PMI: {consensus['pmi_days']:.1f} days ({consensus['pmi_hours']:.1f} hours)")
+    lines.append(f"Combined Confidence: {consensus['confidence_low']:.1f} - {consensus['confidence_high']:.1f} days")
     
     if 'methods_used' in consensus:
-        methods_list = [m.replace('_', ' ').title() for m in consensus['methods_used']]
-        click.echo(f"Based on: {', '.join(methods_list)}")
+        lines.append(f"Based on: {', '.join(pretty_name(m) for m in consensus['methods_used'])}")
     
     # Reliability assessment
     reliability = results.reliability_assessment
-    click.echo(f"\nRELIABILITY ASSESSMENT:")
-    click.echo("-" * 40)
-    click.echo(f"Overall Reliability: {reliability['overall_reliability']:.0f}/100")
-    click.echo(f"Method Count: {reliability['method_count']} methods")
+    lines.append(f"\nRELIABILITY ASSESSMENT:")
+    lines.append(DIVIDER)
+    lines.append(f"Overall Reliability: {reliability['overall_reliability']:.0f}/100")
+    lines.append(f"Method Count: {reliability['method_count']} methods")
     
     if verbose:
-        for factor in reliability['reliability_factors']:
-            click.echo(f"  • {factor}")
+        for factor in results.reliability_factors:
+            lines.append(f"  • {factor}")
     
     # Visual comparison
-    click.echo(f"\nMETHOD COMPARISON CHART:")
-    click.echo("-" * 40)
-    create_methods_comparison_chart(results.estimates)
+    lines.append(f"\nMETHOD COMPARISON CHART:")
+    lines.append(DIVIDER)
+    lines.extend(methods_comparison_chart_lines(results.estimates))
     
     # Recommendations
     if results.recommendations:
-        click.echo(f"\nMETHOD RECOMMENDATIONS:")
-        click.echo("-" * 40)
+        lines.append(f"\nMETHOD RECOMMENDATIONS:")
+        lines.append(DIVIDER)
         for i, rec in enumerate(results.recommendations, 1):
-            click.echo(f"{i}. {rec}")
+            lines.append(f"{i}. {rec}")
+    
+    write_lines(lines)
 
 
 def create_methods_comparison_chart(estimates):
     """Create a visual comparison chart for different methods."""
+    if estimates:
+        click.echo("\n".join(methods_comparison_chart_lines(estimates)))
+
+
+def methods_comparison_chart_lines(estimates) -> List[str]:
+    """Render the methods comparison chart as a list of lines."""
     if not estimates:
-        return
+        return []
     
-    max_pmi = max(est.pmi_days for est in estimates)
+    rows = [(est.method.value, est.pmi_days, est.reliability_score) for est in estimates]
+    max_pmi = max(row[1] for row in rows)
     
-    for estimate in estimates:
-        method_name = estimate.method.value.replace('_', ' ').title()
-        pmi = estimate.pmi_days
-        reliability = estimate.reliability_score
-        
+    lines = []
+    for method, pmi, reliability in rows:
         # Create proportional bar
         bar_length = int((pmi / max_pmi) * 30) if max_pmi > 0 else 1
         bar = "█" * bar_length
         
         # Reliability indicator
-        if reliability >= 85:
-            rel_icon = "🟢"
-        elif reliability >= 70:
-            rel_icon = "🟡"
-        elif reliability >= 55:
-            rel_icon = "🟠"
-        else:
-            rel_icon = "🔴"
+        rel_icon = RELIABILITY_ICONS[bisect_right(RELIABILITY_THRESHOLDS, reliability)]
         
         # Truncate method name for display
-        display_name = method_name[:15].ljust(15)
+        display_name = pretty_name(method)[:15].ljust(15)
         
-        click.echo(f"{display_name} {rel_icon} {bar} {pmi:.1f}d")
+        lines.append(f"{display_name} {rel_icon} {bar} {pmi:.1f}d")
+    
+    return lines
 
 
 def display_enhanced_validation_results(results: Dict, include_monte_carlo: bool, include_known_cases: bool):
     """Display results from enhanced validation analysis."""
-    click.echo(f"\n{'='*70}")
-    click.echo(f"ENHANCED VALIDATION ANALYSIS")
-    click.echo(f"{'='*70}")
+    lines = []
+    
+    lines.append("\n" + RULE_70)
+    lines.append(f"ENHANCED VALIDATION ANALYSIS")
+    lines.append(RULE_70)
     
     # Uncertainty Analysis
     if 'uncertainty_analysis' in results:
         ua = results['uncertainty_analysis']
-        click.echo(f"\nUNCERTAINTY PROPAGATION ANALYSIS:")
-        click.echo("-" * 40)
-        click.echo(f"Base PMI Estimate: {ua['base_pmi']:.1f} days")
-        click.echo(f"Total Uncertainty: ±{ua['total_uncertainty']:.1f} days")
-        click.echo(f"Relative Uncertainty: {ua['relative_uncertainty']:.1%}")
-        click.echo(f"95% Confidence (Propagated): {ua['propagated_confidence_95'][0]:.1f} - {ua['propagated_confidence_95'][1]:.1f} days")
+        lines.append(f"\nUNCERTAINTY PROPAGATION ANALYSIS:")
+        lines.append(DIVIDER)
+        lines.append(f"Base PMI Estimate: {ua['base_pmi']:.1f} days")
+        lines.append(f"Total Uncertainty: ±{ua['total_uncertainty']:.1f} days")
+        lines.append(f"Relative Uncertainty: {ua['relative_uncertainty']:.1%}")
+        lines.append(f"95% Confidence (Propagated): {ua['propagated_confidence_95'][0]:.1f} - {ua['propagated_confidence_95'][1]:.1f} days")
         
-        click.echo(f"\nUncertainty Components:")
+        lines.append(f"\nUncertainty Components:")
         for component in ua['uncertainty_components']:
-            click.echo(f"  • {component.description}: ±{component.value:.1f} days")
+            lines.append(f"  • {component.description}: ±{component.value:.1f} days")
     
     # Monte Carlo Results
     if include_monte_carlo and 'monte_carlo_results' in results:
         mc = results['monte_carlo_results']
-        click.echo(f"\nMONTE CARLO SIMULATION RESULTS:")
-        click.echo("-" * 40)
-        click.echo(f"Simulated Mean PMI: {mc.mean_pmi:.1f} days")
-        click.echo(f"Standard Deviation: {mc.std_pmi:.1f} days")
-        click.echo(f"Iterations Used: {mc.iterations_used:,}")
-        click.echo(f"Convergence Achieved: {'Yes' if mc.convergence_achieved else 'No'}")
+        lines.append(f"\nMONTE CARLO SIMULATION RESULTS:")
+        lines.append(DIVIDER)
+        lines.append(f"Simulated Mean PMI: {mc.mean_pmi:.1f} days")
+        lines.append(f"Standard Deviation: {mc.std_pmi:.1f} days")
+        lines.append(f"Iterations Used: {mc.iterations_used:,}")
+        lines.append(f"Convergence Achieved: {'Yes' if mc.convergence_achieved else 'No'}")
         
-        click.echo(f"\nSimulated Confidence Intervals:")
+        lines.append(f"\nSimulated Confidence Intervals:")
         for level, (low, high) in mc.confidence_intervals.items():
-            click.echo(f"  {level}%: {low:.1f} - {high:.1f} days")
+            lines.append(f"  {level}%: {low:.1f} - {high:.1f} days")
     
     # Cross-Validation Results
     if 'cross_validation_results' in results:
         cv = results['cross_validation_results']
-        click.echo(f"\nCROSS-VALIDATION ANALYSIS:")
-        click.echo("-" * 40)
-        click.echo(f"Consensus Estimate: {cv.consensus_estimate:.1f} days")
-        click.echo(f"Overall Confidence: {cv.overall_confidence:.0f}/100")
+        lines.append(f"\nCROSS-VALIDATION ANALYSIS:")
+        lines.append(DIVIDER)
+        lines.append(f"Consensus Estimate: {cv.consensus_estimate:.1f} days")
+        lines.append(f"Overall Confidence: {cv.overall_confidence:.0f}/100")
         
         if cv.outlier_methods:
-            click.echo(f"Outlier Methods: {', '.join(cv.outlier_methods)}")
+            lines.append(f"Outlier Methods: {', '.join(cv.outlier_methods)}")
         
-        click.echo(f"\nMethod Agreement Metrics:")
-        for metric, value in cv.method_agreement.items():
-            if isinstance(value, float):
-                if 'coefficient' in metric:
-                    click.echo(f"  {metric.replace('_', ' ').title()}: {value:.1%}")
-                else:
-                    click.echo(f"  {metric.replace('_', ' ').title()}: {value:.1f}")
+        lines.append(f"\nMethod Agreement Metrics:")
+        for label, value in cv.method_agreement_rows:
+            lines.append(f"  {label}: {value}")
     
     # Known Case Validation
     if include_known_cases and 'known_case_results' in results:
         kc = results['known_case_results']
         if kc:
-            click.echo(f"\nKNOWN CASE VALIDATION:")
-            click.echo("-" * 40)
-            click.echo(f"Cases Evaluated: {len(kc)}")
+            lines.append(f"\nKNOWN CASE VALIDATION:")
+            lines.append(DIVIDER)
+            lines.append(f"Cases Evaluated: {len(kc)}")
             
-            for case in kc[:3]:  # Show first 3 cases
+            for case in islice(kc, 3):  # Show first 3 cases
                 status = "✓" if case.within_confidence else "✗"
-                click.echo(f"  {status} {case.case_name}")
-                click.echo(f"    Published: {case.published_pmi:.1f}d, Calculated: {case.calculated_pmi:.1f}d")
-                click.echo(f"    Error: {case.relative_error:.1%}")
+                lines.append(f"  {status} {case.case_name}")
+                lines.append(f"    Published: {case.published_pmi:.1f}d, Calculated: {case.calculated_pmi:.1f}d")
+                lines.append(f"    Error: {case.relative_error:.1%}")
             
             if len(kc) > 3:
-                click.echo(f"    ... and {len(kc) - 3} more cases")
+                lines.append(f"    ... and {len(kc) - 3} more cases")
             
-            avg_error = sum(case.relative_error for case in kc) / len(kc)
-            within_ci_rate = sum(case.within_confidence for case in kc) / len(kc)
-            click.echo(f"\nValidation Summary:")
-            click.echo(f"  Average Error: {avg_error:.1%}")
-            click.echo(f"  Within Confidence Interval: {within_ci_rate:.1%}")
+            total_error = 0.0
+            within_ci = 0
+            for case in kc:
+                total_error += case.relative_error
+                within_ci += case.within_confidence
+            avg_error = total_error / len(kc)
+            within_ci_rate = within_ci / len(kc)
+            lines.append(f"\nValidation Summary:")
+            lines.append(f"  Average Error: {avg_error:.1%}")
+            lines.append(f"  Within Confidence Interval: {within_ci_rate:.1%}")
         else:
-            click.echo(f"\nKNOWN CASE VALIDATION:")
-            click.echo("-" * 40)
-            click.echo("No relevant known cases found for this species/stage combination")
+            lines.append(f"\nKNOWN CASE VALIDATION:")
+            lines.append(DIVIDER)
+            lines.append("No relevant known cases found for this species/stage combination")
     
     # Overall Validation Score
     if 'overall_validation_score' in results:
         score = results['overall_validation_score']
-        click.echo(f"\nOVERALL VALIDATION SCORE: {score:.0f}/100")
+        lines.append(f"\nOVERALL VALIDATION SCORE: {score:.0f}/100")
         
         if score >= 90:
             rating = "EXCELLENT"
@@ -492,14 +699,16 @@ def display_enhanced_validation_results(results: Dict, include_monte_carlo: bool
         else:
             rating = "POOR"
         
-        click.echo(f"Validation Rating: {rating}")
+        lines.append(f"Validation Rating: {rating}")
     
     # Recommendations
     if 'recommendations' in results and results['recommendations']:
-        click.echo(f"\nVALIDATION RECOMMENDATIONS:")
-        click.echo("-" * 40)
+        lines.append(f"\nVALIDATION RECOMMENDATIONS:")
+        lines.append(DIVIDER)
         for i, rec in enumerate(results['recommendations'], 1):
-            click.echo(f"{i}. {rec}")
+            lines.append(f"{i}. {rec}")
+    
+    write_lines(lines)
 
 
 if __name__ == '__main__':
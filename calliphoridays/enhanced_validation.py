@@ -9,15 +9,22 @@ This module provides advanced validation capabilities including:
 """
 
 import numpy as np
-import random
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import math
+import warnings
 
 from .models import ForensicSpecies, DevelopmentStage, get_development_threshold, get_species_info
 from .pmi_calculator import PMICalculator
 from .alternative_methods import AlternativePMICalculator, PMIMethod
+from ._validation_kernels import NUMBA_AVAILABLE, _converged_length, _mc_driver, _outlier_mask, warm_up
+
+
+# Keys every known validation case must provide
+KNOWN_CASE_KEYS = ('name', 'species', 'stage', 'temperature_data', 'published_pmi_days')
 
 
 class UncertaintySource(Enum):
@@ -46,7 +53,7 @@ class MonteCarloResult:
     mean_pmi: float
     std_pmi: float
     confidence_intervals: Dict[int, Tuple[float, float]]  # {95: (low, high), 99: (low, high)}
-    distribution: List[float]  # All simulated PMI values
+    distribution: np.ndarray  # All simulated PMI values (read-only float64 array)
     convergence_achieved: bool
     iterations_used: int
 
@@ -59,6 +66,7 @@ class CrossValidationResult:
     reliability_scores: Dict[str, float]
     outlier_methods: List[str]
     overall_confidence: float
+    method_agreement_rows: List[Tuple[str, str]] = field(default_factory=list)  # (label, formatted value)
 
 
 @dataclass
@@ -72,17 +80,125 @@ class KnownCaseResult:
     notes: str
 
 
+def _build_known_cases() -> Tuple[Dict, ...]:
+    """
+    Build the known validation cases from forensic entomology literature.
+    
+    Malformed cases are dropped with a warning. The result is a tuple because
+    it is shared by every validator in the process.
+    """
+    # Known cases from published studies for validation
+    cases = [
+        {
+            'name': 'Grassberger & Reiter 2001 - L. sericata 20C',
+            'species': ForensicSpecies.LUCILIA_SERICATA,
+            'stage': DevelopmentStage.THIRD_INSTAR,
+            'temperature_data': {'avg_temp': 20.0},
+            'published_pmi_days': 6.5,
+            'notes': 'Laboratory study, constant temperature'
+        },
+        {
+            'name': 'Grassberger & Reiter 2001 - L. sericata 25C',
+            'species': ForensicSpecies.LUCILIA_SERICATA,
+            'stage': DevelopmentStage.THIRD_INSTAR,
+            'temperature_data': {'avg_temp': 25.0},
+            'published_pmi_days': 4.2,
+            'notes': 'Laboratory study, constant temperature'
+        },
+        {
+            'name': 'Donovan et al. 2006 - C. vicina 15C',
+            'species': ForensicSpecies.CALLIPHORA_VICINA,
+            'stage': DevelopmentStage.THIRD_INSTAR,
+            'temperature_data': {'avg_temp': 15.0},
+            'published_pmi_days': 8.5,
+            'notes': 'Laboratory development study'
+        },
+        {
+            'name': 'Anderson 2000 - P. regina 18C',
+            'species': ForensicSpecies.PHORMIA_REGINA,
+            'stage': DevelopmentStage.THIRD_INSTAR,
+            'temperature_data': {'avg_temp': 18.0},
+            'published_pmi_days': 7.1,
+            'notes': 'Development rate study'
+        },
+        {
+            'name': 'Byrd & Butler 1997 - C. macellaria 28C',
+            'species': ForensicSpecies.COCHLIOMYIA_MACELLARIA,
+            'stage': DevelopmentStage.THIRD_INSTAR,
+            'temperature_data': {'avg_temp': 28.0},
+            'published_pmi_days': 3.8,
+            'notes': 'Warm climate development study'
+        }
+    ]
+    
+    # Drop malformed cases here so validation never has to guard each one
+    pmi_calculator = PMICalculator()
+    valid_cases = []
+    for case in cases:
+        missing = [key for key in KNOWN_CASE_KEYS if key not in case]
+        try:
+            if missing:
+                raise ValueError(f"missing {', '.join(missing)}")
+            if case['published_pmi_days'] <= 0:
+                raise ValueError("published PMI must be positive")
+            pmi_calculator.validate_temperature_data(case['temperature_data'])
+            get_development_threshold(case['species'], case['stage'])
+        except ValueError as e:
+            warnings.warn(f"Skipping known case {case.get('name', '?')}: {e}")
+            continue
+        valid_cases.append(case)
+    
+    return tuple(valid_cases)
+
+
+def _index_known_cases(cases: Tuple[Dict, ...]) -> Dict[Tuple[ForensicSpecies, DevelopmentStage], List[int]]:
+    """Map each (species, stage) pair to the positions of its known cases."""
+    index = defaultdict(list)
+    for position, case in enumerate(cases):
+        index[(case['species'], case['stage'])].append(position)
+    return dict(index)
+
+
+# Known cases are static, so they are built and indexed once per process. The
+# index maps (species, stage) to case positions, alongside parallel columns of
+# published PMIs and temperature data.
+_KNOWN_CASES = _build_known_cases()
+_KNOWN_CASES_BY_KEY = _index_known_cases(_KNOWN_CASES)
+_KNOWN_CASE_PUBLISHED = np.array([case['published_pmi_days'] for case in _KNOWN_CASES], dtype=np.float64)
+_KNOWN_CASE_PUBLISHED.flags.writeable = False
+_KNOWN_CASE_TEMPERATURES = tuple(case['temperature_data'] for case in _KNOWN_CASES)
+
+
 class EnhancedValidator:
     """
     Advanced validation system with uncertainty quantification and validation studies.
     """
     
-    def __init__(self):
+    # Whether the compiled validation kernels have been warmed up in this process
+    _kernels_ready = False
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Seed for Monte Carlo sampling. A seeded validator always
+                samples with NumPy, so the same seed gives the same results
+                whether or not Numba is installed; unseeded validators use
+                the compiled Numba driver when it is available.
+        """
+        if not EnhancedValidator._kernels_ready:
+            warm_up()
+            EnhancedValidator._kernels_ready = True
+        
         self.pmi_calculator = PMICalculator()
         self.alt_calculator = AlternativePMICalculator()
         
-        # Known validation cases from published literature
-        self.known_cases = self._load_known_cases()
+        # Random generator for Monte Carlo sampling. The Numba driver keeps its
+        # own per-thread streams and can't be seeded, so seeding opts out of it
+        self._rng = np.random.default_rng(seed)
+        self._use_mc_driver = NUMBA_AVAILABLE and seed is None
+        
+        # Known validation cases from published literature (shared by all validators)
+        self.known_cases = _KNOWN_CASES
         
         # Default uncertainty parameters
         self.default_uncertainties = {
@@ -114,9 +230,9 @@ class EnhancedValidator:
         Returns:
             Dictionary with uncertainty analysis results
         """
-        uncertainties = self.default_uncertainties.copy()
+        uncertainties = self.default_uncertainties
         if custom_uncertainties:
-            uncertainties.update(custom_uncertainties)
+            uncertainties = {**uncertainties, **custom_uncertainties}
         
         # Get base calculation
         base_pmi = self.pmi_calculator.calculate_pmi(
@@ -135,9 +251,7 @@ class EnhancedValidator:
         total_variance += temp_uncertainty.value ** 2
         
         # Development threshold uncertainty
-        threshold_uncertainty = self._calculate_threshold_uncertainty(
-            base_pmi, species, stage, uncertainties
-        )
+        threshold_uncertainty = self._calculate_threshold_uncertainty(base_pmi, uncertainties)
         uncertainty_components.append(threshold_uncertainty)
         total_variance += threshold_uncertainty.value ** 2
         
@@ -199,55 +313,67 @@ class EnhancedValidator:
         Returns:
             MonteCarloResult object
         """
-        pmi_samples = []
         convergence_window = 1000  # Check convergence every N iterations
         convergence_threshold = 0.01  # Relative change threshold for convergence
         
         # Get base threshold data for sampling
         threshold = get_development_threshold(species, stage)
         
-        for i in range(iterations):
-            # Sample uncertain parameters
-            sampled_temp = self._sample_temperature(temperature_data)
-            sampled_threshold_data = self._sample_development_threshold(threshold)
-            sampled_length = self._sample_specimen_length(specimen_length) if specimen_length else None
-            
-            try:
-                # Create modified temperature data
-                temp_data_sample = temperature_data.copy()
-                temp_data_sample['avg_temp'] = sampled_temp
-                
-                # Calculate PMI with sampled parameters
-                # We need to temporarily modify the threshold data
-                original_threshold = threshold
-                # Create a modified calculator for this sample
-                pmi_result = self._calculate_pmi_with_sampled_params(
-                    species, stage, temp_data_sample, sampled_threshold_data, sampled_length
-                )
-                
-                pmi_samples.append(pmi_result)
-                
-            except Exception:
-                # Skip invalid samples
-                continue
+        # Sampling parameters are fixed for the whole run
+        avg_temp = temperature_data['avg_temp']
+        temp_std = self.default_uncertainties[UncertaintySource.TEMPERATURE_MEASUREMENT]
+        mid_add = (threshold.min_add + threshold.max_add) / 2
+        add_std = mid_add * self.default_uncertainties[UncertaintySource.DEVELOPMENT_THRESHOLD]
+        base_temp_std = threshold.base_temp * 0.1  # 10% uncertainty
+        length = specimen_length if specimen_length else math.nan
+        length_std = length * self.default_uncertainties[UncertaintySource.SPECIMEN_LENGTH]
+        typical_length = threshold.typical_length_mm or math.nan
+        
+        if self._use_mc_driver:
+            # Draw and evaluate every sample in one compiled, multi-threaded loop
+            pmi_samples = _mc_driver(iterations, avg_temp, temp_std, mid_add, add_std,
+                                     threshold.base_temp, base_temp_std,
+                                     length, length_std, typical_length)
+        else:
+            # Sample all uncertain parameters at once and evaluate the PMI as array operations
+            # (clipping is done in place, so each parameter needs a single buffer)
+            sampled_temps = self._rng.normal(avg_temp, temp_std, iterations)
+            sampled_add = self._rng.normal(mid_add, add_std, iterations)
+            np.maximum(sampled_add, 0.1, out=sampled_add)  # Ensure positive
+            sampled_base_temp = self._rng.normal(threshold.base_temp, base_temp_std, iterations)
+            np.maximum(sampled_base_temp, 0.0, out=sampled_base_temp)  # Ensure non-negative
+            sampled_lengths = self._sample_specimen_length(length, length_std, iterations) if specimen_length else None
             
-            # Check convergence periodically
-            if i > 0 and i % convergence_window == 0:
-                if self._check_convergence(pmi_samples, convergence_threshold):
-                    break
+            pmi_samples = self._calculate_pmi_with_sampled_params(
+                sampled_temps, sampled_add, sampled_base_temp, sampled_lengths, typical_length
+            )
+        
+        # Skip invalid samples (only copies the buffer when there are any)
+        finite = np.isfinite(pmi_samples)
+        if not finite.all():
+            pmi_samples = pmi_samples[finite]
+        
+        # Stop at the first checkpoint where the running estimate has converged,
+        # as if the samples had been drawn one at a time
+        pmi_samples = pmi_samples[:_converged_length(pmi_samples, convergence_window, convergence_threshold)]
+        
+        # The samples are handed out as-is, so freeze them against accidental edits
+        pmi_samples.flags.writeable = False
         
         # Calculate statistics
-        pmi_array = np.array(pmi_samples)
-        mean_pmi = np.mean(pmi_array)
-        std_pmi = np.std(pmi_array)
+        mean_pmi = float(pmi_samples.mean())
+        std_pmi = float(pmi_samples.std())
         
-        # Calculate confidence intervals
-        confidence_intervals = {}
+        # Calculate confidence intervals, sorting the samples only once
+        percentiles = []
         for level in confidence_levels:
             alpha = (100 - level) / 2
-            lower = np.percentile(pmi_array, alpha)
-            upper = np.percentile(pmi_array, 100 - alpha)
-            confidence_intervals[level] = (lower, upper)
+            percentiles += [alpha, 100 - alpha]
+        bounds = np.percentile(pmi_samples, percentiles)
+        confidence_intervals = {
+            level: (float(bounds[2 * i]), float(bounds[2 * i + 1]))
+            for i, level in enumerate(confidence_levels)
+        }
         
         return MonteCarloResult(
             mean_pmi=mean_pmi,
@@ -262,7 +388,8 @@ class EnhancedValidator:
                               species: ForensicSpecies,
                               stage: DevelopmentStage,
                               temperature_data: Dict,
-                              specimen_length: Optional[float] = None) -> CrossValidationResult:
+                              specimen_length: Optional[float] = None,
+                              parallel: bool = False) -> CrossValidationResult:
         """
         Perform cross-validation using multiple PMI calculation methods.
         
@@ -271,38 +398,43 @@ class EnhancedValidator:
             stage: Development stage
             temperature_data: Temperature data
             specimen_length: Optional specimen length
+            parallel: Evaluate the methods on a thread pool
             
         Returns:
             CrossValidationResult object
         """
         # Get results from all available methods
         alt_results = self.alt_calculator.calculate_all_methods(
-            species, stage, temperature_data, specimen_length
+            species, stage, temperature_data, specimen_length, parallel=parallel
         )
         
-        # Extract PMI estimates
-        method_estimates = {}
-        reliability_scores = {}
+        # Extract PMI estimates as arrays shared by every summary below
+        methods = [estimate.method.value for estimate in alt_results.estimates]
+        count = len(methods)
+        estimates = np.fromiter((estimate.pmi_days for estimate in alt_results.estimates),
+                                dtype=np.float64, count=count)
+        reliabilities = np.fromiter((estimate.reliability_score for estimate in alt_results.estimates),
+                                    dtype=np.float64, count=count)
+        reliability_scores = {
+            estimate.method.value: estimate.reliability_score for estimate in alt_results.estimates
+        }
         
-        for estimate in alt_results.estimates:
-            method_name = estimate.method.value
-            method_estimates[method_name] = estimate.pmi_days
-            reliability_scores[method_name] = estimate.reliability_score
+        # Summary statistics shared by the agreement and outlier checks
+        stats = self._method_stats(estimates)
         
         # Calculate method agreement
-        method_agreement = self._calculate_method_agreement(method_estimates)
+        method_agreement = self._calculate_method_agreement(estimates, stats)
         
         # Identify outlier methods
-        outlier_methods = self._identify_outlier_methods(method_estimates)
+        outlier_mask = self._identify_outlier_methods(estimates, stats)
+        outlier_methods = [method for method, is_outlier in zip(methods, outlier_mask) if is_outlier]
         
         # Calculate consensus estimate (weighted by reliability)
-        consensus_estimate = self._calculate_weighted_consensus(
-            method_estimates, reliability_scores, outlier_methods
-        )
+        consensus_estimate = self._calculate_weighted_consensus(estimates, reliabilities, outlier_mask)
         
         # Calculate overall confidence
         overall_confidence = self._calculate_overall_confidence(
-            method_agreement, reliability_scores, outlier_methods
+            method_agreement, reliabilities, outlier_methods
         )
         
         return CrossValidationResult(
@@ -310,7 +442,8 @@ class EnhancedValidator:
             consensus_estimate=consensus_estimate,
             reliability_scores=reliability_scores,
             outlier_methods=outlier_methods,
-            overall_confidence=overall_confidence
+            overall_confidence=overall_confidence,
+            method_agreement_rows=self._format_method_agreement(method_agreement)
         )
     
     def validate_against_known_cases(self,
@@ -331,59 +464,51 @@ class EnhancedValidator:
         results = []
         
         # Filter known cases for this species and stage
-        relevant_cases = [
-            case for case in self.known_cases
-            if case['species'] == species and case['stage'] == stage
-        ]
+        relevant = _KNOWN_CASES_BY_KEY.get((species, stage), [])
         
         if verbose:
-            print(f"Found {len(relevant_cases)} known cases for {species.value} {stage.value}")
-        
-        for case in relevant_cases:
-            try:
-                # Calculate PMI using our method
-                calculated_pmi = self.pmi_calculator.calculate_pmi(
-                    species=case['species'],
-                    stage=case['stage'],
-                    temperature_data=case['temperature_data'],
-                    specimen_length=case.get('specimen_length')
-                )
-                
-                # Compare with published result
-                published_pmi = case['published_pmi_days']
-                calculated_pmi_days = calculated_pmi['pmi_days']
-                
-                relative_error = abs(calculated_pmi_days - published_pmi) / published_pmi
-                
-                # Check if within confidence interval
-                within_confidence = (
-                    calculated_pmi['confidence_low'] <= published_pmi <= 
-                    calculated_pmi['confidence_high']
-                )
-                
-                result = KnownCaseResult(
-                    case_name=case['name'],
-                    published_pmi=published_pmi,
-                    calculated_pmi=calculated_pmi_days,
-                    relative_error=relative_error,
-                    within_confidence=within_confidence,
-                    notes=case.get('notes', '')
-                )
-                
-                results.append(result)
-                
-                if verbose:
-                    print(f"Case: {case['name']}")
-                    print(f"  Published: {published_pmi:.1f} days")
-                    print(f"  Calculated: {calculated_pmi_days:.1f} days")
-                    print(f"  Error: {relative_error:.1%}")
-                    print(f"  Within CI: {within_confidence}")
-                    print()
-                
-            except Exception as e:
-                if verbose:
-                    print(f"Error validating case {case['name']}: {e}")
-                continue
+            print(f"Found {len(relevant)} known cases for {species.value} {stage.value}")
+        
+        for index in relevant:
+            case = _KNOWN_CASES[index]
+            # Calculate PMI using our method
+            calculated_pmi = self.pmi_calculator.calculate_pmi(
+                species=species,
+                stage=stage,
+                temperature_data=_KNOWN_CASE_TEMPERATURES[index],
+                specimen_length=case.get('specimen_length')
+            )
+            
+            # Compare with published result
+            published_pmi = float(_KNOWN_CASE_PUBLISHED[index])
+            calculated_pmi_days = calculated_pmi['pmi_days']
+            
+            relative_error = abs(calculated_pmi_days - published_pmi) / published_pmi
+            
+            # Check if within confidence interval
+            within_confidence = (
+                calculated_pmi['confidence_low'] <= published_pmi <= 
+                calculated_pmi['confidence_high']
+            )
+            
+            result = KnownCaseResult(
+                case_name=case['name'],
+                published_pmi=published_pmi,
+                calculated_pmi=calculated_pmi_days,
+                relative_error=relative_error,
+                within_confidence=within_confidence,
+                notes=case.get('notes', '')
+            )
+            
+            results.append(result)
+            
+            if verbose:
+                print(f"Case: {case['name']}")
+                print(f"  Published: {published_pmi:.1f} days")
+                print(f"  Calculated: {calculated_pmi_days:.1f} days")
+                print(f"  Error: {relative_error:.1%}")
+                print(f"  Within CI: {within_confidence}")
+                print()
         
         return results
     
@@ -391,7 +516,9 @@ class EnhancedValidator:
                                       species: ForensicSpecies,
                                       stage: DevelopmentStage,
                                       temperature_data: Dict,
-                                      specimen_length: Optional[float] = None) -> Dict:
+                                      specimen_length: Optional[float] = None,
+                                      include_monte_carlo: bool = True,
+                                      verbose: bool = False) -> Dict:
         """
         Generate a comprehensive validation report combining all methods.
         
@@ -400,24 +527,45 @@ class EnhancedValidator:
             stage: Development stage
             temperature_data: Temperature data
             specimen_length: Optional specimen length
+            include_monte_carlo: Whether to include Monte Carlo simulation
+            verbose: Whether to show detailed known-case output
             
         Returns:
             Comprehensive validation results dictionary
         """
-        # Perform all validation analyses
-        uncertainty_analysis = self.propagate_uncertainties(
-            species, stage, temperature_data, specimen_length
-        )
+        # Perform all validation analyses; they are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            uncertainty_future = executor.submit(
+                self.propagate_uncertainties, species, stage, temperature_data, specimen_length
+            )
+            if include_monte_carlo:
+                monte_carlo_future = executor.submit(
+                    self.monte_carlo_simulation, species, stage, temperature_data, specimen_length,
+                    iterations=5000
+                )
+            cross_validation_future = executor.submit(
+                self.cross_validate_methods, species, stage, temperature_data, specimen_length
+            )
         
-        monte_carlo_results = self.monte_carlo_simulation(
-            species, stage, temperature_data, specimen_length, iterations=5000
-        )
+        uncertainty_analysis = uncertainty_future.result()
+        cross_validation_results = cross_validation_future.result()
         
-        cross_validation_results = self.cross_validate_methods(
-            species, stage, temperature_data, specimen_length
+        # Known cases are cheap; checking them last keeps verbose output in order
+        known_case_results = self.validate_against_known_cases(species, stage, verbose)
+        
+        recommendations = self._generate_validation_recommendations(
+            uncertainty_analysis, cross_validation_results, known_case_results
         )
         
-        known_case_results = self.validate_against_known_cases(species, stage)
+        if not include_monte_carlo:
+            return {
+                'uncertainty_analysis': uncertainty_analysis,
+                'cross_validation_results': cross_validation_results,
+                'known_case_results': known_case_results,
+                'recommendations': recommendations
+            }
+        
+        monte_carlo_results = monte_carlo_future.result()
         
         # Calculate overall validation score
         validation_score = self._calculate_overall_validation_score(
@@ -431,9 +579,7 @@ class EnhancedValidator:
             'cross_validation_results': cross_validation_results,
             'known_case_results': known_case_results,
             'overall_validation_score': validation_score,
-            'recommendations': self._generate_validation_recommendations(
-                uncertainty_analysis, cross_validation_results, known_case_results
-            )
+            'recommendations': recommendations
         }
     
     # Helper methods
@@ -459,10 +605,8 @@ class EnhancedValidator:
             impact_factor=1.0
         )
     
-    def _calculate_threshold_uncertainty(self, base_pmi: Dict, species: ForensicSpecies,
-                                       stage: DevelopmentStage, uncertainties: Dict) -> UncertaintyComponent:
+    def _calculate_threshold_uncertainty(self, base_pmi: Dict, uncertainties: Dict) -> UncertaintyComponent:
         """Calculate uncertainty from development threshold variation."""
-        threshold = get_development_threshold(species, stage)
         relative_uncertainty = uncertainties[UncertaintySource.DEVELOPMENT_THRESHOLD]
         
         # Development threshold uncertainty directly propagates to PMI
@@ -490,137 +634,86 @@ class EnhancedValidator:
             impact_factor=0.5
         )
     
-    def _sample_temperature(self, temp_data: Dict) -> float:
-        """Sample temperature from uncertainty distribution."""
-        avg_temp = temp_data['avg_temp']
-        temp_std = self.default_uncertainties[UncertaintySource.TEMPERATURE_MEASUREMENT]
-        return np.random.normal(avg_temp, temp_std)
+    def _sample_specimen_length(self, length: float, length_std: float, size: int) -> np.ndarray:
+        """Sample specimen lengths from the uncertainty distribution."""
+        sampled_lengths = self._rng.normal(length, length_std, size)
+        return np.maximum(sampled_lengths, 0.1, out=sampled_lengths)
     
-    def _sample_development_threshold(self, threshold) -> Dict:
-        """Sample development threshold parameters."""
-        relative_uncertainty = self.default_uncertainties[UncertaintySource.DEVELOPMENT_THRESHOLD]
-        
-        # Sample ADD threshold
-        mid_add = (threshold.min_add + threshold.max_add) / 2
-        add_std = mid_add * relative_uncertainty
-        sampled_add = np.random.normal(mid_add, add_std)
-        
-        # Sample base temperature
-        base_temp_std = threshold.base_temp * 0.1  # 10% uncertainty
-        sampled_base_temp = np.random.normal(threshold.base_temp, base_temp_std)
-        
-        return {
-            'sampled_add': max(0.1, sampled_add),  # Ensure positive
-            'sampled_base_temp': max(0, sampled_base_temp)  # Ensure non-negative
-        }
-    
-    def _sample_specimen_length(self, length: float) -> float:
-        """Sample specimen length from uncertainty distribution."""
-        relative_uncertainty = self.default_uncertainties[UncertaintySource.SPECIMEN_LENGTH]
-        length_std = length * relative_uncertainty
-        return max(0.1, np.random.normal(length, length_std))
-    
-    def _calculate_pmi_with_sampled_params(self, species: ForensicSpecies, stage: DevelopmentStage,
-                                         temp_data: Dict, threshold_data: Dict, 
-                                         specimen_length: Optional[float]) -> float:
-        """Calculate PMI with sampled parameters."""
-        avg_temp = temp_data['avg_temp']
-        sampled_add = threshold_data['sampled_add']
-        sampled_base_temp = threshold_data['sampled_base_temp']
-        
-        if avg_temp <= sampled_base_temp:
-            effective_temp = 0.5  # Minimal effective temperature
-        else:
-            effective_temp = avg_temp - sampled_base_temp
+    def _calculate_pmi_with_sampled_params(self, avg_temp: np.ndarray, sampled_add: np.ndarray,
+                                         sampled_base_temp: np.ndarray,
+                                         specimen_length: Optional[np.ndarray],
+                                         typical_length_mm: float) -> np.ndarray:
+        """Calculate PMI for arrays of sampled parameters (NaN marks an unknown typical length)."""
+        # Minimal effective temperature at or below the base temperature
+        effective_temp = avg_temp - sampled_base_temp
+        effective_temp[effective_temp <= 0] = 0.5
         
         # Apply specimen length adjustment if provided
-        if specimen_length:
+        if specimen_length is not None and not math.isnan(typical_length_mm):
             # Simple length-based adjustment
-            threshold = get_development_threshold(species, stage)
-            if threshold.typical_length_mm:
-                length_ratio = specimen_length / threshold.typical_length_mm
-                if length_ratio < 0.8:
-                    sampled_add *= 0.7  # Smaller specimens, less development
-                elif length_ratio > 1.2:
-                    sampled_add *= 1.3  # Larger specimens, more development
-        
-        return sampled_add / effective_temp
-    
-    def _check_convergence(self, samples: List[float], threshold: float) -> bool:
-        """Check if Monte Carlo simulation has converged."""
-        if len(samples) < 2000:  # Need minimum samples
-            return False
+            length_ratio = specimen_length / typical_length_mm
+            # Smaller specimens, less development; larger specimens, more development
+            sampled_add = sampled_add.copy()
+            sampled_add[length_ratio < 0.8] *= 0.7
+            sampled_add[length_ratio > 1.2] *= 1.3
         
-        # Check last 1000 vs previous 1000 samples
-        recent_mean = np.mean(samples[-1000:])
-        previous_mean = np.mean(samples[-2000:-1000])
-        
-        if previous_mean == 0:
-            return False
-        
-        relative_change = abs(recent_mean - previous_mean) / previous_mean
-        return relative_change < threshold
+        return np.divide(sampled_add, effective_temp, out=effective_temp)
     
-    def _calculate_method_agreement(self, method_estimates: Dict[str, float]) -> Dict[str, float]:
+    def _method_stats(self, estimates: np.ndarray) -> Tuple[float, float, float, float]:
+        """Return (mean, std, q1, q3) of the method estimates."""
+        q1, q3 = np.quantile(estimates, [0.25, 0.75])
+        return estimates.mean(), estimates.std(), q1, q3
+    
+    def _calculate_method_agreement(self, estimates: np.ndarray,
+                                  stats: Tuple[float, float, float, float]) -> Dict[str, float]:
         """Calculate agreement metrics between methods."""
-        estimates = list(method_estimates.values())
-        mean_estimate = np.mean(estimates)
-        std_estimate = np.std(estimates)
+        mean_estimate, std_estimate, q1, q3 = stats
         
         # Calculate pairwise correlations and agreements
         agreement_metrics = {
             'coefficient_of_variation': std_estimate / mean_estimate if mean_estimate > 0 else float('inf'),
-            'range': max(estimates) - min(estimates),
-            'iqr': np.percentile(estimates, 75) - np.percentile(estimates, 25),
+            'range': estimates.max() - estimates.min(),
+            'iqr': q3 - q1,
             'mean_estimate': mean_estimate,
             'std_estimate': std_estimate
         }
         
         return agreement_metrics
     
-    def _identify_outlier_methods(self, method_estimates: Dict[str, float]) -> List[str]:
-        """Identify outlier methods using statistical criteria."""
-        estimates = np.array(list(method_estimates.values()))
-        methods = list(method_estimates.keys())
-        
+    def _format_method_agreement(self, method_agreement: Dict[str, float]) -> List[Tuple[str, str]]:
+        """Format agreement metrics as (label, value) rows for display."""
+        rows = []
+        for metric, value in method_agreement.items():
+            if isinstance(value, float):
+                label = metric.replace('_', ' ').title()
+                rows.append((label, f"{value:.1%}" if 'coefficient' in metric else f"{value:.1f}"))
+        
+        return rows
+    
+    def _identify_outlier_methods(self, estimates: np.ndarray,
+                                stats: Tuple[float, float, float, float]) -> np.ndarray:
+        """Flag outlier method estimates using statistical criteria."""
         # Use IQR method to identify outliers
-        q1 = np.percentile(estimates, 25)
-        q3 = np.percentile(estimates, 75)
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        
-        outliers = []
-        for method, estimate in method_estimates.items():
-            if estimate < lower_bound or estimate > upper_bound:
-                outliers.append(method)
-        
-        return outliers
+        _, _, q1, q3 = stats
+        return _outlier_mask(estimates, q1, q3)
     
-    def _calculate_weighted_consensus(self, method_estimates: Dict[str, float],
-                                    reliability_scores: Dict[str, float],
-                                    outlier_methods: List[str]) -> float:
+    def _calculate_weighted_consensus(self, estimates: np.ndarray, reliabilities: np.ndarray,
+                                    outlier_mask: np.ndarray) -> float:
         """Calculate reliability-weighted consensus estimate."""
         # Exclude outlier methods
-        valid_methods = {k: v for k, v in method_estimates.items() if k not in outlier_methods}
-        valid_reliabilities = {k: v for k, v in reliability_scores.items() if k not in outlier_methods}
-        
-        if not valid_methods:
-            return np.mean(list(method_estimates.values()))
+        valid = ~outlier_mask
+        if not valid.any():
+            return estimates.mean()
         
         # Calculate weighted average
-        total_weight = 0
-        weighted_sum = 0
+        valid_estimates = estimates[valid]
+        weights = reliabilities[valid] / 100  # Convert to 0-1 scale
+        total_weight = weights.sum()
         
-        for method, estimate in valid_methods.items():
-            weight = valid_reliabilities.get(method, 50) / 100  # Convert to 0-1 scale
-            weighted_sum += estimate * weight
-            total_weight += weight
-        
-        return weighted_sum / total_weight if total_weight > 0 else np.mean(list(valid_methods.values()))
+        return (valid_estimates * weights).sum() / total_weight if total_weight > 0 else valid_estimates.mean()
     
     def _calculate_overall_confidence(self, method_agreement: Dict[str, float],
-                                    reliability_scores: Dict[str, float],
+                                    reliabilities: np.ndarray,
                                     outlier_methods: List[str]) -> float:
         """Calculate overall confidence in the analysis."""
         # Start with base confidence
@@ -640,7 +733,7 @@ class EnhancedValidator:
         confidence -= outlier_penalty
         
         # Adjust based on average reliability
-        avg_reliability = np.mean(list(reliability_scores.values()))
+        avg_reliability = reliabilities.mean()
         if avg_reliability < 60:
             confidence -= 20
         elif avg_reliability < 80:
@@ -670,8 +763,11 @@ class EnhancedValidator:
         
         # Known case validation component (30% weight)
         if known_case_results:
-            avg_error = np.mean([r.relative_error for r in known_case_results])
-            within_ci_rate = np.mean([r.within_confidence for r in known_case_results])
+            count = len(known_case_results)
+            avg_error = np.fromiter((r.relative_error for r in known_case_results),
+                                    dtype=np.float64, count=count).mean()
+            within_ci_rate = np.fromiter((r.within_confidence for r in known_case_results),
+                                         dtype=np.bool_, count=count).mean()
             
             known_case_score = 100 - (avg_error * 100) + (within_ci_rate * 20)
             score = score * 0.7 + max(0, min(100, known_case_score)) * 0.3
@@ -702,52 +798,6 @@ class EnhancedValidator:
                 recommendations.append("High error in known case validation - method may be less reliable")
         
         return recommendations
-    
-    def _load_known_cases(self) -> List[Dict]:
-        """Load known validation cases from forensic entomology literature."""
-        # Known cases from published studies for validation
-        return [
-            {
-                'name': 'Grassberger & Reiter 2001 - L. sericata 20C',
-                'species': ForensicSpecies.LUCILIA_SERICATA,
-                'stage': DevelopmentStage.THIRD_INSTAR,
-                'temperature_data': {'avg_temp': 20.0},
-                'published_pmi_days': 6.5,
-                'notes': 'Laboratory study, constant temperature'
-            },
-            {
-                'name': 'Grassberger & Reiter 2001 - L. sericata 25C',
-                'species': ForensicSpecies.LUCILIA_SERICATA,
-                'stage': DevelopmentStage.THIRD_INSTAR,
-                'temperature_data': {'avg_temp': 25.0},
-                'published_pmi_days': 4.2,
-                'notes': 'Laboratory study, constant temperature'
-            },
-            {
-                'name': 'Donovan et al. 2006 - C. vicina 15C',
-                'species': ForensicSpecies.CALLIPHORA_VICINA,
-                'stage': DevelopmentStage.THIRD_INSTAR,
-                'temperature_data': {'avg_temp': 15.0},
-                'published_pmi_days': 8.5,
-                'notes': 'Laboratory development study'
-            },
-            {
-                'name': 'Anderson 2000 - P. regina 18C',
-                'species': ForensicSpecies.PHORMIA_REGINA,
-                'stage': DevelopmentStage.THIRD_INSTAR,
-                'temperature_data': {'avg_temp': 18.0},
-                'published_pmi_days': 7.1,
-                'notes': 'Development rate study'
-            },
-            {
-                'name': 'Byrd & Butler 1997 - C. macellaria 28C',
-                'species': ForensicSpecies.COCHLIOMYIA_MACELLARIA,
-                'stage': DevelopmentStage.THIRD_INSTAR,
-                'temperature_data': {'avg_temp': 28.0},
-                'published_pmi_days': 3.8,
-                'notes': 'Warm climate development study'
-            }
-        ]
 
 
 def create_enhanced_validation_report(species: ForensicSpecies,
@@ -772,29 +822,8 @@ def create_enhanced_validation_report(species: ForensicSpecies,
     """
     validator = EnhancedValidator()
     
-    if include_monte_carlo:
-        return validator.comprehensive_validation_report(
-            species, stage, temperature_data, specimen_length
-        )
-    else:
-        # Skip Monte Carlo for faster analysis
-        uncertainty_analysis = validator.propagate_uncertainties(
-            species, stage, temperature_data, specimen_length
-        )
-        
-        cross_validation_results = validator.cross_validate_methods(
-            species, stage, temperature_data, specimen_length
-        )
-        
-        known_case_results = validator.validate_against_known_cases(
-            species, stage, verbose
-        )
-        
-        return {
-            'uncertainty_analysis': uncertainty_analysis,
-            'cross_validation_results': cross_validation_results,
-            'known_case_results': known_case_results,
-            'recommendations': validator._generate_validation_recommendations(
-                uncertainty_analysis, cross_validation_results, known_case_results
-            )
-        }
\ No newline at end of file
+    # Skipping Monte Carlo gives a faster analysis
+    return validator.comprehensive_validation_report(
+        species, stage, temperature_data, specimen_length,
+        include_monte_carlo=include_monte_carlo, verbose=verbose
+    )
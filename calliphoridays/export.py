@@ -1,15 +1,180 @@
 """
 Data export and reporting functionality for PMI estimates.
 """
+import importlib.util
+import io
 import json
-import csv
-import os
-from datetime import datetime
-from typing import Dict, List, Optional
-from pathlib import Path
+import re
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
 
 from .models import CalliphoridaeSpecies, DevelopmentStage, get_species_info
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow is large, so only check for it here and import it when a
+# Feather or batch CSV export actually runs
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+
+def _json_default(obj):
+    """Encode values neither JSON backend handles natively, the same way in both."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps(data: Dict, indent: bool = False) -> bytes:
+    """Encode export data as UTF-8 JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=_json_default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'),
+                      default=_json_default).encode('utf-8')
+
+
+# Everything that is not a letter or digit, stripped from case ID location codes
+NON_ALNUM_RE = re.compile(r'[\W_]+')
+
+# Columns of the wide batch CSV: (header, export data section, field)
+BATCH_CSV_COLUMNS = (
+    ('case_id', 'case_metadata', 'case_id'),
+    ('investigator', 'case_metadata', 'investigator'),
+    ('location', 'case_metadata', 'location'),
+    ('discovery_date', 'case_metadata', 'discovery_date'),
+    ('discovery_time', 'case_metadata', 'discovery_time'),
+    ('species', 'specimen_data', 'species'),
+    ('development_stage', 'specimen_data', 'development_stage'),
+    ('specimen_length_mm', 'specimen_data', 'specimen_length_mm'),
+    ('avg_temp_celsius', 'temperature_data', 'avg_temp_celsius'),
+    ('min_temp_celsius', 'temperature_data', 'min_temp_celsius'),
+    ('max_temp_celsius', 'temperature_data', 'max_temp_celsius'),
+    ('temperature_source', 'temperature_data', 'source'),
+    ('pmi_days', 'pmi_calculations', 'estimated_pmi_days'),
+    ('pmi_hours', 'pmi_calculations', 'estimated_pmi_hours'),
+    ('confidence_low_days', 'pmi_calculations', 'confidence_interval_low_days'),
+    ('confidence_high_days', 'pmi_calculations', 'confidence_interval_high_days'),
+    ('accumulated_degree_days', 'pmi_calculations', 'accumulated_degree_days'),
+    ('base_temp_celsius', 'pmi_calculations', 'base_temperature_celsius'),
+    ('development_threshold_add', 'pmi_calculations', 'development_threshold_add'),
+    ('export_timestamp', 'case_metadata', 'export_timestamp'),
+)
+
+# Human-readable report layout for _render_txt, filled with str.format_map
+TXT_REPORT_TEMPLATE = """\
+CALLIPHORIDAYS - FORENSIC ENTOMOLOGY PMI REPORT
+============================================================
+
+Generated: {export_timestamp}
+Tool Version: {tool_version}
+
+CASE INFORMATION
+------------------------------
+Case ID: {case_id}
+Investigator: {investigator}
+Location: {location}
+Discovery Date: {discovery_date}
+Discovery Time: {discovery_time}
+
+SPECIMEN ANALYSIS
+------------------------------
+Species: {species}
+Common Name: {species_common_name}
+Development Stage: {development_stage}
+Specimen Length: {specimen_length} mm
+Collection Method: {collection_method}
+Preservation Method: {preservation_method}
+
+TEMPERATURE DATA
+------------------------------
+Average Temperature: {avg_temp:.1f}°C
+Temperature Range: {min_temp}°C - {max_temp}°C
+Data Source: {temperature_source}
+Location: {location_coordinates}
+Date Range: {date_range}
+
+PMI ESTIMATE
+------------------------------
+Estimated PMI: {pmi_days:.1f} days ({pmi_hours:.1f} hours)
+Confidence Interval: {confidence_low:.1f} - {confidence_high:.1f} days
+Confidence Level: ±{confidence_percentage:.0f}%
+
+CALCULATION DETAILS
+------------------------------
+Method: {calculation_method}
+Accumulated Degree Days: {accumulated_dd:.1f} ADD
+Base Temperature: {base_temp:.1f}°C
+Development Threshold: {dev_threshold:.1f} ADD
+
+SCIENTIFIC BASIS & LIMITATIONS
+------------------------------
+Method Reference: {method_reference}
+Data Source: {development_data_source}
+
+Important Limitations:
+{limitations}
+
+DISCLAIMER
+------------------------------
+{accuracy_notes}
+
+This report should be reviewed and interpreted by qualified forensic entomologists.
+Results are estimates based on available scientific data and environmental conditions."""
+
+
+def _batch_columns(records: Iterable[Dict]) -> Dict[str, list]:
+    """Gather prepared export records into columns named by BATCH_CSV_COLUMNS."""
+    columns = {column: [] for column, _, _ in BATCH_CSV_COLUMNS}
+    for record in records:
+        for column, section, field in BATCH_CSV_COLUMNS:
+            columns[column].append(record[section][field])
+    return columns
+
+
+def _feather_bytes(columns: Dict[str, list]) -> bytes:
+    """Encode columns as an LZ4-compressed Feather (Arrow IPC) file."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Feather export. Install with: pip install pyarrow")
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    
+    sink = pa.BufferOutputStream()
+    feather.write_feather(pa.table(columns), sink, compression='lz4')
+    return sink.getvalue().to_pybytes()
+
+
+def _arrow_csv_column(values: list):
+    """
+    Build an Arrow array whose CSV text matches what csv.writer writes.
+    
+    Columns of plain floats are formatted by Arrow, with the '.0' that repr()
+    keeps on whole numbers put back; anything Arrow would render differently
+    (mixed types, exponents) is converted with str() first.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    kinds = {type(value) for value in values if value is not None}
+    if kinds == {float}:
+        array = pa.array(values, type=pa.float64())
+        text = pc.cast(array, pa.string())
+        if not pc.any(pc.match_substring(text, 'e')).as_py():
+            whole = pc.and_(pc.is_finite(array), pc.equal(array, pc.floor(array)))
+            return pc.if_else(whole, pc.binary_join_element_wise(text, '.0', ''), text)
+    elif kinds <= {int} or kinds == {str}:
+        return pa.array(values)
+    return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
 
 class DataExporter:
     """
@@ -17,10 +182,11 @@ class DataExporter:
     """
     
     def __init__(self):
-        self.supported_formats = ['json', 'csv', 'txt']
+        self.supported_formats = ['json', 'csv', 'txt', 'feather']
     
     def export_case_data(self, pmi_result: Dict, temperature_data: Dict, 
-                        case_info: Dict, output_path: str, format_type: str = 'json') -> str:
+                        case_info: Dict, output_path: str, format_type: str = 'json',
+                        compact: bool = False) -> str:
         """
         Export case data to specified format.
         
@@ -29,11 +195,33 @@ class DataExporter:
             temperature_data: Temperature data used
             case_info: Case metadata (location, dates, etc.)
             output_path: Output file path
-            format_type: Export format ('json', 'csv', 'txt')
+            format_type: Export format ('json', 'csv', 'txt', 'feather')
+            compact: Write JSON without indentation
             
         Returns:
             Path to exported file
         """
+        payload = self.render_case_data(pmi_result, temperature_data, case_info, format_type, compact)
+        return self.write_export(payload, output_path, format_type)
+    
+    def render_case_data(self, pmi_result: Dict, temperature_data: Dict, case_info: Dict,
+                         format_type: str = 'json', compact: bool = False) -> bytes:
+        """
+        Render case data to the encoded file contents for a format.
+        
+        Callers that export the same case more than once can keep the result
+        and pass it to write_export instead of rendering it again.
+        
+        Args:
+            pmi_result: PMI calculation results
+            temperature_data: Temperature data used
+            case_info: Case metadata (location, dates, etc.)
+            format_type: Export format ('json', 'csv', 'txt', 'feather')
+            compact: Write JSON without indentation
+            
+        Returns:
+            UTF-8 encoded file contents
+        """
         if format_type not in self.supported_formats:
             raise ValueError(f"Unsupported format: {format_type}. Supported: {self.supported_formats}")
         
@@ -41,33 +229,65 @@ class DataExporter:
         export_data = self._prepare_export_data(pmi_result, temperature_data, case_info)
         
         if format_type == 'json':
-            return self._export_json(export_data, output_path)
+            return _dumps(export_data, indent=not compact)
         elif format_type == 'csv':
-            return self._export_csv(export_data, output_path)
+            return self._render_csv(export_data)
         elif format_type == 'txt':
-            return self._export_txt(export_data, output_path)
+            return self._render_txt(export_data)
+        elif format_type == 'feather':
+            return _feather_bytes(_batch_columns([export_data]))
+    
+    def write_export(self, payload: bytes, output_path: str, format_type: str) -> str:
+        """
+        Write rendered case data, adding the format's extension if missing.
+        
+        Returns:
+            Path to exported file
+        """
+        extension = f'.{format_type}'
+        if not output_path.endswith(extension):
+            output_path += extension
+        
+        with open(output_path, 'wb') as f:
+            f.write(payload)
+        
+        return output_path
     
-    def _prepare_export_data(self, pmi_result: Dict, temperature_data: Dict, case_info: Dict) -> Dict:
-        """Prepare comprehensive data structure for export."""
+    def _prepare_export_data(self, pmi_result: Dict, temperature_data: Dict, case_info: Dict,
+                             timestamp: Optional[str] = None, ts_tag: Optional[str] = None) -> Dict:
+        """
+        Prepare comprehensive data structure for export.
+        
+        Batch exports pass a precomputed ISO ``timestamp`` and case-ID
+        ``ts_tag`` so every record shares one export time; otherwise the
+        current time is used.
+        """
         
         # Convert enum objects to strings for serialization
         species = pmi_result['species']
         stage = pmi_result['stage']
+        is_species = isinstance(species, CalliphoridaeSpecies)
+        
+        # Only build the fallback ID when the caller didn't supply one
+        if 'case_id' in case_info:
+            case_id = case_info['case_id']
+        else:
+            case_id = f"PMI_{ts_tag or datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         export_data = {
             'case_metadata': {
-                'export_timestamp': datetime.now().isoformat(),
+                'export_timestamp': timestamp or datetime.now().isoformat(),
                 'tool_version': '0.1.0',
-                'case_id': case_info.get('case_id', f"PMI_{datetime.now().strftime('%Y%m%d_%H%M%S')}"),
+                'case_id': case_id,
                 'investigator': case_info.get('investigator', 'Unknown'),
                 'location': case_info.get('location', 'Unknown'),
                 'discovery_date': case_info.get('discovery_date', 'Unknown'),
                 'discovery_time': case_info.get('discovery_time', None)
             },
             'specimen_data': {
-                'species': species.value if hasattr(species, 'value') else str(species),
-                'species_common_name': get_species_info(species)['common_name'] if hasattr(species, 'value') else 'Unknown',
-                'development_stage': stage.value if hasattr(stage, 'value') else str(stage),
+                'species': species.value if is_species else str(species),
+                'species_common_name': get_species_info(species)['common_name'] if is_species else 'Unknown',
+                'development_stage': stage.value if isinstance(stage, DevelopmentStage) else str(stage),
                 'specimen_length_mm': case_info.get('specimen_length'),
                 'collection_method': case_info.get('collection_method', 'Not specified'),
                 'preservation_method': case_info.get('preservation_method', 'Not specified')
@@ -107,164 +327,217 @@ class DataExporter:
         
         return export_data
     
-    def _export_json(self, data: Dict, output_path: str) -> str:
-        """Export data as JSON file."""
-        if not output_path.endswith('.json'):
-            output_path += '.json'
+    def export_batch_cases(self, cases: Iterable[Tuple[Dict, Dict, Dict]], output_path: str,
+                           format_type: str = 'json') -> str:
+        """
+        Export many cases to a single file.
+        
+        JSON batches are written as JSON Lines, one full record per case. CSV
+        batches are written wide, one row per case with the BATCH_CSV_COLUMNS
+        fields, so they load directly into tabular tools. Feather batches hold
+        the same columns as an LZ4-compressed Arrow IPC file (needs pyarrow).
+        
+        CSV quoting depends on whether pyarrow is installed: with it every
+        string field is quoted, without it only fields that need quoting are.
+        Either file reads back to the same rows with csv.DictReader.
+        
+        Args:
+            cases: (pmi_result, temperature_data, case_info) tuples, as passed
+                to export_case_data
+            output_path: Output file path
+            format_type: Export format ('json', 'csv', 'feather')
+            
+        Returns:
+            Path to exported file
+        """
+        # One clock read for the whole batch rather than two per case
+        ts = datetime.now()
+        stamp = (ts.isoformat(), ts.strftime('%Y%m%d_%H%M%S'))
+        
+        if format_type == 'json':
+            return self._export_batch_jsonl(cases, output_path, stamp)
+        elif format_type == 'csv':
+            return self._export_batch_csv(cases, output_path, stamp)
+        elif format_type == 'feather':
+            return self._export_batch_feather(cases, output_path, stamp)
+        raise ValueError(f"Unsupported batch format: {format_type}. Supported: ['json', 'csv', 'feather']")
+    
+    def _export_batch_jsonl(self, cases: Iterable[Tuple[Dict, Dict, Dict]], output_path: str,
+                            stamp: Tuple[str, str]) -> str:
+        """Export cases as a JSON Lines file."""
+        if not output_path.endswith('.jsonl'):
+            output_path += '.jsonl'
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # One compact record per line, written as each case is prepared
+        with open(output_path, 'wb') as f:
+            for pmi_result, temperature_data, case_info in cases:
+                record = self._prepare_export_data(pmi_result, temperature_data, case_info, *stamp)
+                f.write(_dumps(record))
+                f.write(b'\n')
         
         return output_path
     
-    def _export_csv(self, data: Dict, output_path: str) -> str:
-        """Export data as CSV file."""
+    def _export_batch_csv(self, cases: Iterable[Tuple[Dict, Dict, Dict]], output_path: str,
+                          stamp: Tuple[str, str]) -> str:
+        """
+        Export cases as a wide CSV file, one row per case.
+        
+        With pyarrow installed the columns are written by Arrow's CSV writer,
+        which formats numbers in C rather than per cell in Python; otherwise
+        the csv module writes the rows. Both give the same values when read
+        back, but Arrow quotes every string field.
+        """
         if not output_path.endswith('.csv'):
             output_path += '.csv'
         
-        # Flatten data for CSV format
-        csv_rows = []
+        if PYARROW_AVAILABLE:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            
+            records = (self._prepare_export_data(pmi_result, temperature_data, case_info, *stamp)
+                       for pmi_result, temperature_data, case_info in cases)
+            columns = {name: _arrow_csv_column(values)
+                       for name, values in _batch_columns(records).items()}
+            pa_csv.write_csv(pa.table(columns), output_path)
+            return output_path
+        
+        import csv  # Only needed for this format
+        
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([column for column, _, _ in BATCH_CSV_COLUMNS])
+            for pmi_result, temperature_data, case_info in cases:
+                record = self._prepare_export_data(pmi_result, temperature_data, case_info, *stamp)
+                writer.writerow([record[section][field] for _, section, field in BATCH_CSV_COLUMNS])
+        
+        return output_path
+    
+    def _export_batch_feather(self, cases: Iterable[Tuple[Dict, Dict, Dict]], output_path: str,
+                              stamp: Tuple[str, str]) -> str:
+        """Export cases as a Feather (Arrow IPC) file, one row per case."""
+        if not output_path.endswith('.feather'):
+            output_path += '.feather'
+        
+        records = (self._prepare_export_data(pmi_result, temperature_data, case_info, *stamp)
+                   for pmi_result, temperature_data, case_info in cases)
+        payload = _feather_bytes(_batch_columns(records))
+        
+        with open(output_path, 'wb') as f:
+            f.write(payload)
+        
+        return output_path
+    
+    def _render_csv(self, data: Dict) -> bytes:
+        """Render data as a Section/Field/Value CSV."""
+        import csv  # Only needed for this format
+        
+        metadata = data['case_metadata']
+        specimen = data['specimen_data']
+        temperature = data['temperature_data']
+        pmi = data['pmi_calculations']
+        separator = ['', '', '']
+        
+        buf = io.StringIO(newline='')
+        writer = csv.writer(buf)
+        writer.writerow(['Section', 'Field', 'Value'])
         
         # Case metadata
-        csv_rows.extend([
-            ['Section', 'Field', 'Value'],
-            ['Case Metadata', 'Export Timestamp', data['case_metadata']['export_timestamp']],
-            ['Case Metadata', 'Tool Version', data['case_metadata']['tool_version']],
-            ['Case Metadata', 'Case ID', data['case_metadata']['case_id']],
-            ['Case Metadata', 'Investigator', data['case_metadata']['investigator']],
-            ['Case Metadata', 'Location', data['case_metadata']['location']],
-            ['Case Metadata', 'Discovery Date', data['case_metadata']['discovery_date']],
-            ['Case Metadata', 'Discovery Time', data['case_metadata']['discovery_time']],
-            ['', '', ''],  # Separator
-        ])
+        writer.writerow(['Case Metadata', 'Export Timestamp', metadata['export_timestamp']])
+        writer.writerow(['Case Metadata', 'Tool Version', metadata['tool_version']])
+        writer.writerow(['Case Metadata', 'Case ID', metadata['case_id']])
+        writer.writerow(['Case Metadata', 'Investigator', metadata['investigator']])
+        writer.writerow(['Case Metadata', 'Location', metadata['location']])
+        writer.writerow(['Case Metadata', 'Discovery Date', metadata['discovery_date']])
+        writer.writerow(['Case Metadata', 'Discovery Time', metadata['discovery_time']])
+        writer.writerow(separator)
         
         # Specimen data
-        csv_rows.extend([
-            ['Specimen Data', 'Species', data['specimen_data']['species']],
-            ['Specimen Data', 'Common Name', data['specimen_data']['species_common_name']],
-            ['Specimen Data', 'Development Stage', data['specimen_data']['development_stage']],
-            ['Specimen Data', 'Specimen Length (mm)', data['specimen_data']['specimen_length_mm']],
-            ['Specimen Data', 'Collection Method', data['specimen_data']['collection_method']],
-            ['Specimen Data', 'Preservation Method', data['specimen_data']['preservation_method']],
-            ['', '', ''],  # Separator
-        ])
+        writer.writerow(['Specimen Data', 'Species', specimen['species']])
+        writer.writerow(['Specimen Data', 'Common Name', specimen['species_common_name']])
+        writer.writerow(['Specimen Data', 'Development Stage', specimen['development_stage']])
+        writer.writerow(['Specimen Data', 'Specimen Length (mm)', specimen['specimen_length_mm']])
+        writer.writerow(['Specimen Data', 'Collection Method', specimen['collection_method']])
+        writer.writerow(['Specimen Data', 'Preservation Method', specimen['preservation_method']])
+        writer.writerow(separator)
         
         # Temperature data
-        csv_rows.extend([
-            ['Temperature Data', 'Average Temperature (°C)', data['temperature_data']['avg_temp_celsius']],
-            ['Temperature Data', 'Min Temperature (°C)', data['temperature_data']['min_temp_celsius']],
-            ['Temperature Data', 'Max Temperature (°C)', data['temperature_data']['max_temp_celsius']],
-            ['Temperature Data', 'Source', data['temperature_data']['source']],
-            ['Temperature Data', 'Location Coordinates', data['temperature_data']['location_coordinates']],
-            ['Temperature Data', 'Date Range', data['temperature_data']['date_range']],
-            ['', '', ''],  # Separator
-        ])
+        writer.writerow(['Temperature Data', 'Average Temperature (°C)', temperature['avg_temp_celsius']])
+        writer.writerow(['Temperature Data', 'Min Temperature (°C)', temperature['min_temp_celsius']])
+        writer.writerow(['Temperature Data', 'Max Temperature (°C)', temperature['max_temp_celsius']])
+        writer.writerow(['Temperature Data', 'Source', temperature['source']])
+        writer.writerow(['Temperature Data', 'Location Coordinates', temperature['location_coordinates']])
+        writer.writerow(['Temperature Data', 'Date Range', temperature['date_range']])
+        writer.writerow(separator)
         
         # PMI calculations
-        csv_rows.extend([
-            ['PMI Calculations', 'Estimated PMI (days)', data['pmi_calculations']['estimated_pmi_days']],
-            ['PMI Calculations', 'Estimated PMI (hours)', data['pmi_calculations']['estimated_pmi_hours']],
-            ['PMI Calculations', 'Confidence Low (days)', data['pmi_calculations']['confidence_interval_low_days']],
-            ['PMI Calculations', 'Confidence High (days)', data['pmi_calculations']['confidence_interval_high_days']],
-            ['PMI Calculations', 'Accumulated Degree Days', data['pmi_calculations']['accumulated_degree_days']],
-            ['PMI Calculations', 'Base Temperature (°C)', data['pmi_calculations']['base_temperature_celsius']],
-            ['PMI Calculations', 'Development Threshold (ADD)', data['pmi_calculations']['development_threshold_add']],
-            ['PMI Calculations', 'Calculation Method', data['pmi_calculations']['calculation_method']],
-            ['PMI Calculations', 'Confidence Percentage', data['pmi_calculations']['confidence_percentage']],
-        ])
+        writer.writerow(['PMI Calculations', 'Estimated PMI (days)', pmi['estimated_pmi_days']])
+        writer.writerow(['PMI Calculations', 'Estimated PMI (hours)', pmi['estimated_pmi_hours']])
+        writer.writerow(['PMI Calculations', 'Confidence Low (days)', pmi['confidence_interval_low_days']])
+        writer.writerow(['PMI Calculations', 'Confidence High (days)', pmi['confidence_interval_high_days']])
+        writer.writerow(['PMI Calculations', 'Accumulated Degree Days', pmi['accumulated_degree_days']])
+        writer.writerow(['PMI Calculations', 'Base Temperature (°C)', pmi['base_temperature_celsius']])
+        writer.writerow(['PMI Calculations', 'Development Threshold (ADD)', pmi['development_threshold_add']])
+        writer.writerow(['PMI Calculations', 'Calculation Method', pmi['calculation_method']])
+        writer.writerow(['PMI Calculations', 'Confidence Percentage', pmi['confidence_percentage']])
         
-        with open(output_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerows(csv_rows)
-        
-        return output_path
+        return buf.getvalue().encode('utf-8')
     
-    def _format_temp(self, temp: Optional[float]) -> str:
-        """Format temperature value, handling None."""
-        return f"{temp:.1f}" if temp is not None else "N/A"
+    def _format_temps_bulk(self, temps) -> np.ndarray:
+        """Format a sequence of temperatures in one pass; None/NaN become 'N/A'."""
+        arr = np.asarray(temps, dtype=float)
+        return np.where(np.isnan(arr), 'N/A', np.char.mod('%.1f', arr))
     
-    def _export_txt(self, data: Dict, output_path: str) -> str:
-        """Export data as human-readable text report."""
-        if not output_path.endswith('.txt'):
-            output_path += '.txt'
-        
-        report_lines = []
-        
-        # Header
-        report_lines.extend([
-            "CALLIPHORIDAYS - FORENSIC ENTOMOLOGY PMI REPORT",
-            "=" * 60,
-            "",
-            f"Generated: {data['case_metadata']['export_timestamp']}",
-            f"Tool Version: {data['case_metadata']['tool_version']}",
-            "",
-            "CASE INFORMATION",
-            "-" * 30,
-            f"Case ID: {data['case_metadata']['case_id']}",
-            f"Investigator: {data['case_metadata']['investigator']}",
-            f"Location: {data['case_metadata']['location']}",
-            f"Discovery Date: {data['case_metadata']['discovery_date']}",
-            f"Discovery Time: {data['case_metadata']['discovery_time'] or 'Not specified'}",
-            "",
-            "SPECIMEN ANALYSIS",
-            "-" * 30,
-            f"Species: {data['specimen_data']['species']}",
-            f"Common Name: {data['specimen_data']['species_common_name']}",
-            f"Development Stage: {data['specimen_data']['development_stage']}",
-            f"Specimen Length: {data['specimen_data']['specimen_length_mm'] or 'Not measured'} mm",
-            f"Collection Method: {data['specimen_data']['collection_method']}",
-            f"Preservation Method: {data['specimen_data']['preservation_method']}",
-            "",
-            "TEMPERATURE DATA",
-            "-" * 30,
-            f"Average Temperature: {data['temperature_data']['avg_temp_celsius']:.1f}°C",
-            f"Temperature Range: {self._format_temp(data['temperature_data']['min_temp_celsius'])}°C - {self._format_temp(data['temperature_data']['max_temp_celsius'])}°C",
-            f"Data Source: {data['temperature_data']['source']}",
-            f"Location: {data['temperature_data']['location_coordinates'] or 'Not specified'}",
-            f"Date Range: {data['temperature_data']['date_range'] or 'Not specified'}",
-            "",
-            "PMI ESTIMATE",
-            "-" * 30,
-            f"Estimated PMI: {data['pmi_calculations']['estimated_pmi_days']:.1f} days ({data['pmi_calculations']['estimated_pmi_hours']:.1f} hours)",
-            f"Confidence Interval: {data['pmi_calculations']['confidence_interval_low_days']:.1f} - {data['pmi_calculations']['confidence_interval_high_days']:.1f} days",
-            f"Confidence Level: ±{data['pmi_calculations']['confidence_percentage']:.0f}%",
-            "",
-            "CALCULATION DETAILS",
-            "-" * 30,
-            f"Method: {data['pmi_calculations']['calculation_method']}",
-            f"Accumulated Degree Days: {data['pmi_calculations']['accumulated_degree_days']:.1f} ADD",
-            f"Base Temperature: {data['pmi_calculations']['base_temperature_celsius']:.1f}°C",
-            f"Development Threshold: {data['pmi_calculations']['development_threshold_add']:.1f} ADD",
-            "",
-            "SCIENTIFIC BASIS & LIMITATIONS",
-            "-" * 30,
-            f"Method Reference: {data['scientific_basis']['method_reference']}",
-            f"Data Source: {data['scientific_basis']['development_data_source']}",
-            "",
-            "Important Limitations:",
-        ])
-        
-        for limitation in data['scientific_basis']['limitations']:
-            report_lines.append(f"• {limitation}")
-        
-        report_lines.extend([
-            "",
-            "DISCLAIMER",
-            "-" * 30,
-            data['scientific_basis']['accuracy_notes'],
-            "",
-            "This report should be reviewed and interpreted by qualified forensic entomologists.",
-            "Results are estimates based on available scientific data and environmental conditions.",
-        ])
-        
-        with open(output_path, 'w') as f:
-            f.write('\n'.join(report_lines))
+    def _render_txt(self, data: Dict) -> bytes:
+        """Render data as a human-readable text report."""
+        metadata = data['case_metadata']
+        specimen = data['specimen_data']
+        temperature = data['temperature_data']
+        pmi = data['pmi_calculations']
+        basis = data['scientific_basis']
+        min_temp, max_temp = self._format_temps_bulk(
+            [temperature['min_temp_celsius'], temperature['max_temp_celsius']]
+        )
         
-        return output_path
+        report = TXT_REPORT_TEMPLATE.format_map({
+            'export_timestamp': metadata['export_timestamp'],
+            'tool_version': metadata['tool_version'],
+            'case_id': metadata['case_id'],
+            'investigator': metadata['investigator'],
+            'location': metadata['location'],
+            'discovery_date': metadata['discovery_date'],
+            'discovery_time': metadata['discovery_time'] or 'Not specified',
+            'species': specimen['species'],
+            'species_common_name': specimen['species_common_name'],
+            'development_stage': specimen['development_stage'],
+            'specimen_length': specimen['specimen_length_mm'] or 'Not measured',
+            'collection_method': specimen['collection_method'],
+            'preservation_method': specimen['preservation_method'],
+            'avg_temp': temperature['avg_temp_celsius'],
+            'min_temp': min_temp,
+            'max_temp': max_temp,
+            'temperature_source': temperature['source'],
+            'location_coordinates': temperature['location_coordinates'] or 'Not specified',
+            'date_range': temperature['date_range'] or 'Not specified',
+            'pmi_days': pmi['estimated_pmi_days'],
+            'pmi_hours': pmi['estimated_pmi_hours'],
+            'confidence_low': pmi['confidence_interval_low_days'],
+            'confidence_high': pmi['confidence_interval_high_days'],
+            'confidence_percentage': pmi['confidence_percentage'],
+            'calculation_method': pmi['calculation_method'],
+            'accumulated_dd': pmi['accumulated_degree_days'],
+            'base_temp': pmi['base_temperature_celsius'],
+            'dev_threshold': pmi['development_threshold_add'],
+            'method_reference': basis['method_reference'],
+            'development_data_source': basis['development_data_source'],
+            'limitations': '\n'.join(f"• {limitation}" for limitation in basis['limitations']),
+            'accuracy_notes': basis['accuracy_notes'],
+        })
+        
+        return report.encode('utf-8')
     
     def generate_case_id(self, location: str, discovery_date: str) -> str:
         """Generate a unique case ID."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        location_code = ''.join(c.upper() for c in location if c.isalnum())[:6]
+        location_code = NON_ALNUM_RE.sub('', location.upper())[:6]
         date_code = discovery_date.replace('-', '')
         return f"PMI_{location_code}_{date_code}_{timestamp}"
\ No newline at end of file
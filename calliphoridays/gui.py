@@ -4,9 +4,14 @@ GUI interface for Calliphoridays forensic entomology tool.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 from tkinter import font as tkfont
-from typing import Optional, Dict
-import threading
+from typing import Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import importlib.util
+import io
 import os
+import platform
+import queue
 from datetime import datetime, date
 import json
 
@@ -17,26 +22,128 @@ from .validation import PMIValidator
 from .alternative_methods import AlternativePMICalculator, PMIMethod
 from .export import DataExporter
 
+# Fixed for the life of the process, so looked up once
+PLATFORM = platform.system()
+HAS_WEATHER_API_KEY = bool(os.environ.get('OPENWEATHER_API_KEY'))
+
+# How often the UI drains the worker's message queue, and how many messages per tick
+UI_QUEUE_POLL_MS = 50
+UI_QUEUE_BATCH = 20
+
+# kCTFontManagerScopeProcess: fonts registered with Core Text last for this process only
+CT_FONT_MANAGER_SCOPE_PROCESS = 1
+
+# Name fragments that mark a monospace family usable as a Blackbit stand-in
+MONO_FONT_TERMS = ('courier', 'mono', 'console', 'terminal')
+
+
+@lru_cache(maxsize=None)
+def _font_families() -> Tuple[str, ...]:
+    """Installed font families; asking Tk is slow, so do it once per process."""
+    return tuple(tkfont.families())
+
+
+def _font_specs(title_family: Optional[str], mono_family: Optional[str]) -> Dict[str, Tuple[str, int, str]]:
+    """(family, size, weight) for each named font, as picked by _select_font_family."""
+    if title_family:
+        return {
+            'title': (title_family, 48, 'bold'),
+            'subtitle': (title_family, 28, 'normal'),
+            'label': (title_family, 24, 'normal'),
+            'text': (title_family, 24, 'normal'),
+            'button': (title_family, 22, 'normal'),
+        }
+    # Default font settings (fallback), optionally with a monospace stand-in
+    return {
+        'title': (mono_family or 'Arial', 40, 'bold'),
+        'subtitle': (mono_family or 'Arial', 26, 'normal'),
+        'label': ('Arial', 22, 'normal'),
+        'text': (mono_family or 'Consolas', 24, 'normal'),
+        'button': ('Arial', 22, 'normal'),
+    }
+
+# Static preamble and rules for the results tab, joined once rather than per run;
+# each is a complete line (or lines) including the trailing newline
+RESULTS_HEADER = "".join(f"{line}\n" for line in [
+    "┏┓┏┓┓ ┓ ┳┓┏┏┓┓┏┏┓┳┓┳┳┓┏┓┓┏┏┓",
+    "┃ ┣┫┃ ┃ ┃┣┫┃┃┣┫┃┃┣┫┃┃┃┣┫┗┫┗┓",
+    "┗┛┛┗┗┛┗┛┻┛┗┣┛┛┗┗┛┛┗┻┻┛┛┗┗┛┗┛",
+    "                            ",
+    "",
+    "Forensic Entomology PMI Estimation Tool",
+    "Using Calliphoridae & Sarcophagidae Evidence and Temperature Data",
+    "=" * 70,
+    "",
+])
+RULE_50 = "=" * 50 + "\n"
+RULE_60 = "=" * 60 + "\n"
+SUBRULE_40 = "-" * 40 + "\n"
+
+# Per-method block in the alternative methods comparison
+METHOD_ESTIMATE_TEMPLATE = (
+    "   PMI Estimate: {pmi_days:.1f} days ({pmi_hours:.1f} hours)\n"
+    "   Confidence: {confidence_low:.1f} - {confidence_high:.1f} days\n"
+    "   Reliability: {reliability_score:.0f}/100\n"
+)
+
+
+def _build_species_dropdown() -> Tuple[str, ...]:
+    """Species combobox entries, grouped by family under header rows."""
+    calliphoridae_species = []
+    sarcophagidae_species = []
+    
+    for species in ForensicSpecies:
+        info = get_species_info(species)
+        display_name = f"{species.value} ({info['common_name']})"
+        if info['family'] == 'Calliphoridae':
+            calliphoridae_species.append(display_name)
+        else:
+            sarcophagidae_species.append(display_name)
+    
+    return tuple(["--- Calliphoridae (Blow flies) ---"] + calliphoridae_species +
+                 ["--- Sarcophagidae (Flesh flies) ---"] + sarcophagidae_species)
+
+
+# The species set is static, so the dropdown is built once at import
+SPECIES_DROPDOWN = _build_species_dropdown()
+
 
 class CalliphoridaysGUI:
     """
     Graphical user interface for the Calliphoridays forensic entomology tool.
     """
     
+    # Set once Blackbit has been registered with Core Text (macOS)
+    _font_registered = False
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Calliphoridays - Forensic Entomology PMI Estimation")
         self.root.geometry("1000x800")
         self.root.configure(bg='#f0f0f0')
         
-        # Load custom fonts
-        self.load_custom_fonts()
+        # Start with the default fonts; the custom font is swapped in once
+        # the window is up (see load_custom_fonts)
+        self.custom_fonts = {
+            name: tkfont.Font(family=family, size=size, weight=weight)
+            for name, (family, size, weight) in _font_specs(None, None).items()
+        }
+        self.font_loaded = False
         
         # Initialize services
         self.pmi_calculator = PMICalculator()
         self.weather_service = WeatherService()
         self.validator = PMIValidator()
+        self.alt_calculator = AlternativePMICalculator()
         self.exporter = DataExporter()
+        self._export_cache: Dict[str, bytes] = {}  # Rendered exports of last_results, by format
+        
+        # One persistent worker for PMI calculations, reused for every run
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pmi-calc')
+        self._last_future = None
+        
+        # Worker-to-UI messages, drained on the Tk thread by _pump_queue
+        self._ui_queue = queue.SimpleQueue()
         
         # Variables
         self.species_var = tk.StringVar()
@@ -54,118 +161,151 @@ class CalliphoridaysGUI:
         
         self.setup_ui()
         self.center_window()
+        self.root.after_idle(self.load_custom_fonts)
+        self.root.after(UI_QUEUE_POLL_MS, self._pump_queue)
         
     def load_custom_fonts(self):
-        """Load custom fonts from the font folder."""
+        """
+        Load custom fonts from the font folder.
+        
+        Platform font registration can take a while, so this runs from the
+        event loop after the window has been drawn. The named fonts created in
+        __init__ are reconfigured in place and Tk redraws the widgets using them.
+        """
         # Get the project root directory (where the script is located)
         script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         font_dir = os.path.join(script_dir, 'font')
         
-        # Default font settings (fallback)
-        self.custom_fonts = {
-            'title': tkfont.Font(family='Arial', size=40, weight='bold'),
-            'subtitle': tkfont.Font(family='Arial', size=26),
-            'label': tkfont.Font(family='Arial', size=22),
-            'text': tkfont.Font(family='Consolas', size=24),
-            'button': tkfont.Font(family='Arial', size=22)
-        }
-        
         # Try to load Blackbit.otf font
         blackbit_path = os.path.join(font_dir, 'Blackbit.otf')
+        if not os.path.exists(blackbit_path):
+            return  # Nothing to load; the default fonts stay
         
         try:
-            if os.path.exists(blackbit_path):
-                # Try to use system font loading mechanisms
-                self.font_loaded = False
-                
-                # Method 1: Try platform-specific font loading
-                try:
-                    import platform
-                    system = platform.system()
-                    
-                    if system == "Windows":
-                        # Windows font loading
-                        import ctypes
-                        from ctypes import wintypes
-                        
-                        # Load font temporarily
-                        gdi32 = ctypes.windll.gdi32
-                        result = gdi32.AddFontResourceW(blackbit_path)
-                        if result:
-                            self.font_loaded = True
-                            print("Font loaded on Windows")
-                    
-                    elif system == "Darwin":  # macOS
-                        # macOS font loading
-                        try:
-                            import subprocess
-                            # Try to activate the font temporarily
-                            subprocess.run(['cp', blackbit_path, '/tmp/Blackbit.otf'], check=True)
-                            self.font_loaded = True
-                            print("Font copied to system temporary directory on macOS")
-                        except:
-                            pass
-                    
-                    elif system == "Linux":
-                        # Linux font loading
-                        try:
-                            import subprocess
-                            # Try to use fc-cache if available
-                            subprocess.run(['fc-cache', '-f'], check=False)
-                            self.font_loaded = True
-                            print("Font cache refreshed on Linux")
-                        except:
-                            pass
-                            
-                except Exception as e:
-                    print(f"Platform-specific font loading failed: {e}")
+            title_family, mono_family = self._select_font_family(blackbit_path)
+        except Exception as e:
+            print(f"Could not load custom font: {e}")
+            return  # Keep default fonts if loading fails
+        
+        if title_family is None and mono_family is None:
+            return
+        
+        for name, (family, size, weight) in _font_specs(title_family, mono_family).items():
+            self.custom_fonts[name].configure(family=family, size=size, weight=weight)
+    
+    def _register_font_macos(self, font_path: str) -> bool:
+        """Register a font file with Core Text for this process, once."""
+        if CalliphoridaysGUI._font_registered:
+            return True
+        
+        import ctypes
+        
+        core_foundation = ctypes.cdll.LoadLibrary(
+            '/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation')
+        core_text = ctypes.cdll.LoadLibrary(
+            '/System/Library/Frameworks/CoreText.framework/CoreText')
+        
+        create_url = core_foundation.CFURLCreateFromFileSystemRepresentation
+        create_url.restype = ctypes.c_void_p
+        create_url.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_bool]
+        core_foundation.CFRelease.argtypes = [ctypes.c_void_p]
+        register = core_text.CTFontManagerRegisterFontsForURL
+        register.restype = ctypes.c_bool
+        register.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p]
+        
+        path = os.fsencode(font_path)
+        url = create_url(None, path, len(path), False)
+        if not url:
+            return False
+        try:
+            CalliphoridaysGUI._font_registered = bool(
+                register(url, CT_FONT_MANAGER_SCOPE_PROCESS, None))
+        finally:
+            core_foundation.CFRelease(url)
+        
+        return CalliphoridaysGUI._font_registered
+    
+    def _select_font_family(self, blackbit_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Choose the custom font families for an existing Blackbit.otf without
+        creating any Font objects.
+        
+        Returns (title_family, mono_family): title_family is set when Blackbit
+        is usable, mono_family when a monospace stand-in was found instead.
+        Both are None when the Arial defaults should be kept.
+        """
+        self.font_loaded = False
+        
+        # Method 1: Try platform-specific font loading
+        try:
+            if PLATFORM == "Windows":
+                # Windows font loading
+                import ctypes
+                from ctypes import wintypes
                 
-                # Check if Blackbit is now available and create font objects
+                # Load font temporarily
+                gdi32 = ctypes.windll.gdi32
+                result = gdi32.AddFontResourceW(blackbit_path)
+                if result:
+                    self.font_loaded = True
+                    print("Font loaded on Windows")
+            
+            elif PLATFORM == "Darwin":  # macOS
+                # macOS font loading: register with Core Text for this process
+                if self._register_font_macos(blackbit_path):
+                    print("Font registered with Core Text on macOS")
+            
+            elif PLATFORM == "Linux":
+                # Linux font loading: install into the user font directory and
+                # rebuild just that directory's fontconfig cache, only when the
+                # packaged copy is new or has changed. Whether fontconfig picked
+                # it up is decided by the family scan below.
+                user_font_dir = os.path.expanduser('~/.local/share/fonts')
+                installed_path = os.path.join(user_font_dir, 'Blackbit.otf')
                 try:
-                    available_families = list(tkfont.families())
-                    
-                    # Look for Blackbit or similar fonts
-                    font_family = 'Arial'  # Default fallback
-                    
-                    for family in available_families:
-                        if 'blackbit' in family.lower() or 'Blackbit' in family:
-                            font_family = family
-                            self.font_loaded = True
-                            break
-                    
-                    # If we found Blackbit or loaded it, use it
-                    if self.font_loaded:
-                        self.custom_fonts = {
-                            'title': tkfont.Font(family=font_family, size=48, weight='bold'),
-                            'subtitle': tkfont.Font(family=font_family, size=28),
-                            'label': tkfont.Font(family=font_family, size=24),
-                            'text': tkfont.Font(family=font_family, size=24),
-                            'button': tkfont.Font(family=font_family, size=22)
-                        }
-                        print(f"Custom font '{font_family}' applied successfully")
-                    else:
-                        # Use a monospace font that might be similar to Blackbit
-                        mono_family = 'Courier New'
-                        for family in available_families:
-                            if any(term in family.lower() for term in ['courier', 'mono', 'console', 'terminal']):
-                                mono_family = family
-                                break
-                        
-                        self.custom_fonts = {
-                            'title': tkfont.Font(family=mono_family, size=40, weight='bold'),
-                            'subtitle': tkfont.Font(family=mono_family, size=26),
-                            'label': tkfont.Font(family='Arial', size=22),
-                            'text': tkfont.Font(family=mono_family, size=24),
-                            'button': tkfont.Font(family='Arial', size=22)
-                        }
-                        print(f"Using monospace font '{mono_family}' as Blackbit alternative")
-                        
-                except Exception as e:
-                    print(f"Font application failed: {e}")
+                    if (not os.path.exists(installed_path)
+                            or os.path.getmtime(installed_path) < os.path.getmtime(blackbit_path)):
+                        import shutil
+                        import subprocess
+                        os.makedirs(user_font_dir, exist_ok=True)
+                        shutil.copy2(blackbit_path, installed_path)
+                        subprocess.run(['fc-cache', '-f', user_font_dir], check=False)
+                        print("Font installed to user font directory on Linux")
+                except OSError:
+                    pass
                     
         except Exception as e:
-            print(f"Could not load custom font: {e}")
-            # Keep default fonts if loading fails
+            print(f"Platform-specific font loading failed: {e}")
+        
+        # Check if Blackbit is now available
+        try:
+            # One pass over the installed families, lowercasing each name once;
+            # note the first monospace family on the way in case Blackbit is missing
+            blackbit_family = None
+            mono_family = None
+            for family in _font_families():
+                lower = family.lower()
+                if 'blackbit' in lower:
+                    blackbit_family = family
+                    self.font_loaded = True
+                    break
+                if mono_family is None and any(term in lower for term in MONO_FONT_TERMS):
+                    mono_family = family
+            
+            # If we found Blackbit or loaded it, use it
+            if self.font_loaded:
+                font_family = blackbit_family or 'Arial'
+                print(f"Custom font '{font_family}' applied successfully")
+                return font_family, None
+            
+            # Use a monospace font that might be similar to Blackbit
+            mono_family = mono_family or 'Courier New'
+            print(f"Using monospace font '{mono_family}' as Blackbit alternative")
+            return None, mono_family
+            
+        except Exception as e:
+            print(f"Font application failed: {e}")
+            return None, None
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -178,6 +318,11 @@ class CalliphoridaysGUI:
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
         
+        # Shared widget styles, so per-widget font/colour options aren't repeated
+        style = ttk.Style(self.root)
+        style.configure('Hint.TLabel', font=self.custom_fonts['label'], foreground='gray')
+        style.configure('Accent.TButton', font=self.custom_fonts['button'])
+        
         # Title
         title_label = ttk.Label(main_frame, text="CALLIPHORIDAYS", 
                                font=self.custom_fonts['title'])
@@ -190,6 +335,7 @@ class CalliphoridaysGUI:
         
         # Create notebook for tabs
         notebook = ttk.Notebook(main_frame)
+        self.notebook = notebook
         notebook.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         main_frame.rowconfigure(2, weight=1)
         
@@ -227,21 +373,7 @@ class CalliphoridaysGUI:
         ttk.Label(parent, text="Species:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10), pady=5)
         species_combo = ttk.Combobox(parent, textvariable=self.species_var, width=40)
         
-        # Group species by family
-        calliphoridae_species = []
-        sarcophagidae_species = []
-        
-        for species in ForensicSpecies:
-            info = get_species_info(species)
-            display_name = f"{species.value} ({info['common_name']})"
-            if info['family'] == 'Calliphoridae':
-                calliphoridae_species.append(display_name)
-            else:
-                sarcophagidae_species.append(display_name)
-        
-        all_species = (["--- Calliphoridae (Blow flies) ---"] + calliphoridae_species + 
-                      ["--- Sarcophagidae (Flesh flies) ---"] + sarcophagidae_species)
-        species_combo['values'] = all_species
+        species_combo['values'] = SPECIES_DROPDOWN
         species_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=5)
         species_combo.bind('<<ComboboxSelected>>', self.on_species_selected)
         
@@ -258,8 +390,7 @@ class CalliphoridaysGUI:
         ttk.Label(parent, text="Location:").grid(row=2, column=0, sticky=tk.W, padx=(0, 10), pady=5)
         location_entry = ttk.Entry(parent, textvariable=self.location_var, width=43)
         location_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
-        ttk.Label(parent, text="(City, State/Country)", font=self.custom_fonts['label'], 
-                 foreground='gray').grid(row=2, column=2, sticky=tk.W, padx=(5, 0))
+        ttk.Label(parent, text="(City, State/Country)", style='Hint.TLabel').grid(row=2, column=2, sticky=tk.W, padx=(5, 0))
         
         # Discovery date
         ttk.Label(parent, text="Discovery Date:").grid(row=3, column=0, sticky=tk.W, padx=(0, 10), pady=5)
@@ -269,26 +400,22 @@ class CalliphoridaysGUI:
         ttk.Entry(date_frame, textvariable=self.discovery_date_var, width=20).pack(side=tk.LEFT)
         ttk.Button(date_frame, text="Today", 
                   command=lambda: self.discovery_date_var.set(date.today().strftime('%Y-%m-%d'))).pack(side=tk.LEFT, padx=(5, 0))
-        ttk.Label(parent, text="(YYYY-MM-DD)", font=self.custom_fonts['label'], 
-                 foreground='gray').grid(row=3, column=2, sticky=tk.W, padx=(5, 0))
+        ttk.Label(parent, text="(YYYY-MM-DD)", style='Hint.TLabel').grid(row=3, column=2, sticky=tk.W, padx=(5, 0))
         
         # Discovery time (optional)
         ttk.Label(parent, text="Discovery Time:").grid(row=4, column=0, sticky=tk.W, padx=(0, 10), pady=5)
         ttk.Entry(parent, textvariable=self.discovery_time_var, width=43).grid(row=4, column=1, sticky=(tk.W, tk.E), pady=5)
-        ttk.Label(parent, text="(HH:MM, optional)", font=self.custom_fonts['label'], 
-                 foreground='gray').grid(row=4, column=2, sticky=tk.W, padx=(5, 0))
+        ttk.Label(parent, text="(HH:MM, optional)", style='Hint.TLabel').grid(row=4, column=2, sticky=tk.W, padx=(5, 0))
         
         # Specimen length (optional)
         ttk.Label(parent, text="Specimen Length:").grid(row=5, column=0, sticky=tk.W, padx=(0, 10), pady=5)
         ttk.Entry(parent, textvariable=self.specimen_length_var, width=43).grid(row=5, column=1, sticky=(tk.W, tk.E), pady=5)
-        ttk.Label(parent, text="(mm, optional)", font=self.custom_fonts['label'], 
-                 foreground='gray').grid(row=5, column=2, sticky=tk.W, padx=(5, 0))
+        ttk.Label(parent, text="(mm, optional)", style='Hint.TLabel').grid(row=5, column=2, sticky=tk.W, padx=(5, 0))
         
         # Ambient temperature override (optional)
         ttk.Label(parent, text="Ambient Temperature:").grid(row=6, column=0, sticky=tk.W, padx=(0, 10), pady=5)
         ttk.Entry(parent, textvariable=self.ambient_temp_var, width=43).grid(row=6, column=1, sticky=(tk.W, tk.E), pady=5)
-        ttk.Label(parent, text="(°C, overrides weather)", font=self.custom_fonts['label'], 
-                 foreground='gray').grid(row=6, column=2, sticky=tk.W, padx=(5, 0))
+        ttk.Label(parent, text="(°C, overrides weather)", style='Hint.TLabel').grid(row=6, column=2, sticky=tk.W, padx=(5, 0))
         
         # Configure column weights
         parent.columnconfigure(1, weight=1)
@@ -322,14 +449,13 @@ class CalliphoridaysGUI:
         api_frame = ttk.LabelFrame(parent, text="Weather API Configuration", padding="10")
         api_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
         
-        current_key = os.environ.get('OPENWEATHER_API_KEY', '')
-        api_status = "✓ Configured" if current_key else "⚠ Not configured (using fallback temperatures)"
+        api_status = "✓ Configured" if HAS_WEATHER_API_KEY else "⚠ Not configured (using fallback temperatures)"
         
         ttk.Label(api_frame, text=f"OpenWeather API Status: {api_status}").grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        if not current_key:
+        if not HAS_WEATHER_API_KEY:
             ttk.Label(api_frame, text="Set OPENWEATHER_API_KEY environment variable for accurate weather data", 
-                     font=self.custom_fonts['label'], foreground='gray').grid(row=1, column=0, sticky=tk.W, pady=2)
+                     style='Hint.TLabel').grid(row=1, column=0, sticky=tk.W, pady=2)
         
         # Configure column weights
         parent.columnconfigure(1, weight=1)
@@ -369,7 +495,7 @@ class CalliphoridaysGUI:
         """Handle species selection to show additional information."""
         selected = self.species_var.get()
         if selected and not selected.startswith('---'):
-            species_code = selected.split(' (')[0]
+            species_code = selected.partition(' (')[0]
             try:
                 species = ForensicSpecies(species_code)
                 info = get_species_info(species)
@@ -395,9 +521,9 @@ class CalliphoridaysGUI:
             messagebox.showerror("Validation Error", "Please enter a discovery date.")
             return False
             
-        # Validate date format
+        # Validate date format (fromisoformat is the C fast path for YYYY-MM-DD)
         try:
-            datetime.strptime(self.discovery_date_var.get(), '%Y-%m-%d')
+            date.fromisoformat(self.discovery_date_var.get())
         except ValueError:
             messagebox.showerror("Validation Error", "Please enter date in YYYY-MM-DD format.")
             return False
@@ -425,185 +551,220 @@ class CalliphoridaysGUI:
             return
             
         # Switch to results tab
-        notebook = self.root.nametowidget(self.root.winfo_children()[0].winfo_children()[2])
-        notebook.select(2)  # Results tab
+        self.notebook.select(2)  # Results tab
+        
+        # Read the inputs here, since Tk variables must only be used from the Tk thread
+        inputs = (
+            self.species_var.get(), self.stage_var.get(),
+            self.location_var.get(), self.discovery_date_var.get(),
+            self.discovery_time_var.get(), self.specimen_length_var.get(),
+            self.ambient_temp_var.get(), self.verbose_var.get(),
+            self.alternative_methods_var.get()
+        )
+        
+        # Run the calculation on the worker thread to prevent UI freezing
+        self._last_future = self._executor.submit(self._calculate_pmi_thread, *inputs)
+        self._last_future.add_done_callback(self._on_calculation_done)
+        
+    def _calculate_pmi_thread(self, species_choice: str, stage_choice: str, location: str,
+                              discovery_date: str, discovery_time: str, specimen_length_text: str,
+                              ambient_temp_text: str, verbose: bool, alternative_methods: bool):
+        """
+        Calculate PMI on the worker thread.
+        
+        Takes the form values as read by calculate_pmi on the Tk thread, so
+        no Tk variable is touched here. Returns the arguments for
+        _display_results; errors are left on the future for
+        _finish_calculation to report.
+        """
+        # Show progress
+        self._ui(self._set_progress, "Calculating PMI...", True)
+        
+        # Parse inputs
+        species = ForensicSpecies(species_choice.partition(' (')[0])
+        stage = DevelopmentStage(stage_choice.partition(' (')[0])
+        
+        discovery_time = discovery_time or None
+        specimen_length = float(specimen_length_text) if specimen_length_text else None
+        ambient_temp = float(ambient_temp_text) if ambient_temp_text else None
+        
+        # Validate inputs
+        validation_result = self.validator.validate_inputs(
+            species, stage, location, discovery_date,
+            discovery_time, specimen_length, ambient_temp
+        )
         
-        # Start calculation in thread to prevent UI freezing
-        threading.Thread(target=self._calculate_pmi_thread, daemon=True).start()
+        # Get temperature data
+        if ambient_temp is not None:
+            temperature_data = {'avg_temp': ambient_temp}
+        else:
+            self._ui(self._set_progress, "Fetching weather data...", True)
+            temperature_data = self.weather_service.get_temperature_data(location, discovery_date, discovery_time)
+        
+        # Calculate PMI
+        self._ui(self._set_progress, "Calculating PMI estimate...", True)
+        pmi_estimate = self.pmi_calculator.calculate_pmi(
+            species=species,
+            stage=stage,
+            temperature_data=temperature_data,
+            specimen_length=specimen_length,
+            verbose=verbose
+        )
         
-    def _calculate_pmi_thread(self):
-        """Calculate PMI in background thread."""
-        try:
-            # Show progress
-            self.root.after(0, lambda: self.progress_var.set("Calculating PMI..."))
-            self.root.after(0, lambda: self.progress_bar.start())
-            
-            # Parse inputs
-            species_text = self.species_var.get().split(' (')[0]
-            species = ForensicSpecies(species_text)
-            
-            stage_text = self.stage_var.get().split(' (')[0]
-            stage = DevelopmentStage(stage_text)
-            
-            location = self.location_var.get()
-            discovery_date = self.discovery_date_var.get()
-            discovery_time = self.discovery_time_var.get() if self.discovery_time_var.get() else None
-            specimen_length = float(self.specimen_length_var.get()) if self.specimen_length_var.get() else None
-            ambient_temp = float(self.ambient_temp_var.get()) if self.ambient_temp_var.get() else None
-            
-            # Validate inputs
-            validation_result = self.validator.validate_inputs(
-                species, stage, location, discovery_date,
-                discovery_time, specimen_length, ambient_temp
-            )
-            
-            # Get temperature data
-            if ambient_temp is not None:
-                temperature_data = {'avg_temp': ambient_temp}
-            else:
-                self.root.after(0, lambda: self.progress_var.set("Fetching weather data..."))
-                temperature_data = self.weather_service.get_temperature_data(location, discovery_date, discovery_time)
-            
-            # Calculate PMI
-            self.root.after(0, lambda: self.progress_var.set("Calculating PMI estimate..."))
-            pmi_estimate = self.pmi_calculator.calculate_pmi(
-                species=species,
-                stage=stage,
-                temperature_data=temperature_data,
-                specimen_length=specimen_length,
-                verbose=self.verbose_var.get()
-            )
-            
-            # Validate results
-            validation_result = self.validator.validate_calculation_results(
-                pmi_estimate, temperature_data, species, stage
+        # Validate results
+        validation_result = self.validator.validate_calculation_results(
+            pmi_estimate, temperature_data, species, stage
+        )
+        
+        # Calculate alternative methods if requested
+        alternative_results = None
+        if alternative_methods:
+            self._ui(self._set_progress, "Calculating alternative methods...", True)
+            alternative_results = self.alt_calculator.calculate_all_methods(
+                species, stage, temperature_data, specimen_length
             )
-            
-            # Calculate alternative methods if requested
-            alternative_results = None
-            if self.alternative_methods_var.get():
-                self.root.after(0, lambda: self.progress_var.set("Calculating alternative methods..."))
-                alt_calculator = AlternativePMICalculator()
-                alternative_results = alt_calculator.calculate_all_methods(
-                    species, stage, temperature_data, specimen_length
-                )
-            
-            # Display results
-            self.root.after(0, lambda: self._display_results(
-                pmi_estimate, validation_result, alternative_results, 
-                species, stage, location, discovery_date, discovery_time, temperature_data
-            ))
-            
-        except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Calculation Error", f"Error calculating PMI: {str(e)}"))
+        
+        return (pmi_estimate, validation_result, alternative_results,
+                species, stage, location, discovery_date, discovery_time, temperature_data)
+        
+    def _ui(self, fn, *args):
+        """Queue fn(*args) to run on the Tk thread (safe to call from the worker)."""
+        self._ui_queue.put((fn, args))
+        
+    def _pump_queue(self):
+        """Run callbacks queued by the worker thread, then poll again."""
+        try:
+            for _ in range(UI_QUEUE_BATCH):
+                try:
+                    fn, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                fn(*args)
         finally:
-            self.root.after(0, lambda: self.progress_bar.stop())
-            self.root.after(0, lambda: self.progress_var.set("Calculation complete"))
+            self.root.after(UI_QUEUE_POLL_MS, self._pump_queue)
+        
+    def _set_progress(self, text: str, running: bool):
+        """Update the progress label and start or stop the progress bar."""
+        self.progress_var.set(text)
+        if running:
+            self.progress_bar.start()  # No-op if already running
+        else:
+            self.progress_bar.stop()
+        
+    def _on_calculation_done(self, future):
+        """Hand a finished calculation back to the Tk thread."""
+        self._ui(self._finish_calculation, future)
+        
+    def _finish_calculation(self, future):
+        """Stop the progress display and show the results or the error."""
+        self._set_progress("Calculation complete", False)
+        
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Calculation Error", f"Error calculating PMI: {str(error)}")
+        else:
+            self._display_results(*future.result())
             
     def _display_results(self, pmi_estimate, validation_result, alternative_results, 
                         species, stage, location, discovery_date, discovery_time, temperature_data):
         """Display calculation results in the results tab."""
-        # Enable text widget for editing
-        self.results_text.configure(state='normal')
-        self.results_text.delete(1.0, tk.END)
-        
         # Format results
-        results = []
-        results.append("┏┓┏┓┓ ┓ ┳┓┏┏┓┓┏┏┓┳┓┳┳┓┏┓┓┏┏┓")
-        results.append("┃ ┣┫┃ ┃ ┃┣┫┃┃┣┫┃┃┣┫┃┃┃┣┫┗┫┗┓") 
-        results.append("┗┛┛┗┗┛┗┛┻┛┗┣┛┛┗┗┛┛┗┻┻┛┛┗┗┛┗┛")
-        results.append("                            ")
-        results.append("")
-        results.append("Forensic Entomology PMI Estimation Tool")
-        results.append("Using Calliphoridae & Sarcophagidae Evidence and Temperature Data")
-        results.append("=" * 70)
-        results.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(RESULTS_HEADER)
         
         # Main results
-        results.append("=" * 50)
-        results.append("POSTMORTEM INTERVAL ESTIMATE")
-        results.append("=" * 50)
-        results.append(f"Species: {species.value.replace('_', ' ').title()}")
-        results.append(f"Development Stage: {stage.value.replace('_', ' ').title()}")
-        results.append(f"Location: {location}")
+        w(RULE_50)
+        w("POSTMORTEM INTERVAL ESTIMATE\n")
+        w(RULE_50)
+        w(f"Species: {species.value.replace('_', ' ').title()}\n")
+        w(f"Development Stage: {stage.value.replace('_', ' ').title()}\n")
+        w(f"Location: {location}\n")
         discovery_datetime = f"{discovery_date}" + (f" {discovery_time}" if discovery_time else "")
-        results.append(f"Discovery Date: {discovery_datetime}")
-        results.append(f"Estimated PMI: {pmi_estimate['pmi_days']:.1f} days ({pmi_estimate['pmi_hours']:.1f} hours)")
-        results.append(f"Confidence Interval: {pmi_estimate['confidence_low']:.1f} - {pmi_estimate['confidence_high']:.1f} days")
-        results.append(f"Temperature Used: {temperature_data['avg_temp']:.1f}°C")
-        results.append("")
+        w(f"Discovery Date: {discovery_datetime}\n")
+        w(f"Estimated PMI: {pmi_estimate['pmi_days']:.1f} days ({pmi_estimate['pmi_hours']:.1f} hours)\n")
+        w(f"Confidence Interval: {pmi_estimate['confidence_low']:.1f} - {pmi_estimate['confidence_high']:.1f} days\n")
+        w(f"Temperature Used: {temperature_data['avg_temp']:.1f}°C\n")
+        w("\n")
         
         # Data quality
-        results.append(f"Data Quality: {validation_result.data_quality.value.upper()} ({validation_result.quality_score:.0f}/100)")
-        results.append("")
+        w(f"Data Quality: {validation_result.data_quality.value.upper()} ({validation_result.quality_score:.0f}/100)\n")
+        w("\n")
         
         # Validation warnings
         if validation_result.warnings:
-            results.append("Validation Alerts:")
+            w("Validation Alerts:\n")
             for warning in validation_result.warnings[:3]:
-                results.append(f"  {warning}")
+                w(f"  {warning}\n")
             if len(validation_result.warnings) > 3:
-                results.append(f"  ... and {len(validation_result.warnings) - 3} more")
-            results.append("")
+                w(f"  ... and {len(validation_result.warnings) - 3} more\n")
+            w("\n")
         
         # Verbose details
         if self.verbose_var.get():
-            results.append("Detailed Calculations:")
-            results.append(f"Accumulated Degree Days: {pmi_estimate['accumulated_dd']:.1f} ADD")
-            results.append(f"Base Temperature: {pmi_estimate['base_temp']:.1f}°C")
-            results.append(f"Development Threshold: {pmi_estimate['dev_threshold']:.1f} ADD")
-            results.append("")
+            w("Detailed Calculations:\n")
+            w(f"Accumulated Degree Days: {pmi_estimate['accumulated_dd']:.1f} ADD\n")
+            w(f"Base Temperature: {pmi_estimate['base_temp']:.1f}°C\n")
+            w(f"Development Threshold: {pmi_estimate['dev_threshold']:.1f} ADD\n")
+            w("\n")
         
         # Alternative methods results
         if alternative_results:
-            results.append("=" * 60)
-            results.append("ALTERNATIVE PMI METHODS COMPARISON")
-            results.append("=" * 60)
-            results.append("")
-            results.append("INDIVIDUAL METHOD RESULTS:")
-            results.append("-" * 40)
+            w(RULE_60)
+            w("ALTERNATIVE PMI METHODS COMPARISON\n")
+            w(RULE_60)
+            w("\n")
+            w("INDIVIDUAL METHOD RESULTS:\n")
+            w(SUBRULE_40)
             
             for i, estimate in enumerate(alternative_results.estimates, 1):
                 method_name = estimate.method.value.replace('_', ' ').title()
-                results.append(f"")
-                results.append(f"{i}. {method_name}")
-                results.append(f"   PMI Estimate: {estimate.pmi_days:.1f} days ({estimate.pmi_hours:.1f} hours)")
-                results.append(f"   Confidence: {estimate.confidence_low:.1f} - {estimate.confidence_high:.1f} days")
-                results.append(f"   Reliability: {estimate.reliability_score:.0f}/100")
+                w("\n")
+                w(f"{i}. {method_name}\n")
+                w(METHOD_ESTIMATE_TEMPLATE.format_map({
+                    'pmi_days': estimate.pmi_days,
+                    'pmi_hours': estimate.pmi_hours,
+                    'confidence_low': estimate.confidence_low,
+                    'confidence_high': estimate.confidence_high,
+                    'reliability_score': estimate.reliability_score,
+                }))
             
             # Method agreement
             agreement = alternative_results.method_agreement
-            results.append("")
-            results.append("METHOD AGREEMENT ANALYSIS:")
-            results.append("-" * 40)
-            results.append(f"Agreement Level: {agreement['agreement_level'].upper()}")
-            results.append(f"Coefficient of Variation: {agreement['coefficient_of_variation']:.1f}%")
-            results.append(f"PMI Range: {agreement['min_pmi']:.1f} - {agreement['max_pmi']:.1f} days")
-            results.append(f"Mean PMI: {agreement['mean_pmi']:.1f} days")
-            results.append("")
+            w("\n")
+            w("METHOD AGREEMENT ANALYSIS:\n")
+            w(SUBRULE_40)
+            w(f"Agreement Level: {agreement['agreement_level'].upper()}\n")
+            w(f"Coefficient of Variation: {agreement['coefficient_of_variation']:.1f}%\n")
+            w(f"PMI Range: {agreement['min_pmi']:.1f} - {agreement['max_pmi']:.1f} days\n")
+            w(f"Mean PMI: {agreement['mean_pmi']:.1f} days\n")
+            w("\n")
             
             # Consensus estimate
             consensus = alternative_results.consensus_estimate
-            results.append("CONSENSUS ESTIMATE:")
-            results.append("-" * 40)
-            results.append(f"Method: {consensus['method'].replace('_', ' ').title()}")
-            results.append(f"Consensus PMI: {consensus['pmi_days']:.1f} days ({consensus['pmi_hours']:.1f} hours)")
-            results.append(f"Combined Confidence: {consensus['confidence_low']:.1f} - {consensus['confidence_high']:.1f} days")
-            results.append("")
+            w("CONSENSUS ESTIMATE:\n")
+            w(SUBRULE_40)
+            w(f"Method: {consensus['method'].replace('_', ' ').title()}\n")
+            w(f"Consensus PMI: {consensus['pmi_days']:.1f} days ({consensus['pmi_hours']:.1f} hours)\n")
+            w(f"Combined Confidence: {consensus['confidence_low']:.1f} - {consensus['confidence_high']:.1f} days\n")
+            w("\n")
             
             # Recommendations
             if alternative_results.recommendations:
-                results.append("METHOD RECOMMENDATIONS:")
-                results.append("-" * 40)
+                w("METHOD RECOMMENDATIONS:\n")
+                w(SUBRULE_40)
                 for i, rec in enumerate(alternative_results.recommendations, 1):
-                    results.append(f"{i}. {rec}")
-                results.append("")
+                    w(f"{i}. {rec}\n")
+                w("\n")
         
         # Disclaimer
-        results.append("WARNING: This is an estimate based on available data.")
-        results.append("Results should be interpreted by qualified forensic entomologists.")
+        w("WARNING: This is an estimate based on available data.\n")
+        w("Results should be interpreted by qualified forensic entomologists.")
         
         # Store results for export
+        self._export_cache.clear()
         self.last_results = {
             'pmi_estimate': pmi_estimate,
             'validation_result': validation_result,
@@ -621,8 +782,11 @@ class CalliphoridaysGUI:
             }
         }
         
-        # Display results
-        self.results_text.insert(tk.END, '\n'.join(results))
+        # Display results: the widget is only touched once the text is ready,
+        # and the whole report goes in with a single insert
+        self.results_text.configure(state='normal')
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, buf.getvalue())
         self.results_text.configure(state='disabled')
         
     def export_results(self):
@@ -637,6 +801,7 @@ class CalliphoridaysGUI:
             ("JSON files", "*.json"),
             ("CSV files", "*.csv"), 
             ("Text files", "*.txt"),
+            ("Feather (Arrow IPC)", "*.feather"),
             ("All files", "*.*")
         ]
         
@@ -652,6 +817,9 @@ class CalliphoridaysGUI:
                 if filename.endswith('.pdf'):
                     # Generate professional PDF report
                     try:
+                        # Fail fast, without importing the PDF stack, if it isn't installed
+                        if importlib.util.find_spec('reportlab') is None:
+                            raise ImportError("No module named 'reportlab'")
                         from .report_generator import create_forensic_report
                         
                         pdf_path = create_forensic_report(
@@ -679,6 +847,8 @@ class CalliphoridaysGUI:
                     export_format = 'json'
                 elif filename.endswith('.csv'):
                     export_format = 'csv'
+                elif filename.endswith('.feather'):
+                    export_format = 'feather'
                 else:
                     export_format = 'txt'
                 
@@ -686,14 +856,17 @@ class CalliphoridaysGUI:
                     # Remove extension for exporter
                     base_filename = filename.rsplit('.', 1)[0]
                     
-                    # Export using existing data exporter
-                    exported_file = self.exporter.export_case_data(
-                        self.last_results['pmi_estimate'],
-                        self.last_results['temperature_data'],
-                        self.last_results['case_info'],
-                        base_filename,
-                        export_format
-                    )
+                    # Render each format once per result; repeat exports only write the file
+                    payload = self._export_cache.get(export_format)
+                    if payload is None:
+                        payload = self.exporter.render_case_data(
+                            self.last_results['pmi_estimate'],
+                            self.last_results['temperature_data'],
+                            self.last_results['case_info'],
+                            export_format
+                        )
+                        self._export_cache[export_format] = payload
+                    exported_file = self.exporter.write_export(payload, base_filename, export_format)
                     
                     messagebox.showinfo("Export Complete", f"Results exported to: {exported_file}")
                 
@@ -724,7 +897,10 @@ class CalliphoridaysGUI:
         
     def run(self):
         """Run the GUI application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._executor.shutdown(wait=False)
 
 
 def main():
@@ -2,7 +2,7 @@
 Main CLI entry point with subcommands for single and multi-specimen analysis.
 """
 import click
-from .cli import main as single_specimen
+from .cli import main as single_specimen, main_batch
 from .multi_cli import multi_analyze, create_template
 
 
@@ -16,6 +16,7 @@ def cli():
     
     Commands:
       single     Analyze a single specimen (default)
+      batch      Analyze several single-specimen cases from a JSON file
       multi      Analyze multiple specimens from the same scene
       template   Create a template file for multi-specimen analysis
       gui        Launch graphical user interface
@@ -38,6 +39,7 @@ def gui_command():
 
 # Add subcommands
 cli.add_command(single_specimen, name='single')
+cli.add_command(main_batch, name='batch')
 cli.add_command(multi_analyze, name='multi')
 cli.add_command(create_template, name='template')
 cli.add_command(gui_command, name='gui')
@@ -1,6 +1,10 @@
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 class DevelopmentStage(Enum):
@@ -41,6 +45,14 @@ class ForensicSpecies(Enum):
 # Maintain backward compatibility
 CalliphoridaeSpecies = ForensicSpecies  # Alias for existing code
 
+# Flesh fly species; everything else in ForensicSpecies is a blow fly
+SARCOPHAGIDAE_SPECIES = frozenset({
+    ForensicSpecies.SARCOPHAGA_BULLATA,
+    ForensicSpecies.SARCOPHAGA_CRASSIPALPIS,
+    ForensicSpecies.SARCOPHAGA_HAEMORRHOIDALIS,
+    ForensicSpecies.BOETTCHERISCA_PEREGRINA
+})
+
 
 @dataclass
 class DevelopmentThreshold:
@@ -55,13 +67,7 @@ class DevelopmentThreshold:
     
     def __post_init__(self):
         """Automatically set family based on species"""
-        sarcophagidae_species = {
-            ForensicSpecies.SARCOPHAGA_BULLATA,
-            ForensicSpecies.SARCOPHAGA_CRASSIPALPIS,
-            ForensicSpecies.SARCOPHAGA_HAEMORRHOIDALIS,
-            ForensicSpecies.BOETTCHERISCA_PEREGRINA
-        }
-        if self.species in sarcophagidae_species:
+        if self.species in SARCOPHAGIDAE_SPECIES:
             self.family = InsectFamily.SARCOPHAGIDAE
 
 
@@ -387,6 +393,7 @@ DEVELOPMENT_THRESHOLDS = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_development_threshold(species: ForensicSpecies, stage: DevelopmentStage) -> DevelopmentThreshold:
     """Get development threshold data for a species and stage"""
     try:
@@ -395,108 +402,143 @@ def get_development_threshold(species: ForensicSpecies, stage: DevelopmentStage)
         raise ValueError(f"No development data available for {species.value} at {stage.value}")
 
 
+# Struct-of-arrays view of DEVELOPMENT_THRESHOLDS for vectorised work across
+# species: rows follow SPECIES_IDX, columns STAGE_IDX, NaN where there is no data
+SPECIES_IDX = {species: i for i, species in enumerate(ForensicSpecies)}
+STAGE_IDX = {stage: i for i, stage in enumerate(DevelopmentStage)}
+
+
+def _threshold_table(field: str) -> np.ndarray:
+    """Read-only (species, stage) array of one DevelopmentThreshold field."""
+    table = np.full((len(SPECIES_IDX), len(STAGE_IDX)), np.nan)
+    for species, stages in DEVELOPMENT_THRESHOLDS.items():
+        for stage, threshold in stages.items():
+            value = getattr(threshold, field)
+            if value is not None:
+                table[SPECIES_IDX[species], STAGE_IDX[stage]] = value
+    table.flags.writeable = False
+    return table
+
+
+_MIN_ADD = _threshold_table('min_add')
+_MAX_ADD = _threshold_table('max_add')
+_BASE_TEMP = _threshold_table('base_temp')
+_TYPICAL_LEN = _threshold_table('typical_length_mm')
+
+
+def get_all_thresholds_for_stage(stage: DevelopmentStage) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get (min_add, max_add, base_temp) for every species at a stage, in SPECIES_IDX order"""
+    column = STAGE_IDX[stage]
+    return _MIN_ADD[:, column], _MAX_ADD[:, column], _BASE_TEMP[:, column]
+
+
+# General species information, read-only and shared by every caller
+SPECIES_INFO = MappingProxyType({
+    # CALLIPHORIDAE
+    ForensicSpecies.CHRYSOMYA_RUFIFACIES: {
+        "common_name": "Hairy Maggot Blow Fly",
+        "family": "Calliphoridae",
+        "temp_range": "Warm climates, 15-35°C optimal",
+        "habitat": "Decomposing organic matter, carrion",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.LUCILIA_SERICATA: {
+        "common_name": "Green Bottle Fly",
+        "family": "Calliphoridae", 
+        "temp_range": "Temperate climates, 10-30°C optimal",
+        "habitat": "Fresh carrion, wounds",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.CALLIPHORA_VICINA: {
+        "common_name": "Blue Bottle Fly",
+        "family": "Calliphoridae",
+        "temp_range": "Cool climates, 5-25°C optimal", 
+        "habitat": "Carrion, decomposing organic matter",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.COCHLIOMYIA_MACELLARIA: {
+        "common_name": "Secondary Screwworm",
+        "family": "Calliphoridae",
+        "temp_range": "Warm climates, 18-35°C optimal",
+        "habitat": "Carrion, wounds",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.PHORMIA_REGINA: {
+        "common_name": "Black Blow Fly",
+        "family": "Calliphoridae",
+        "temp_range": "Cool to temperate climates, 5-28°C optimal",
+        "habitat": "Carrion, decomposing organic matter",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.CHRYSOMYA_MEGACEPHALA: {
+        "common_name": "Oriental Latrine Fly",
+        "family": "Calliphoridae",
+        "temp_range": "Tropical climates, 16-36°C optimal",
+        "habitat": "Carrion, feces, decomposing matter",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.LUCILIA_CUPRINA: {
+        "common_name": "Australian Sheep Blowfly",
+        "family": "Calliphoridae",
+        "temp_range": "Warm temperate, 12-32°C optimal",
+        "habitat": "Carrion, wounds, living tissue",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.CALLIPHORA_VOMITORIA: {
+        "common_name": "Blue Bottle Fly",
+        "family": "Calliphoridae",
+        "temp_range": "Cool climates, 4-26°C optimal",
+        "habitat": "Carrion, organic waste",
+        "colonization": "Primary (0-3 days)"
+    },
+    ForensicSpecies.PROTOPHORMIA_TERRAENOVAE: {
+        "common_name": "Northern Blow Fly",
+        "family": "Calliphoridae",
+        "temp_range": "Cold climates, 2-30°C optimal",
+        "habitat": "Carrion, decomposing matter",
+        "colonization": "Primary (0-3 days)"
+    },
+    
+    # SARCOPHAGIDAE  
+    ForensicSpecies.SARCOPHAGA_BULLATA: {
+        "common_name": "Grey Flesh Fly",
+        "family": "Sarcophagidae",
+        "temp_range": "Temperate climates, 12-32°C optimal",
+        "habitat": "Decomposing carrion, organic matter",
+        "colonization": "Secondary (3-25 days)"
+    },
+    ForensicSpecies.SARCOPHAGA_CRASSIPALPIS: {
+        "common_name": "Flesh Fly",
+        "family": "Sarcophagidae",
+        "temp_range": "Temperate climates, 10-30°C optimal",
+        "habitat": "Carrion, decomposing organic matter", 
+        "colonization": "Secondary (3-25 days)"
+    },
+    ForensicSpecies.SARCOPHAGA_HAEMORRHOIDALIS: {
+        "common_name": "Red-tailed Flesh Fly",
+        "family": "Sarcophagidae",
+        "temp_range": "Warm climates, 14-34°C optimal",
+        "habitat": "Carrion, wounds, decomposing matter",
+        "colonization": "Secondary (3-25 days)"
+    },
+    ForensicSpecies.BOETTCHERISCA_PEREGRINA: {
+        "common_name": "Joppa Flesh Fly",
+        "family": "Sarcophagidae", 
+        "temp_range": "Warm climates, 16-35°C optimal",
+        "habitat": "Carrion, organic waste",
+        "colonization": "Secondary (3-25 days)"
+    }
+})
+
+_UNKNOWN_SPECIES_INFO = {
+    "common_name": "Unknown", 
+    "family": "Unknown",
+    "temp_range": "Unknown", 
+    "habitat": "Unknown",
+    "colonization": "Unknown"
+}
+
+
 def get_species_info(species: ForensicSpecies) -> Dict:
     """Get general information about a species"""
-    species_info = {
-        # CALLIPHORIDAE
-        ForensicSpecies.CHRYSOMYA_RUFIFACIES: {
-            "common_name": "Hairy Maggot Blow Fly",
-            "family": "Calliphoridae",
-            "temp_range": "Warm climates, 15-35°C optimal",
-            "habitat": "Decomposing organic matter, carrion",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.LUCILIA_SERICATA: {
-            "common_name": "Green Bottle Fly",
-            "family": "Calliphoridae", 
-            "temp_range": "Temperate climates, 10-30°C optimal",
-            "habitat": "Fresh carrion, wounds",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.CALLIPHORA_VICINA: {
-            "common_name": "Blue Bottle Fly",
-            "family": "Calliphoridae",
-            "temp_range": "Cool climates, 5-25°C optimal", 
-            "habitat": "Carrion, decomposing organic matter",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.COCHLIOMYIA_MACELLARIA: {
-            "common_name": "Secondary Screwworm",
-            "family": "Calliphoridae",
-            "temp_range": "Warm climates, 18-35°C optimal",
-            "habitat": "Carrion, wounds",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.PHORMIA_REGINA: {
-            "common_name": "Black Blow Fly",
-            "family": "Calliphoridae",
-            "temp_range": "Cool to temperate climates, 5-28°C optimal",
-            "habitat": "Carrion, decomposing organic matter",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.CHRYSOMYA_MEGACEPHALA: {
-            "common_name": "Oriental Latrine Fly",
-            "family": "Calliphoridae",
-            "temp_range": "Tropical climates, 16-36°C optimal",
-            "habitat": "Carrion, feces, decomposing matter",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.LUCILIA_CUPRINA: {
-            "common_name": "Australian Sheep Blowfly",
-            "family": "Calliphoridae",
-            "temp_range": "Warm temperate, 12-32°C optimal",
-            "habitat": "Carrion, wounds, living tissue",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.CALLIPHORA_VOMITORIA: {
-            "common_name": "Blue Bottle Fly",
-            "family": "Calliphoridae",
-            "temp_range": "Cool climates, 4-26°C optimal",
-            "habitat": "Carrion, organic waste",
-            "colonization": "Primary (0-3 days)"
-        },
-        ForensicSpecies.PROTOPHORMIA_TERRAENOVAE: {
-            "common_name": "Northern Blow Fly",
-            "family": "Calliphoridae",
-            "temp_range": "Cold climates, 2-30°C optimal",
-            "habitat": "Carrion, decomposing matter",
-            "colonization": "Primary (0-3 days)"
-        },
-        
-        # SARCOPHAGIDAE  
-        ForensicSpecies.SARCOPHAGA_BULLATA: {
-            "common_name": "Grey Flesh Fly",
-            "family": "Sarcophagidae",
-            "temp_range": "Temperate climates, 12-32°C optimal",
-            "habitat": "Decomposing carrion, organic matter",
-            "colonization": "Secondary (3-25 days)"
-        },
-        ForensicSpecies.SARCOPHAGA_CRASSIPALPIS: {
-            "common_name": "Flesh Fly",
-            "family": "Sarcophagidae",
-            "temp_range": "Temperate climates, 10-30°C optimal",
-            "habitat": "Carrion, decomposing organic matter", 
-            "colonization": "Secondary (3-25 days)"
-        },
-        ForensicSpecies.SARCOPHAGA_HAEMORRHOIDALIS: {
-            "common_name": "Red-tailed Flesh Fly",
-            "family": "Sarcophagidae",
-            "temp_range": "Warm climates, 14-34°C optimal",
-            "habitat": "Carrion, wounds, decomposing matter",
-            "colonization": "Secondary (3-25 days)"
-        },
-        ForensicSpecies.BOETTCHERISCA_PEREGRINA: {
-            "common_name": "Joppa Flesh Fly",
-            "family": "Sarcophagidae", 
-            "temp_range": "Warm climates, 16-35°C optimal",
-            "habitat": "Carrion, organic waste",
-            "colonization": "Secondary (3-25 days)"
-        }
-    }
-    return species_info.get(species, {
-        "common_name": "Unknown", 
-        "family": "Unknown",
-        "temp_range": "Unknown", 
-        "habitat": "Unknown",
-        "colonization": "Unknown"
-    })
\ No newline at end of file
+    return SPECIES_INFO.get(species, _UNKNOWN_SPECIES_INFO)
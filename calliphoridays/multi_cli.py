@@ -28,14 +28,17 @@ from .visualization import TerminalVisualizer
 @click.option('--investigator', type=str,
               help='Investigator name')
 @click.option('--export', '-e', type=str,
-              help='Export results to file (JSON format)')
+              help='Export results to file (JSON, or Feather for a .feather path)')
+@click.option('--format', 'export_format', type=click.Choice(['json', 'feather']),
+              help='Export format (default: from the --export extension, else JSON)')
 @click.option('--no-banner', is_flag=True,
               help='Suppress ASCII banner display')
 @click.option('--verbose', '-v', is_flag=True,
               help='Show detailed information')
 def multi_analyze(specimens_file: str, location: str, discovery_date: str,
                  discovery_time: str, ambient_temp: float, case_id: str,
-                 investigator: str, export: str, no_banner: bool, verbose: bool):
+                 investigator: str, export: str, export_format: str, no_banner: bool,
+                 verbose: bool):
     """
     Analyze multiple specimens from the same forensic scene.
     
@@ -111,7 +114,7 @@ def multi_analyze(specimens_file: str, location: str, discovery_date: str,
         
         # Export if requested
         if export:
-            exported_file = analyzer.export_multi_specimen_results(results, export)
+            exported_file = analyzer.export_multi_specimen_results(results, export, export_format)
             click.echo(f"\nResults exported to: {exported_file}")
         
     except Exception as e:
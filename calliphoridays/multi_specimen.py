@@ -481,8 +481,22 @@ class MultiSpecimenAnalyzer:
         )
     
     def export_multi_specimen_results(self, results: MultiSpecimenResult, 
-                                     output_path: str) -> str:
-        """Export multi-specimen results to JSON file."""
+                                     output_path: str, format_type: Optional[str] = None) -> str:
+        """
+        Export multi-specimen results to a JSON or Feather file.
+        
+        The format is format_type if given, otherwise Feather for a '.feather'
+        output path and JSON for anything else. JSON holds the full analysis;
+        Feather (Arrow IPC, needs pyarrow) holds one LZ4-compressed row per
+        specimen result, for loading many cases into tabular tools.
+        """
+        if format_type is None:
+            format_type = 'feather' if output_path.endswith('.feather') else 'json'
+        if format_type == 'feather':
+            return self._export_specimens_feather(results, output_path)
+        if format_type != 'json':
+            raise ValueError(f"Unsupported export format: {format_type}. Supported: ['json', 'feather']")
+        
         # Convert results to serializable format
         export_data = {
             'analysis_timestamp': datetime.now().isoformat(),
@@ -513,4 +527,35 @@ class MultiSpecimenAnalyzer:
         with open(output_path, 'w') as f:
             json.dump(export_data, f, indent=2, ensure_ascii=False)
         
+        return output_path
+    
+    def _export_specimens_feather(self, results: MultiSpecimenResult, output_path: str) -> str:
+        """Export one row per specimen result as an LZ4-compressed Feather file."""
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+        except ImportError:
+            raise ImportError("pyarrow is required for Feather export. Install with: pip install pyarrow")
+        
+        if not output_path.endswith('.feather'):
+            output_path += '.feather'
+        
+        # Gather the rows column by column so the table is built in one go
+        columns = {}
+        for result in results.specimen_results:
+            row = result.specimen.to_dict()
+            row.update(
+                pmi_days=result.pmi_days,
+                pmi_hours=result.pmi_hours,
+                confidence_low=result.confidence_low,
+                confidence_high=result.confidence_high,
+                quality_score=result.quality_score,
+                data_quality=result.data_quality.value,
+                validation_warnings=result.validation_warnings
+            )
+            for name, value in row.items():
+                columns.setdefault(name, []).append(value)
+        
+        feather.write_feather(pa.table(columns), output_path, compression='lz4')
+        
         return output_path
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Professional PDF report generator for forensic entomology analyses.
 """
+import importlib.util
 import os
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -20,14 +21,9 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.backends.backend_agg import FigureCanvasAgg
-    import numpy as np
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# matplotlib is slow to import and nothing here draws charts yet, so only
+# check that it is installed; chart code should import pyplot when it runs
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
 
 from .models import ForensicSpecies, DevelopmentStage, get_species_info
 
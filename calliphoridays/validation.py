@@ -112,6 +112,19 @@ class PMIValidator:
             DevelopmentStage.THIRD_INSTAR: (12, 22),
             DevelopmentStage.PUPA: (8, 15)  # Puparium length
         }
+        
+        # Typical base temperatures (°C); species not listed default to 8°C
+        self.base_temps = {
+            ForensicSpecies.LUCILIA_SERICATA: 8.0,
+            ForensicSpecies.CALLIPHORA_VICINA: 6.0,
+            ForensicSpecies.CHRYSOMYA_RUFIFACIES: 10.0,
+            ForensicSpecies.COCHLIOMYIA_MACELLARIA: 12.0,
+            ForensicSpecies.PHORMIA_REGINA: 5.0,
+            ForensicSpecies.SARCOPHAGA_BULLATA: 9.0,
+            ForensicSpecies.SARCOPHAGA_CRASSIPALPIS: 8.5,
+            ForensicSpecies.SARCOPHAGA_HAEMORRHOIDALIS: 9.5,
+            ForensicSpecies.BOETTCHERISCA_PEREGRINA: 11.0
+        }
     
     def validate_inputs(self, species: ForensicSpecies, stage: DevelopmentStage,
                        location: str, discovery_date: str, discovery_time: Optional[str] = None,
@@ -182,6 +195,25 @@ class PMIValidator:
         
         return self.result
     
+    def validate_all(self, species: ForensicSpecies, stage: DevelopmentStage,
+                     location: str, discovery_date: str, discovery_time: Optional[str],
+                     specimen_length: Optional[float], ambient_temp: Optional[float],
+                     pmi_result: Dict, temperature_data: Dict) -> ValidationResult:
+        """
+        Validate inputs and then calculation results.
+        
+        A sequencing wrapper: it calls validate_inputs and then
+        validate_calculation_results, which still make their own passes and
+        share nothing between them. For callers that have the PMI result
+        before reporting validation.
+        
+        Returns:
+            ValidationResult object
+        """
+        self.validate_inputs(species, stage, location, discovery_date,
+                             discovery_time, specimen_length, ambient_temp)
+        return self.validate_calculation_results(pmi_result, temperature_data, species, stage)
+    
     def _validate_species_stage(self, species: ForensicSpecies, stage: DevelopmentStage):
         """Validate species and development stage combination."""
         species_info = get_species_info(species)
@@ -368,20 +400,7 @@ class PMIValidator:
                 )
         
         # Check if temperature is below base temperature for any species
-        # Base temperatures are typically: Lucilia sericata (8°C), Calliphora vicina (6°C), etc.
-        typical_base_temps = {
-            ForensicSpecies.LUCILIA_SERICATA: 8.0,
-            ForensicSpecies.CALLIPHORA_VICINA: 6.0,
-            ForensicSpecies.CHRYSOMYA_RUFIFACIES: 10.0,
-            ForensicSpecies.COCHLIOMYIA_MACELLARIA: 12.0,
-            ForensicSpecies.PHORMIA_REGINA: 5.0,
-            ForensicSpecies.SARCOPHAGA_BULLATA: 9.0,
-            ForensicSpecies.SARCOPHAGA_CRASSIPALPIS: 8.5,
-            ForensicSpecies.SARCOPHAGA_HAEMORRHOIDALIS: 9.5,
-            ForensicSpecies.BOETTCHERISCA_PEREGRINA: 11.0
-        }
-        
-        base_temp = typical_base_temps.get(species, 8.0)  # Default to 8°C
+        base_temp = self.base_temps.get(species, 8.0)  # Default to 8°C
         if temp <= base_temp:
             self.result.add_issue(
                 ValidationLevel.CRITICAL,
@@ -15,6 +15,7 @@ setup(
         "console_scripts": [
             "calliphoridays=calliphoridays.main_cli:cli",
             "calliphoridays-single=calliphoridays.cli:main",
+            "calliphoridays-batch=calliphoridays.cli:main_batch",
             "calliphoridays-multi=calliphoridays.multi_cli:multi_analyze",
             "calliphoridays-gui=calliphoridays.gui:main",
         ],
@@ -1,16 +1,27 @@
 """
 Basic tests for calliphoridays functionality.
 """
+import csv
+import json
 import pytest
 import sys
 import os
 
+import numpy as np
+
 # Add the parent directory to the path to import calliphoridays
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from calliphoridays.models import CalliphoridaeSpecies, DevelopmentStage, get_development_threshold
+from calliphoridays.models import (
+    CalliphoridaeSpecies, DevelopmentStage, SPECIES_IDX,
+    get_all_thresholds_for_stage, get_development_threshold
+)
 from calliphoridays.pmi_calculator import PMICalculator
+from calliphoridays.alternative_methods import AlternativePMICalculator, PMIMethod
 from calliphoridays.weather import WeatherService
+from calliphoridays.enhanced_validation import EnhancedValidator
+from calliphoridays.export import DataExporter
+from calliphoridays.multi_specimen import MultiSpecimenAnalyzer, SpecimenData
 
 
 class TestModels:
@@ -36,6 +47,17 @@ class TestModels:
         assert threshold.max_add == 108.0
         assert threshold.base_temp == 8.0
 
+    def test_stage_threshold_vectors_match_lookup(self):
+        """Test that the per-stage threshold arrays agree with the single lookup"""
+        stage = DevelopmentStage.PUPA
+        min_add, max_add, base_temp = get_all_thresholds_for_stage(stage)
+
+        for species, row in SPECIES_IDX.items():
+            threshold = get_development_threshold(species, stage)
+            assert min_add[row] == threshold.min_add
+            assert max_add[row] == threshold.max_add
+            assert base_temp[row] == threshold.base_temp
+
 
 class TestPMICalculator:
     """Test the PMI calculation engine"""
@@ -78,6 +100,102 @@ class TestPMICalculator:
             calculator.validate_temperature_data(missing_temp)
 
 
+class TestAlternativeMethods:
+    """Test the alternative PMI methods calculator"""
+
+    def test_batch_matches_single_specimen(self):
+        """Test that the batch calculation agrees with per-specimen results"""
+        calculator = AlternativePMICalculator()
+        species = CalliphoridaeSpecies.LUCILIA_SERICATA
+        stage = DevelopmentStage.THIRD_INSTAR
+        temps = np.array([7.0, 12.0, 20.0, 30.0])
+        lengths = np.array([10.0, np.nan, 17.0, 25.0])
+
+        batch = calculator.calculate_all_methods_batch(species, stage, temps, lengths)
+        assert batch.shape == (len(temps), len(PMIMethod))
+
+        for row, (temp, length) in enumerate(zip(temps, lengths)):
+            for column, method in enumerate(PMIMethod):
+                try:
+                    estimate = calculator._calculate_method(
+                        method, species, stage, {'avg_temp': temp},
+                        None if np.isnan(length) else length
+                    )
+                except ValueError:
+                    assert np.isnan(batch[row, column])
+                else:
+                    assert batch[row, column] == pytest.approx(estimate.pmi_days)
+
+    def test_calculate_all_methods_is_memoized(self):
+        """Test that repeated comparative calculations reuse the cached result"""
+        calculator = AlternativePMICalculator()
+        species = CalliphoridaeSpecies.LUCILIA_SERICATA
+        stage = DevelopmentStage.THIRD_INSTAR
+
+        first = calculator.calculate_all_methods(species, stage, {'avg_temp': 22.0}, 15.0)
+        first.estimates.pop()
+        first.consensus_estimate['pmi_days'] = 0.0
+        second = calculator.calculate_all_methods(species, stage, {'avg_temp': 22.0}, 15.0,
+                                                  parallel=True)
+        assert len(calculator._results_cache) == 1
+        assert len(second.estimates) == len(PMIMethod)
+        assert second.consensus_estimate['pmi_days'] > 0
+
+        calculator.calculate_all_methods(species, stage, {'avg_temp': 23.0}, 15.0)
+        assert len(calculator._results_cache) == 2
+
+    def test_parallel_matches_serial(self):
+        """Test that the thread-pool mode gives the same estimates"""
+        calculator = AlternativePMICalculator()
+        species = CalliphoridaeSpecies.LUCILIA_SERICATA
+        stage = DevelopmentStage.THIRD_INSTAR
+
+        serial = calculator.calculate_all_methods(species, stage, {'avg_temp': 21.0}, 12.0)
+        parallel = calculator.calculate_all_methods(species, stage, {'avg_temp': 21.0}, 12.0,
+                                                    parallel=True)
+
+        assert [e.method for e in parallel.estimates] == [e.method for e in serial.estimates]
+        assert parallel.consensus_estimate == pytest.approx(serial.consensus_estimate)
+
+
+class TestEnhancedValidation:
+    """Test the enhanced validation framework"""
+
+    def test_monte_carlo_simulation(self):
+        """Test the Monte Carlo uncertainty estimate"""
+        validator = EnhancedValidator()
+
+        result = validator.monte_carlo_simulation(
+            CalliphoridaeSpecies.LUCILIA_SERICATA,
+            DevelopmentStage.THIRD_INSTAR,
+            {'avg_temp': 22.0},
+            specimen_length=15.0,
+            iterations=5000
+        )
+
+        assert 0 < result.iterations_used <= 5000
+        assert isinstance(result.distribution, np.ndarray)
+        assert len(result.distribution) == result.iterations_used
+        assert result.mean_pmi == pytest.approx(result.distribution.mean())
+        assert result.std_pmi > 0
+        low, high = result.confidence_intervals[95]
+        assert low < result.mean_pmi < high
+
+    def test_seeded_monte_carlo_ignores_numba(self, monkeypatch):
+        """Test that a seed gives the same intervals with or without Numba"""
+        results = []
+        for available in (True, False):
+            monkeypatch.setattr('calliphoridays.enhanced_validation.NUMBA_AVAILABLE', available)
+            results.append(EnhancedValidator(seed=7).monte_carlo_simulation(
+                CalliphoridaeSpecies.LUCILIA_SERICATA,
+                DevelopmentStage.THIRD_INSTAR,
+                {'avg_temp': 22.0},
+                iterations=2000
+            ))
+
+        assert results[0].confidence_intervals == results[1].confidence_intervals
+
+
 class TestWeatherService:
     """Test the weather service"""
     
@@ -109,6 +227,144 @@ class TestWeatherService:
             invalid_data = {'min_temp': 15.0, 'max_temp': 25.0}
             weather_service.validate_weather_data(invalid_data)
 
+    def test_weather_cache_reuses_response(self, tmp_path, monkeypatch):
+        """Test that repeated lookups are served from the on-disk cache"""
+        from calliphoridays import cli
+
+        class CountingService:
+            calls = 0
+
+            def get_temperature_data(self, location, discovery_date, discovery_time=None):
+                self.calls += 1
+                return {'avg_temp': 21.5, 'source': 'test'}
+
+        monkeypatch.setattr(cli, 'WEATHER_CACHE_PATH', str(tmp_path / 'weather'))
+        service = CountingService()
+
+        first = cli.get_cached_temperature_data(service, "Miami, FL", "2024-07-01")
+        second = cli.get_cached_temperature_data(service, "Miami, FL", "2024-07-01")
+
+        assert first == second == {'avg_temp': 21.5, 'source': 'test'}
+        assert service.calls == 1
+
+    def test_weather_cache_skips_fallback_estimates(self, tmp_path, monkeypatch):
+        """Test that estimated temperatures are not cached, so the API is retried"""
+        from calliphoridays import cli
+
+        class EstimatingService:
+            calls = 0
+
+            def get_temperature_data(self, location, discovery_date, discovery_time=None):
+                self.calls += 1
+                return {'avg_temp': 18.0, 'source': 'Estimated (seasonal average)'}
+
+        monkeypatch.setattr(cli, 'WEATHER_CACHE_PATH', str(tmp_path / 'weather'))
+        service = EstimatingService()
+
+        cli.get_cached_temperature_data(service, "Miami, FL", "2024-07-01")
+        cli.get_cached_temperature_data(service, "Miami, FL", "2024-07-01")
+
+        assert service.calls == 2
+
+
+class TestDataExporter:
+    """Test the case data exporter"""
+
+    def test_batch_export_writes_one_record_per_case(self, tmp_path):
+        """Test that batch export writes one JSON Lines record or CSV row per case"""
+        calculator = PMICalculator()
+        exporter = DataExporter()
+        cases = []
+        for avg_temp in (18.0, 24.0):
+            temperature_data = {'avg_temp': avg_temp}
+            pmi_result = calculator.calculate_pmi(
+                CalliphoridaeSpecies.LUCILIA_SERICATA, DevelopmentStage.THIRD_INSTAR, temperature_data
+            )
+            cases.append((pmi_result, temperature_data, {'case_id': f"CASE_{avg_temp:.0f}"}))
+
+        output = exporter.export_batch_cases(cases, str(tmp_path / 'cases'))
+
+        with open(output) as f:
+            records = [json.loads(line) for line in f]
+        assert output.endswith('.jsonl')
+        assert [r['case_metadata']['case_id'] for r in records] == ['CASE_18', 'CASE_24']
+        assert records[0]['pmi_calculations']['estimated_pmi_days'] == pytest.approx(cases[0][0]['pmi_days'])
+
+        output = exporter.export_batch_cases(cases, str(tmp_path / 'cases'), format_type='csv')
+
+        with open(output, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['case_id'] for row in rows] == ['CASE_18', 'CASE_24']
+        assert float(rows[1]['pmi_days']) == pytest.approx(cases[1][0]['pmi_days'])
+
+    def test_batch_csv_matches_without_pyarrow(self, tmp_path, monkeypatch):
+        """Test that the pyarrow and csv-module CSV writers give the same rows"""
+        pytest.importorskip('pyarrow')
+        calculator = PMICalculator()
+        exporter = DataExporter()
+        cases = []
+        for avg_temp in (18.0, 24.0):
+            temperature_data = {'avg_temp': avg_temp}
+            pmi_result = calculator.calculate_pmi(
+                CalliphoridaeSpecies.LUCILIA_SERICATA, DevelopmentStage.THIRD_INSTAR, temperature_data
+            )
+            cases.append((pmi_result, temperature_data, {'case_id': f"CASE_{avg_temp:.0f}"}))
+        stamp = ('2024-06-01T12:00:00', '20240601_120000')
+
+        outputs = []
+        for available in (True, False):
+            monkeypatch.setattr('calliphoridays.export.PYARROW_AVAILABLE', available)
+            outputs.append(exporter._export_batch_csv(cases, str(tmp_path / f"cases_{available}"), stamp))
+
+        rows = []
+        for output in outputs:
+            with open(output, newline='') as f:
+                rows.append(list(csv.DictReader(f)))
+        assert rows[0] == rows[1]
+
+    def test_json_export_handles_numpy_values(self):
+        """Test that NumPy scalars and arrays in results export as plain JSON"""
+        calculator = PMICalculator()
+        temperature_data = {'avg_temp': np.float32(21.5), 'date_range': np.array([1, 2])}
+        pmi_result = calculator.calculate_pmi(
+            CalliphoridaeSpecies.LUCILIA_SERICATA, DevelopmentStage.THIRD_INSTAR, {'avg_temp': 21.5}
+        )
+        pmi_result['pmi_days'] = np.float64(pmi_result['pmi_days'])
+
+        payload = DataExporter().render_case_data(pmi_result, temperature_data, {'case_id': 'NP'})
+        record = json.loads(payload)
+
+        assert record['temperature_data']['avg_temp_celsius'] == 21.5
+        assert record['temperature_data']['date_range'] == [1, 2]
+        assert record['pmi_calculations']['estimated_pmi_days'] == pytest.approx(pmi_result['pmi_days'])
+
+    def test_bulk_temperature_formatting(self):
+        """Test that missing temperatures are reported as N/A"""
+        formatted = DataExporter()._format_temps_bulk([None, 12.34, np.nan, 3])
+        assert formatted.tolist() == ['N/A', '12.3', 'N/A', '3.0']
+
+
+class TestMultiSpecimen:
+    """Test multi-specimen analysis export"""
+
+    def test_feather_export_writes_one_row_per_specimen(self, tmp_path):
+        """Test that a .feather export path writes one row per specimen result"""
+        feather = pytest.importorskip('pyarrow.feather')
+        analyzer = MultiSpecimenAnalyzer()
+        specimens = [
+            SpecimenData('S1', CalliphoridaeSpecies.LUCILIA_SERICATA, DevelopmentStage.THIRD_INSTAR),
+            SpecimenData('S2', CalliphoridaeSpecies.CALLIPHORA_VICINA, DevelopmentStage.SECOND_INSTAR),
+        ]
+        results = analyzer.analyze_specimens(specimens, {'avg_temp': 22.0}, {'case_id': 'MULTI'})
+
+        output = analyzer.export_multi_specimen_results(results, str(tmp_path / 'scene.feather'))
+
+        table = feather.read_table(output)
+        assert table.column('specimen_id').to_pylist() == ['S1', 'S2']
+        assert table.column('pmi_days').to_pylist() == pytest.approx(
+            [r.pmi_days for r in results.specimen_results]
+        )
+
 
 def test_integration():
     """Test integration between components"""